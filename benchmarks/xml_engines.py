@@ -0,0 +1,59 @@
+"""Compare the etree and lxml engines of XmlFileService.
+
+    PYTHONPATH=src python benchmarks/xml_engines.py --records 100000 --fields 20 --noise 5
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from file_ripper import FieldDefinition, FileDefinition, rip_file, file_constants as fc
+
+
+def write_xml_file(file_name, records, fields, noise):
+    record = "<record>" + "".join(f"<field{i}>value {i}</field{i}>" for i in range(fields)) + "</record>"
+    other = "<audit><user>vendor</user><changed>2020-01-01</changed></audit>" * noise
+    with open(file_name, "w") as f:
+        f.write("<records>")
+        for _ in range(records):
+            f.write(record)
+            f.write(other)
+        f.write("</records>")
+
+
+def time_engine(file_name, file_definition, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with open(file_name, "rb") as file:
+            file_instance = rip_file(file, file_definition)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(file_instance)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=50000)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--noise", type=int, default=0, help="non record elements written after every record")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    field_definitions = [FieldDefinition(f"field{i}", fc.XML) for i in range(args.fields)]
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "records.xml")
+        write_xml_file(file_name, args.records, args.fields, args.noise)
+        print(f"{os.path.getsize(file_name) / 1_000_000:.1f} MB, {args.records} records of {args.fields} fields")
+        for engine in fc.XML_ENGINES:
+            file_definition = FileDefinition(fc.XML, field_definitions, record_xml_element="record", xml_engine=engine)
+            try:
+                elapsed, rows = time_engine(file_name, file_definition, args.repeat)
+            except ImportError as ex:
+                print(f"{engine:>6}: skipped, {ex}")
+                continue
+            print(f"{engine:>6}: {elapsed:.3f}s {rows / elapsed:,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,8 +14,18 @@ with open('README.md', 'r') as fh:
         package_dir={'': 'src'},
         install_requires=[
             "click",
-            "dataclasses_json",
+            "dataclasses_json>=0.5.7",
         ],
+        extras_require={
+            "numpy": ["numpy"],
+            "pandas": ["numpy", "pandas"],
+            "watch": ["watchdog"],
+            "lxml": ["lxml"],
+            "parquet": ["pyarrow"],
+            "json": ["orjson"],
+            "yaml": ["PyYAML"],
+            "toml": ["tomli; python_version < '3.11'"],
+        },
         entry_points={
             "console_scripts": [
                 "file-ripper = file_ripper.cli:main"
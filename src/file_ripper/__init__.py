@@ -1,15 +1,43 @@
 import file_ripper.fileconstants as file_constants
 from file_ripper.filedefinition import FileDefinition, FieldDefinition
-from file_ripper.fileripper import rip_file, rip_files, find_and_rip_files
+from file_ripper.filefilters import FieldEquals, FieldIn, FieldPrefix, RecordCode
+from file_ripper.fileripper import (
+    rip_file,
+    rip_file_iter,
+    rip_file_batches,
+    rip_file_pipeline,
+    pipe_file,
+    rip_file_columnar,
+    rip_mapped_file,
+    rip_files,
+    find_and_rip_files,
+    store_file,
+    find_and_store_files,
+)
+from file_ripper.fileserializer import file_instance_to_json, write_file_instance_json
 from file_ripper.commands import run_file_ripper_once, run_file_ripper_continuously
 
 __all__ = [
     "file_constants",
     "FileDefinition",
     "FieldDefinition",
+    "FieldEquals",
+    "FieldIn",
+    "FieldPrefix",
+    "RecordCode",
     "rip_files",
     "rip_file",
+    "rip_file_iter",
+    "rip_file_batches",
+    "rip_file_pipeline",
+    "pipe_file",
+    "rip_file_columnar",
+    "rip_mapped_file",
     "find_and_rip_files",
+    "store_file",
+    "find_and_store_files",
+    "file_instance_to_json",
+    "write_file_instance_json",
     "run_file_ripper_continuously",
     "run_file_ripper_once",
 ]
@@ -4,6 +4,8 @@ import sys
 import click
 
 from exit_codes import ExitCode
+from .fileconstants import OUTPUT_FORMATS
+from .fileloader import DEFINITION_FORMATS
 from .commands import run_file_ripper_once, run_file_ripper_continuously
 
 
@@ -13,15 +15,47 @@ def cli():
 
 
 @cli.command("exec")
-@click.argument("definitions_file", type=click.File("rt"))
-@click.option("-fmt", "--format", "definitions_format", type=str, default="json")
+@click.argument("definitions_file", type=click.Path(exists=True, dir_okay=False))
+@click.option("-fmt", "--format", "definitions_format", type=click.Choice(DEFINITION_FORMATS), default=None)
 @click.option("-ro", "--run-once", "run_once", is_flag=True, default=False)
 @click.option("-ti", "--time-interval", "time_interval", type=int, default=5)
-def handle_exec(definitions_file, definitions_format, run_once, time_interval):
+@click.option("-w", "--workers", "workers", type=click.IntRange(min=1), default=None)
+@click.option("-mc", "--max-concurrency", "max_concurrency", type=click.IntRange(min=1), default=4)
+@click.option("-wa", "--watch", "watch", is_flag=True, default=False)
+@click.option("-ss", "--settle-seconds", "settle_seconds", type=click.FloatRange(min=0), default=2.0)
+@click.option(
+    "-of", "--output-format", "output_format", type=click.Choice(OUTPUT_FORMATS, case_sensitive=False), default=None
+)
+@click.option("-op", "--output-path", "output_path", type=click.Path(), default=None)
+def handle_exec(
+        definitions_file,
+        definitions_format,
+        run_once,
+        time_interval,
+        workers,
+        max_concurrency,
+        watch,
+        settle_seconds,
+        output_format,
+        output_path,
+):
+    if output_format and not output_path:
+        raise click.UsageError("--output-path is required with --output-format")
+
     if run_once:
-        run_file_ripper_once(definitions_file, definitions_format)
+        run_file_ripper_once(definitions_file, definitions_format, workers, max_concurrency, output_format, output_path)
     else:
-        run_file_ripper_continuously(definitions_file, definitions_format, time_interval)
+        run_file_ripper_continuously(
+            definitions_file,
+            definitions_format,
+            time_interval,
+            workers,
+            max_concurrency,
+            watch,
+            settle_seconds,
+            output_format,
+            output_path,
+        )
     return ExitCode.OK
 
 
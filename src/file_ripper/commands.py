@@ -1,11 +1,48 @@
-from time import sleep
+import asyncio
 
+from file_ripper.filedaemon import FileRipperDaemon
+from file_ripper.fileregistry import DefinitionRegistry
 
-def run_file_ripper_once(definitions_file, definitions_format):
-    print("running file ripper")
 
+def create_definition_registry(definitions_file, definitions_format) -> DefinitionRegistry:
+    definitions_path = getattr(definitions_file, "name", definitions_file)
+    return DefinitionRegistry(definitions_path, definitions_format)
 
-def run_file_ripper_continuously(definitions_file, definitions_format, interval_minutes=5):
-    while True:
-        run_file_ripper_once(definitions_file, definitions_format)
-        sleep(60 * interval_minutes)
+
+def run_file_ripper_once(
+        definitions_file, definitions_format, workers=None, max_concurrency=4, output_format=None, output_path=None
+):
+    file_definitions = create_definition_registry(definitions_file, definitions_format).load()
+    daemon = FileRipperDaemon(
+        file_definitions,
+        max_concurrency=max_concurrency,
+        workers=workers,
+        output_format=output_format,
+        output_path=output_path,
+    )
+    asyncio.run(daemon.run_once())
+
+
+def run_file_ripper_continuously(
+        definitions_file,
+        definitions_format,
+        interval_minutes=5,
+        workers=None,
+        max_concurrency=4,
+        watch=False,
+        settle_seconds=2.0,
+        output_format=None,
+        output_path=None,
+):
+    registry = create_definition_registry(definitions_file, definitions_format)
+    daemon = FileRipperDaemon(
+        registry,
+        interval_minutes,
+        max_concurrency,
+        workers,
+        watch,
+        settle_seconds,
+        output_format=output_format,
+        output_path=output_path,
+    )
+    asyncio.run(daemon.run())
@@ -14,3 +14,42 @@ XML_NODE_NAME = "xml_node_name"
 INPUT_DIRECTORY = "input_directory"
 COMPLETED_DIRECTORY = "completed_directory"
 POSITION_IN_ROW = "position_in_row"
+DATA_TYPE = "data_type"
+DATA_FORMAT = "data_format"
+STRING = "STRING"
+INT = "INT"
+DECIMAL = "DECIMAL"
+DATE = "DATE"
+BOOL = "BOOL"
+DATA_TYPES = (STRING, INT, DECIMAL, DATE, BOOL)
+RECORD_LENGTH = "record_length"
+TIME_INTERVAL = "time_interval"
+LEDGER_FILE = "ledger_file"
+LEDGER_HASH = "ledger_hash"
+XML_ENGINE = "xml_engine"
+ETREE = "ETREE"
+LXML = "LXML"
+XML_ENGINES = (ETREE, LXML)
+DELIMITED_ENGINE = "delimited_engine"
+SPLIT = "SPLIT"
+CSV = "CSV"
+DELIMITED_ENGINES = (SPLIT, CSV)
+QUOTE_CHAR = "quote_char"
+ESCAPE_CHAR = "escape_char"
+RECORD_LAYOUTS = "record_layouts"
+RECORD_CODE_POSITION = "record_code_position"
+RECORD_CODE_LENGTH = "record_code_length"
+OUTPUT_FORMAT = "output_format"
+OUTPUT_PATH = "output_path"
+OUTPUT_TABLE = "output_table"
+JSONL = "JSONL"
+PARQUET = "PARQUET"
+SQLITE = "SQLITE"
+OUTPUT_FORMATS = (JSONL, CSV, PARQUET, SQLITE)
+ERROR_POLICY = "error_policy"
+QUARANTINE_PATH = "quarantine_path"
+FAIL_FAST = "FAIL_FAST"
+SKIP = "SKIP"
+QUARANTINE = "QUARANTINE"
+ERROR_POLICIES = (FAIL_FAST, SKIP, QUARANTINE)
+DEFAULT_BATCH_SIZE = 10000
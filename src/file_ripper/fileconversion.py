@@ -0,0 +1,124 @@
+import importlib
+from datetime import datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, List
+
+import file_ripper.fileconstants as fc
+
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+
+ISO_DATE_FORMAT = "%Y-%m-%d"
+TRUE_VALUES = ("true", "t", "yes", "y", "1")
+
+
+def import_optional(name: str, extra: str = None):
+    try:
+        return importlib.import_module(name)
+    except ImportError as ex:
+        raise ImportError(f"{name} is required, install it with pip install file-ripper[{extra or name}]") from ex
+
+
+def convert_columns(columns: Dict[str, List[str]], field_definitions: List) -> Dict[str, list]:
+    types = {field_def.field_name: field_def for field_def in field_definitions}
+    return {
+        field_name: convert_column(values, types[field_name]) if field_name in types else values
+        for field_name, values in columns.items()
+    }
+
+
+def convert_column(values: List[str], field_definition) -> list:
+    # a blank value is null for every typed column: None here, NaN or NaT in to_numpy and to_dataframe
+    data_type = field_definition.data_type
+    if data_type == fc.INT:
+        convert = int
+    elif data_type == fc.DECIMAL:
+        convert = Decimal
+    elif data_type == fc.DATE:
+        date_format = field_definition.data_format or ISO_DATE_FORMAT
+
+        def convert(value):
+            return datetime.strptime(value.strip(), date_format).date()
+    elif data_type == fc.BOOL:
+        def convert(value):
+            return value.strip().lower() in TRUE_VALUES
+    else:
+        return values
+    return [None if is_blank(value) else convert(value) for value in values]
+
+
+def columns_to_numpy(columns: Dict[str, List[str]], field_definitions: List) -> Dict[str, "numpy.ndarray"]:
+    types = {field_def.field_name: field_def for field_def in field_definitions}
+    return {
+        field_name: column_to_numpy(values, types[field_name]) if field_name in types else object_array(values)
+        for field_name, values in columns.items()
+    }
+
+
+def column_to_numpy(values: List[str], field_definition) -> "numpy.ndarray":
+    numpy = import_optional("numpy")
+    data_type = field_definition.data_type
+    if data_type not in (fc.INT, fc.DECIMAL, fc.DATE, fc.BOOL):
+        return object_array(values)
+
+    strings = numpy.char.strip(numpy.array([value or "" for value in values], dtype=str))
+    blanks = strings == ""
+    if data_type == fc.INT:
+        if not blanks.any():
+            return strings.astype(numpy.int64)
+        # int64 has no null, so a column with blanks is float64 with NaN, the same as pandas
+        array = numpy.full(len(strings), numpy.nan)
+        array[~blanks] = strings[~blanks].astype(numpy.int64)
+        return array
+    if data_type == fc.DECIMAL:
+        return numpy.where(blanks, "nan", strings).astype(numpy.float64)
+    if data_type == fc.DATE:
+        date_format = field_definition.data_format or ISO_DATE_FORMAT
+        if date_format == ISO_DATE_FORMAT:
+            return strings.astype("datetime64[D]")
+        try:
+            pandas = import_optional("pandas")
+        except ImportError:
+            return numpy.array(convert_column(values, field_definition), dtype="datetime64[D]")
+        return pandas.to_datetime(pandas.Series(blanks_to_none(values), dtype=object), format=date_format).to_numpy()
+
+    flags = numpy.isin(numpy.char.lower(strings), TRUE_VALUES)
+    if not blanks.any():
+        return flags
+    # bool has no null either, so a column with blanks keeps None in an object array
+    flags = flags.astype(object)
+    flags[blanks] = None
+    return flags
+
+
+def columns_to_dataframe(columns: Dict[str, List[str]], field_definitions: List) -> "pandas.DataFrame":
+    pandas = import_optional("pandas")
+    types = {field_def.field_name: field_def for field_def in field_definitions}
+    data = {}
+    for field_name, values in columns.items():
+        field_definition = types.get(field_name)
+        if field_definition is None:
+            data[field_name] = object_array(values)
+        elif field_definition.data_type == fc.DATE:
+            date_format = field_definition.data_format or ISO_DATE_FORMAT
+            dates = pandas.Series(blanks_to_none(values), dtype=object)
+            data[field_name] = pandas.to_datetime(dates, format=date_format)
+        else:
+            data[field_name] = column_to_numpy(values, field_definition)
+    return pandas.DataFrame(data)
+
+
+def is_blank(value) -> bool:
+    return value is None or not value.strip()
+
+
+def blanks_to_none(values: List[str]) -> list:
+    return [None if is_blank(value) else value.strip() for value in values]
+
+
+def object_array(values: list) -> "numpy.ndarray":
+    numpy = import_optional("numpy")
+    array = numpy.empty(len(values), dtype=object)
+    array[:] = values
+    return array
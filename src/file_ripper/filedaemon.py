@@ -0,0 +1,221 @@
+import asyncio
+import logging
+import signal
+from contextlib import asynccontextmanager
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set, Union
+
+from file_ripper.filedefinition import FileDefinition
+from file_ripper.fileregistry import DefinitionRegistry
+from file_ripper.filerepository import FileRepository, create_file_repository
+from file_ripper.fileripper import find_and_rip_files, find_and_store_files, rip_new_file, validate_file_definition
+from file_ripper.filewatcher import DirectoryWatcher
+
+
+class FileRipperDaemon:
+    def __init__(
+            self,
+            file_definitions: Union[List[FileDefinition], DefinitionRegistry],
+            interval_minutes: float = 5,
+            max_concurrency: int = 4,
+            workers: int = None,
+            watch: bool = False,
+            settle_seconds: float = 2.0,
+            poll_seconds: float = 1.0,
+            reload_seconds: float = 5.0,
+            output_format: str = None,
+            output_path: str = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than zero")
+
+        if isinstance(file_definitions, DefinitionRegistry):
+            self.registry = file_definitions
+            self.file_definitions = file_definitions.load()
+        else:
+            self.registry = None
+            self.file_definitions = file_definitions
+        self.interval_minutes = interval_minutes
+        self.max_concurrency = max_concurrency
+        self.workers = workers
+        self.watch = watch
+        self.settle_seconds = settle_seconds
+        self.poll_seconds = poll_seconds
+        self.reload_seconds = reload_seconds
+        self.output_format = output_format
+        self.output_path = output_path
+        self._stopping = None
+        self._semaphore = None
+        self._thread_pool = None
+        self._process_pool = None
+        self._in_flight: Dict[int, Set[Future]] = {}
+
+    def stop(self):
+        if self._stopping is not None:
+            self._stopping.set()
+
+    async def run(self):
+        async with self._running():
+            loop = asyncio.get_running_loop()
+            self._add_signal_handlers(loop)
+            schedule = self._watch if self.watch else self._schedule
+            schedules = {}
+            try:
+                self._update_schedules(schedules, schedule)
+                while self.registry is not None and not await self._wait_for_stop(self.reload_seconds):
+                    self._reload()
+                    self._update_schedules(schedules, schedule)
+                await asyncio.gather(*(task for _, task in schedules.values()))
+            finally:
+                self._remove_signal_handlers(loop)
+
+    async def run_once(self):
+        async with self._running():
+            await asyncio.gather(*(self._rip(file_definition) for file_definition in self.file_definitions))
+
+    def _reload(self):
+        try:
+            self.file_definitions = self.registry.load()
+        except Exception as ex:
+            logging.exception(f"Exception reloading {self.registry.definitions_path}", exc_info=ex)
+
+    def _update_schedules(self, schedules: dict, schedule):
+        # the registry hands back the same FileDefinition for a definition that did not change, so only
+        # added definitions get a new schedule and only removed ones are cancelled
+        current = {id(file_definition): file_definition for file_definition in self.file_definitions}
+        cancelled_rips = set()
+        for key in [key for key in schedules if key not in current]:
+            _, task = schedules.pop(key)
+            task.cancel()
+            cancelled_rips.update(rip for rip in self._in_flight.pop(key, ()) if not rip.done())
+        for key, file_definition in current.items():
+            if key not in schedules:
+                task = asyncio.ensure_future(self._schedule_after(cancelled_rips, schedule, file_definition))
+                schedules[key] = (file_definition, task)
+
+    async def _schedule_after(self, rips: Set[Future], schedule, file_definition: FileDefinition):
+        # cancelling a schedule cannot stop a rip already running on the thread pool, so an edited definition
+        # only starts once the rips of the definitions it replaced have finished
+        if rips:
+            await asyncio.wait([asyncio.wrap_future(rip) for rip in rips])
+        await schedule(file_definition)
+
+    async def _run_in_thread(self, file_definition: FileDefinition, function: Callable, *args):
+        rip = self._thread_pool.submit(function, *args)
+        key = id(file_definition)
+        self._in_flight[key] = {running for running in self._in_flight.get(key, ()) if not running.done()} | {rip}
+        return await asyncio.wrap_future(rip)
+
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self._stopping.is_set()
+
+    async def _schedule(self, file_definition: FileDefinition):
+        interval_seconds = 60 * (file_definition.time_interval or self.interval_minutes)
+        while not self._stopping.is_set():
+            await self._rip(file_definition)
+            await self._wait_for_stop(interval_seconds)
+
+    async def _watch(self, file_definition: FileDefinition):
+        try:
+            validate_file_definition(file_definition)
+        except Exception as ex:
+            logging.exception(f"Exception watching files matching {file_definition.file_mask}", exc_info=ex)
+            return
+
+        watcher = DirectoryWatcher(
+            file_definition,
+            settle_seconds=self.settle_seconds,
+            poll_seconds=self.poll_seconds,
+            rescan_seconds=60 * (file_definition.time_interval or self.interval_minutes),
+        )
+        rips = set()
+        async for file_name in watcher.watch(self._stopping):
+            rip = asyncio.ensure_future(self._rip_watched_file(watcher, file_definition, file_name))
+            rips.add(rip)
+            rip.add_done_callback(rips.discard)
+
+        if rips:
+            await asyncio.gather(*rips)
+
+    async def _rip_watched_file(self, watcher: DirectoryWatcher, file_definition: FileDefinition, file_name: str):
+        ripped = False
+        try:
+            ripped = await self._rip_file(file_definition, file_name)
+        finally:
+            watcher.rip_finished(file_name, ripped)
+
+    async def _rip_file(self, file_definition: FileDefinition, file_name: str) -> bool:
+        async with self._semaphore:
+            try:
+                file_instance = await self._run_in_thread(
+                    file_definition,
+                    rip_new_file,
+                    file_name,
+                    file_definition,
+                    self._process_pool,
+                    self._create_file_repository(file_definition),
+                )
+                if file_instance is not None:
+                    logging.info(f"ripped {file_name}")
+                return True
+            except Exception as ex:
+                logging.exception(f"Exception ripping {file_name}", exc_info=ex)
+                return False
+
+    async def _rip(self, file_definition: FileDefinition):
+        async with self._semaphore:
+            if self._stopping.is_set():
+                return
+            try:
+                file_instances = await self._run_in_thread(
+                    file_definition, self._find_and_rip_files, file_definition, self._process_pool
+                )
+                logging.info(f"ripped {len(file_instances)} files matching {file_definition.file_mask}")
+            except Exception as ex:
+                logging.exception(f"Exception ripping files matching {file_definition.file_mask}", exc_info=ex)
+
+    def _find_and_rip_files(self, file_definition: FileDefinition, executor: Executor):
+        repository = self._create_file_repository(file_definition)
+        if repository is not None:
+            return find_and_store_files(file_definition, repository, executor=executor)
+        return find_and_rip_files(file_definition, executor=executor)
+
+    def _create_file_repository(self, file_definition: FileDefinition) -> Optional[FileRepository]:
+        if not (file_definition.output_format or self.output_format):
+            return None
+        return create_file_repository(file_definition, self.output_format, self.output_path)
+
+    @asynccontextmanager
+    async def _running(self):
+        self._stopping = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._thread_pool = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        if self.workers and self.workers > 1:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        try:
+            yield self
+        finally:
+            self._thread_pool.shutdown(wait=True)
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=True)
+            self._thread_pool = self._process_pool = None
+
+    def _add_signal_handlers(self, loop):
+        for signal_number in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(signal_number, self.stop)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+    @staticmethod
+    def _remove_signal_handlers(loop):
+        for signal_number in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.remove_signal_handler(signal_number)
+            except (NotImplementedError, RuntimeError):
+                pass
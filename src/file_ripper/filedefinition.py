@@ -1,10 +1,14 @@
+import copy
 from dataclasses import dataclass, field
-from typing import List
+from functools import lru_cache
+from typing import Dict, List
 
-from dataclasses_json import dataclass_json, LetterCase
-from dataclasses_json.stringcase import snakecase
+from dataclasses_json import dataclass_json, LetterCase, stringcase
 
 import file_ripper.fileconstants as fc
+from file_ripper.filelayout import DelimitedLayout, FixedWidthLayout, MultiRecordLayout, XmlLayout
+
+snakecase = lru_cache(maxsize=None)(stringcase.snakecase)
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
@@ -18,6 +22,8 @@ class FieldDefinition:
     position_in_row: int
     field_definitions: List['FieldDefinition']
     delimiter: str
+    data_type: str
+    data_format: str
 
     def __init__(
             self,
@@ -29,8 +35,10 @@ class FieldDefinition:
             position_in_row: int = None,
             field_definitions: List['FieldDefinition'] = None,
             delimiter: str = None,
+            data_type: str = "",
+            data_format: str = "",
     ):
-        self._validate(file_type, field_name, start_position, field_length, position_in_row)
+        self._validate(file_type, field_name, start_position, field_length, position_in_row, data_type)
         self.file_type = file_type
         self.field_name = field_name
         self.start_position = start_position
@@ -39,6 +47,8 @@ class FieldDefinition:
         self.field_definitions = field_definitions if field_definitions else []
         self.xml_node_name = xml_node_name if xml_node_name else field_name
         self.delimiter = delimiter
+        self.data_type = data_type.upper() if data_type else fc.STRING
+        self.data_format = data_format
 
     @classmethod
     def create_from_dict(cls, file_type, field_definition: dict):
@@ -46,7 +56,7 @@ class FieldDefinition:
         return cls(file_type=file_type, **field_def_copy)
 
     @staticmethod
-    def _validate(file_type, field_name, start_position, field_length, position_in_row):
+    def _validate(file_type, field_name, start_position, field_length, position_in_row, data_type):
         if not field_name:
             raise ValueError("field_name is required")
 
@@ -59,6 +69,9 @@ class FieldDefinition:
         if file_type == fc.DELIMITED and position_in_row is None:
             raise ValueError("position_in_row is required for delimited files")
 
+        if data_type and data_type.upper() not in fc.DATA_TYPES:
+            raise ValueError(f"data_type must be one of {', '.join(fc.DATA_TYPES)}")
+
         # if file_type == fc.XML and not xml_node_name:
         #     raise ValueError('xml_node_name is required for a field in xml')
 
@@ -74,6 +87,22 @@ class FileDefinition:
     input_directory: str = field(default="")
     completed_directory: str = field(default="")
     file_mask: str = field(default="")
+    record_length: int = field(default=None)
+    time_interval: int = field(default=None)
+    ledger_file: str = field(default="")
+    ledger_hash: bool = field(default=False)
+    xml_engine: str = field(default=fc.ETREE)
+    delimited_engine: str = field(default=fc.SPLIT)
+    quote_char: str = field(default="")
+    escape_char: str = field(default="")
+    record_layouts: Dict[str, List[FieldDefinition]] = field(default=None)
+    record_code_position: int = field(default=0)
+    record_code_length: int = field(default=None)
+    output_format: str = field(default="")
+    output_path: str = field(default="")
+    output_table: str = field(default="")
+    error_policy: str = field(default=fc.FAIL_FAST)
+    quarantine_path: str = field(default="")
 
     def __init__(
             self,
@@ -85,8 +114,40 @@ class FileDefinition:
             input_directory="",
             completed_directory="",
             file_mask="",
+            record_length=None,
+            time_interval=None,
+            ledger_file="",
+            ledger_hash=False,
+            xml_engine="",
+            delimited_engine="",
+            quote_char="",
+            escape_char="",
+            record_layouts=None,
+            record_code_position=0,
+            record_code_length=None,
+            output_format="",
+            output_path="",
+            output_table="",
+            error_policy="",
+            quarantine_path="",
     ):
-        self._validate(file_type, field_definitions, delimiter, record_xml_element)
+        self._validate(
+            file_type,
+            field_definitions,
+            delimiter,
+            record_xml_element,
+            record_length,
+            time_interval,
+            xml_engine,
+            delimited_engine,
+            quote_char,
+            escape_char,
+            record_layouts,
+            record_code_position,
+            record_code_length,
+            output_format,
+            error_policy,
+        )
         self.file_type = file_type
         self.field_definitions = field_definitions
         self.has_header = has_header
@@ -95,25 +156,132 @@ class FileDefinition:
         self.input_directory = input_directory
         self.completed_directory = completed_directory
         self.file_mask = file_mask
+        self.record_length = record_length
+        self.time_interval = time_interval
+        self.ledger_file = ledger_file
+        self.ledger_hash = ledger_hash
+        self.xml_engine = xml_engine.upper() if xml_engine else fc.ETREE
+        self.delimited_engine = delimited_engine.upper() if delimited_engine else fc.SPLIT
+        self.quote_char = quote_char
+        self.escape_char = escape_char
+        self.record_layouts = record_layouts
+        self.record_code_position = record_code_position
+        self.record_code_length = record_code_length
+        self.output_format = output_format.upper() if output_format else ""
+        self.output_path = output_path
+        self.output_table = output_table
+        self.error_policy = error_policy.upper() if error_policy else fc.FAIL_FAST
+        self.quarantine_path = quarantine_path
 
     @classmethod
     def create_from_dict(cls, json_data: dict):
         json_copy = {snakecase(k): v for k, v in json_data.items()}
         json_copy[fc.FIELD_DEFINITIONS] = [
-            FieldDefinition.create_from_dict(json_copy[fc.FILE_TYPE], obj) for obj in json_copy[fc.FIELD_DEFINITIONS]
+            FieldDefinition.create_from_dict(json_copy[fc.FILE_TYPE], obj)
+            for obj in json_copy.get(fc.FIELD_DEFINITIONS) or []
         ]
+        if json_copy.get(fc.RECORD_LAYOUTS):
+            json_copy[fc.RECORD_LAYOUTS] = {
+                record_code: [FieldDefinition.create_from_dict(json_copy[fc.FILE_TYPE], obj) for obj in layout]
+                for record_code, layout in json_copy[fc.RECORD_LAYOUTS].items()
+            }
         return cls(**json_copy)
 
+    def project(self, columns: List[str]) -> "FileDefinition":
+        if columns is None:
+            return self
+
+        if not columns:
+            raise ValueError("columns must name at least one field")
+
+        layouts = [self.field_definitions] + list((self.record_layouts or {}).values())
+        field_names = {field_def.field_name for layout in layouts for field_def in layout}
+        missing = [column for column in columns if column not in field_names]
+        if missing:
+            raise ValueError(f"columns are not defined for this file: {', '.join(missing)}")
+
+        projection = copy.copy(self)
+        projection.field_definitions = self._project_fields(self.field_definitions, columns)
+        if self.record_layouts:
+            projection.record_layouts = {
+                record_code: self._project_fields(layout, columns)
+                for record_code, layout in self.record_layouts.items()
+            }
+        return projection
+
+    @staticmethod
+    def _project_fields(field_definitions: List[FieldDefinition], columns: List[str]) -> List[FieldDefinition]:
+        field_definitions = {field_def.field_name: field_def for field_def in field_definitions}
+        return [field_definitions[column] for column in columns if column in field_definitions]
+
+    def create_fixed_width_layout(self) -> FixedWidthLayout:
+        return FixedWidthLayout(self.field_definitions)
+
+    def create_multi_record_layout(self) -> MultiRecordLayout:
+        return MultiRecordLayout(self.record_layouts, self.record_code_position, self.record_code_length)
+
+    def create_xml_layout(self) -> XmlLayout:
+        return XmlLayout(self.field_definitions)
+
+    def create_delimited_layout(self, strip_method: str = "rstrip") -> DelimitedLayout:
+        return DelimitedLayout(self.field_definitions, strip_method)
+
     @staticmethod
-    def _validate(file_type, field_definitions, delimiter, record_element_name):
+    def _validate(
+            file_type,
+            field_definitions,
+            delimiter,
+            record_element_name,
+            record_length,
+            time_interval,
+            xml_engine,
+            delimited_engine,
+            quote_char,
+            escape_char,
+            record_layouts,
+            record_code_position,
+            record_code_length,
+            output_format,
+            error_policy,
+    ):
         if not file_type:
             raise ValueError("file_type is required")
 
-        if not field_definitions:
+        if not field_definitions and not record_layouts:
             raise ValueError("field_definitions is required")
 
+        if record_layouts and file_type != fc.FIXED:
+            raise ValueError("record_layouts are only supported for fixed width files")
+
+        if record_layouts and (not record_code_length or record_code_length < 1 or (record_code_position or 0) < 0):
+            raise ValueError("record_code_length is required for record_layouts and must be greater than zero")
+
         if file_type == fc.DELIMITED and not delimiter:
             raise ValueError("delimiter is required for delimited files")
 
         if file_type == fc.XML and not record_element_name:
             raise ValueError("record_element_name is required for xml files")
+
+        if record_length is not None and record_length < 1:
+            raise ValueError("record_length must be greater than zero")
+
+        if time_interval is not None and time_interval <= 0:
+            raise ValueError("time_interval must be greater than zero")
+
+        if xml_engine and xml_engine.upper() not in fc.XML_ENGINES:
+            raise ValueError(f"xml_engine must be one of {', '.join(fc.XML_ENGINES)}")
+
+        if delimited_engine and delimited_engine.upper() not in fc.DELIMITED_ENGINES:
+            raise ValueError(f"delimited_engine must be one of {', '.join(fc.DELIMITED_ENGINES)}")
+
+        if delimited_engine and delimited_engine.upper() == fc.CSV and delimiter and len(delimiter) != 1:
+            raise ValueError("delimiter must be a single character for the csv engine")
+
+        if len(quote_char or "") > 1 or len(escape_char or "") > 1:
+            raise ValueError("quote_char and escape_char must be a single character")
+
+        if output_format and output_format.upper() not in fc.OUTPUT_FORMATS:
+            raise ValueError(f"output_format must be one of {', '.join(fc.OUTPUT_FORMATS)}")
+
+        if error_policy and error_policy.upper() not in fc.ERROR_POLICIES:
+            raise ValueError(f"error_policy must be one of {', '.join(fc.ERROR_POLICIES)}")
@@ -0,0 +1,90 @@
+import os
+from dataclasses import dataclass
+from typing import IO, Iterator, List, Optional
+
+from dataclasses_json import dataclass_json, LetterCase
+
+import file_ripper.fileconstants as fc
+
+QUARANTINE_EXTENSION = ".quarantine"
+QUARANTINE_DIRECTORY = "quarantine"
+
+
+@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass
+class RecordError:
+    line_number: int
+    raw_text: str
+    error: str
+
+
+class RecordErrorHandler:
+    def __init__(self, file_definition, file_name: str = None, errors: List[RecordError] = None):
+        self.error_policy = file_definition.error_policy
+        self.errors = errors if errors is not None else []
+        self.quarantine_file_name = None
+        if self.error_policy == fc.QUARANTINE:
+            self.quarantine_file_name = quarantine_file_name(file_definition, file_name)
+        self._quarantine = None
+
+    def __call__(self, line_number: int, raw_text: str, exception: Exception):
+        if self.error_policy == fc.FAIL_FAST:
+            raise exception
+
+        record_error = RecordError(line_number, raw_text, f"{type(exception).__name__}: {exception}")
+        self.errors.append(record_error)
+        if self.quarantine_file_name:
+            self.open_quarantine().write(f"{record_error.to_json()}\n")
+
+    def open_quarantine(self) -> IO:
+        # the side file is only created once a record fails, so clean files leave nothing behind
+        if self._quarantine is None:
+            directory = os.path.dirname(self.quarantine_file_name)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._quarantine = open(self.quarantine_file_name, "w", encoding="utf-8")
+        return self._quarantine
+
+    def close(self):
+        if self._quarantine is not None:
+            self._quarantine.close()
+            self._quarantine = None
+
+    def __enter__(self) -> "RecordErrorHandler":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class LineCounter:
+    __slots__ = ("lines", "line_number")
+
+    def __init__(self, file: IO):
+        self.lines = iter(file)
+        self.line_number = 0
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        line = next(self.lines)
+        self.line_number += 1
+        return line
+
+
+def quarantine_file_name(file_definition, file_name: Optional[str]) -> str:
+    if not file_name:
+        raise ValueError("a file name is required to quarantine records")
+
+    # side files default to a subdirectory so a broad file_mask never picks them up as input files
+    directory = file_definition.quarantine_path or os.path.join(os.path.dirname(file_name), QUARANTINE_DIRECTORY)
+    return os.path.join(directory, f"{os.path.basename(file_name)}{QUARANTINE_EXTENSION}")
+
+
+def is_input_file(file_name: str) -> bool:
+    return os.path.isfile(file_name) and not file_name.endswith(QUARANTINE_EXTENSION)
+
+
+def strip_line_break(line: str) -> str:
+    return line.rstrip("\r\n")
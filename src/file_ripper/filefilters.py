@@ -0,0 +1,131 @@
+import copy
+from typing import Callable, List, Optional, Union
+
+import file_ripper.fileconstants as fc
+
+
+class RecordFilter:
+    def bind(self, file_definition) -> "RecordFilter":
+        return self
+
+    def compile(self, file_definition) -> Callable[[object], bool]:
+        raise NotImplementedError("Please use a valid implementation of RecordFilter to filter records")
+
+
+class FieldFilter(RecordFilter):
+    def __init__(self, field_name: str):
+        self.field_name = field_name
+        self.field_definition = None
+
+    def bind(self, file_definition) -> "FieldFilter":
+        if self.field_definition is not None:
+            return self
+
+        # filters are bound to the full definition, so they can test fields that a column projection leaves out
+        layouts = [file_definition.field_definitions] + list((file_definition.record_layouts or {}).values())
+        field_definition = next(
+            (field_def for layout in layouts for field_def in layout if field_def.field_name == self.field_name),
+            None,
+        )
+        if field_definition is None:
+            raise ValueError(f"field {self.field_name} is not defined for this file")
+
+        bound = copy.copy(self)
+        bound.field_definition = field_definition
+        return bound
+
+    def compile(self, file_definition) -> Callable[[object], bool]:
+        bound = self.bind(file_definition)
+        return bound.compile_value_test(create_value_getter(bound.field_definition, file_definition))
+
+    def compile_value_test(self, get_value: Callable[[object], str]) -> Callable[[object], bool]:
+        raise NotImplementedError("Please use a valid implementation of FieldFilter to filter records")
+
+
+class FieldEquals(FieldFilter):
+    def __init__(self, field_name: str, value: str):
+        super().__init__(field_name)
+        self.value = value
+
+    def compile_value_test(self, get_value):
+        value = self.value
+        return lambda record: get_value(record) == value
+
+
+class FieldIn(FieldFilter):
+    def __init__(self, field_name: str, values):
+        super().__init__(field_name)
+        self.values = frozenset(values)
+
+    def compile_value_test(self, get_value):
+        values = self.values
+        return lambda record: get_value(record) in values
+
+
+class FieldPrefix(FieldFilter):
+    def __init__(self, field_name: str, prefix: str):
+        super().__init__(field_name)
+        self.prefix = prefix
+
+    def compile_value_test(self, get_value):
+        prefix = self.prefix
+        return lambda record: (get_value(record) or "").startswith(prefix)
+
+
+class RecordCode(RecordFilter):
+    def __init__(self, code: str, start_position: int = 0):
+        self.code = code
+        self.start_position = start_position
+
+    def compile(self, file_definition) -> Callable[[str], bool]:
+        if file_definition.file_type != fc.FIXED:
+            raise ValueError("RecordCode can only filter fixed width files")
+
+        code, start_position = self.code, self.start_position
+        return lambda record_text: record_text.startswith(code, start_position)
+
+
+def create_value_getter(field_definition, file_definition) -> Callable[[object], Optional[str]]:
+    if file_definition.file_type == fc.FIXED:
+        start = int(field_definition.start_position)
+        end = start + int(field_definition.field_length)
+        return lambda record_text: record_text[start:end].strip()
+
+    if file_definition.file_type == fc.DELIMITED:
+        position = int(field_definition.position_in_row)
+        if file_definition.delimited_engine == fc.CSV:
+            return lambda fields: fields[position] if position < len(fields) else None
+        return lambda fields: fields[position].rstrip() if position < len(fields) else None
+
+    node_name = field_definition.xml_node_name or field_definition.field_name
+
+    def get_text(element):
+        child = element.find(node_name)
+        return child.text if child is not None else None
+
+    return get_text
+
+
+def bind_record_filters(where: Union[RecordFilter, List[RecordFilter], None], file_definition) -> List[RecordFilter]:
+    if where is None:
+        return []
+    if isinstance(where, RecordFilter):
+        where = [where]
+    return [record_filter.bind(file_definition) for record_filter in where]
+
+
+def compile_record_filter(where, file_definition) -> Optional[Callable[[object], bool]]:
+    record_filters = bind_record_filters(where, file_definition)
+    predicates = [record_filter.compile(file_definition) for record_filter in record_filters]
+    if not predicates:
+        return None
+    if len(predicates) == 1:
+        return predicates[0]
+
+    def matches(record):
+        for predicate in predicates:
+            if not predicate(record):
+                return False
+        return True
+
+    return matches
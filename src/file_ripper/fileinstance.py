@@ -1,12 +1,79 @@
-from dataclasses import dataclass
-from typing import List, Dict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import TYPE_CHECKING, List, Dict, Iterable, Iterator, Sequence
 
-from dataclasses_json import dataclass_json, LetterCase
+from dataclasses_json import dataclass_json, config, LetterCase
+from dataclasses_json.cfg import Exclude
+
+from file_ripper.fileconversion import convert_columns, columns_to_numpy, columns_to_dataframe
+from file_ripper.fileerrors import RecordError
+
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+
+
+class RowSchema:
+    __slots__ = ("field_names", "positions")
+
+    def __init__(self, field_names: Iterable[str]):
+        self.field_names = tuple(field_names)
+        self.positions = {field_name: position for position, field_name in enumerate(self.field_names)}
+
+    def create_row(self, values: Sequence) -> "FileRow":
+        return FileRow(RowFields(self, values))
+
+    def __eq__(self, other):
+        if not isinstance(other, RowSchema):
+            return NotImplemented
+        return self.field_names == other.field_names
+
+    def __hash__(self):
+        return hash(self.field_names)
+
+    def __repr__(self):
+        return f"RowSchema({list(self.field_names)!r})"
+
+
+class RowFields(Mapping):
+    __slots__ = ("schema", "values")
+
+    def __init__(self, schema: RowSchema, values: Sequence):
+        self.schema = schema
+        self.values = values
+
+    def to_dict(self) -> Dict[str, str]:
+        return dict(zip(self.schema.field_names, self.values))
+
+    def __contains__(self, item):
+        return item in self.schema.positions
+
+    def __len__(self):
+        return len(self.schema.field_names)
+
+    def __iter__(self):
+        return iter(self.schema.field_names)
+
+    def __getitem__(self, item):
+        return self.values[self.schema.positions[item]]
+
+    def __reversed__(self):
+        return reversed(self.schema.field_names)
+
+    def __eq__(self, other):
+        if isinstance(other, RowFields) and other.schema is self.schema:
+            return tuple(self.values) == tuple(other.values)
+        return super().__eq__(other)
+
+    def __repr__(self):
+        return repr(self.to_dict())
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
 @dataclass
 class FileRow:
+    __slots__ = ("fields",)
     fields: Dict[str, str]
 
     def __contains__(self, item):
@@ -30,6 +97,8 @@ class FileRow:
 class FileInstance:
     file_name: str
     file_rows: List[FileRow]
+    # records skipped by the error_policy, kept out of the json so to_json still only holds ripped rows
+    errors: List[RecordError] = field(default_factory=list, metadata=config(exclude=Exclude.ALWAYS))
 
     def __contains__(self, item):
         return item in self.file_rows
@@ -42,3 +111,112 @@ class FileInstance:
 
     def __getitem__(self, item):
         return self.file_rows[item]
+
+    def to_columnar(self, field_names: List[str] = None) -> "ColumnarFileInstance":
+        return ColumnarFileInstance.from_rows(self.file_name, self.file_rows, field_names)
+
+    def convert_columns(self, file_definition) -> Dict[str, list]:
+        return self._to_columnar(file_definition).convert_columns(file_definition)
+
+    def to_numpy(self, file_definition) -> Dict[str, "numpy.ndarray"]:
+        return self._to_columnar(file_definition).to_numpy(file_definition)
+
+    def to_dataframe(self, file_definition) -> "pandas.DataFrame":
+        return self._to_columnar(file_definition).to_dataframe(file_definition)
+
+    def _to_columnar(self, file_definition) -> "ColumnarFileInstance":
+        field_names = [field_def.field_name for field_def in file_definition.field_definitions]
+        if self.file_rows:
+            # rows ripped with columns only hold the projected fields, so only those are converted
+            first_row = self.file_rows[0]
+            field_names = [field_name for field_name in field_names if field_name in first_row]
+        return self.to_columnar(field_names)
+
+
+class LazyFileInstance:
+    # the rows of a lazy rip are parsed as they are iterated, so they can only be read once and there is no len(),
+    # indexing or to_json until they are collected with to_file_instance
+    def __init__(self, file_name: str, file_rows: Iterable[FileRow], errors: List[RecordError] = None):
+        self.file_name = file_name
+        self.file_rows: Iterator[FileRow] = iter(file_rows)
+        self.errors = errors if errors is not None else []
+        self._iterated = False
+
+    def __iter__(self) -> Iterator[FileRow]:
+        if self._iterated:
+            raise TypeError("the rows of a LazyFileInstance can only be iterated once")
+        self._iterated = True
+        return self.file_rows
+
+    def to_file_instance(self) -> FileInstance:
+        return FileInstance(self.file_name, list(self), self.errors)
+
+    def to_columnar(self, field_names: List[str] = None) -> "ColumnarFileInstance":
+        columnar = ColumnarFileInstance.from_rows(self.file_name, self, field_names)
+        columnar.errors = self.errors
+        return columnar
+
+    def to_json(self, *args, **kwargs) -> str:
+        raise TypeError(
+            "a LazyFileInstance cannot be converted with to_json, "
+            "use write_file_instance_json to stream it or to_file_instance to collect its rows"
+        )
+
+
+@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass
+class ColumnarFileInstance:
+    file_name: str
+    columns: Dict[str, List[str]]
+    errors: List[RecordError] = field(default_factory=list, metadata=config(exclude=Exclude.ALWAYS))
+
+    @classmethod
+    def from_rows(cls, file_name: str, file_rows: Iterable[FileRow], field_names: List[str] = None):
+        file_rows = iter(file_rows)
+        if field_names is None:
+            first_row = next(file_rows, None)
+            if first_row is None:
+                return cls(file_name, {})
+            field_names = list(first_row)
+            file_rows = chain([first_row], file_rows)
+
+        columns = {field_name: [] for field_name in field_names}
+        appenders = [(field_name, columns[field_name].append) for field_name in field_names]
+        for row in file_rows:
+            for field_name, append in appenders:
+                append(row[field_name])
+
+        return cls(file_name, columns)
+
+    @property
+    def field_names(self) -> List[str]:
+        return list(self.columns)
+
+    def column(self, field_name: str) -> List[str]:
+        return self.columns[field_name]
+
+    def convert_columns(self, file_definition) -> Dict[str, list]:
+        return convert_columns(self.columns, file_definition.field_definitions)
+
+    def to_numpy(self, file_definition) -> Dict[str, "numpy.ndarray"]:
+        return columns_to_numpy(self.columns, file_definition.field_definitions)
+
+    def to_dataframe(self, file_definition) -> "pandas.DataFrame":
+        return columns_to_dataframe(self.columns, file_definition.field_definitions)
+
+    def row(self, index: int) -> FileRow:
+        return FileRow({field_name: values[index] for field_name, values in self.columns.items()})
+
+    def __contains__(self, item):
+        return any(row == item for row in self)
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), []))
+
+    def __iter__(self):
+        return (self.row(index) for index in range(len(self)))
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self.row(index) for index in range(len(self))[item]]
+        return self.row(item)
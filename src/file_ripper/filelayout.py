@@ -0,0 +1,135 @@
+from typing import Dict, List, Sequence, Tuple
+
+from file_ripper.fileinstance import FileRow, RowFields, RowSchema
+
+
+class FixedWidthLayout:
+    def __init__(self, field_definitions: List):
+        self.field_names: Tuple[str, ...] = tuple(field_def.field_name for field_def in field_definitions)
+        self.slices: Tuple[slice, ...] = tuple(
+            slice(int(field_def.start_position), int(field_def.start_position) + int(field_def.field_length))
+            for field_def in field_definitions
+        )
+        self.line_length = max(field_slice.stop for field_slice in self.slices)
+        self.schema = RowSchema(self.field_names)
+        self.extract_values = self._compile_extractor()
+
+    def __call__(self, record_text: str) -> Dict[str, str]:
+        return dict(zip(self.field_names, self.extract_values(record_text)))
+
+    def _compile_extractor(self):
+        # one generated function per layout keeps the per line work down to a single length check and a
+        # tuple of slices, rather than an interpreted loop over the field definitions
+        values = "".join(f"record_text[{field_slice.start}:{field_slice.stop}].strip(), "
+                         for field_slice in self.slices)
+        source = (
+            "def extract_values(record_text):\n"
+            f"    if len(record_text.rstrip()) < {self.line_length}:\n"
+            "        raise_short_line(record_text)\n"
+            f"    return ({values})\n"
+        )
+        namespace = {"raise_short_line": self._raise_short_line}
+        exec(compile(source, f"<fixed width layout {id(self):x}>", "exec"), namespace)
+        return namespace["extract_values"]
+
+    def _raise_short_line(self, record_text):
+        self.raise_short_line(len(record_text.rstrip()))
+
+    def raise_short_line(self, line_length: int):
+        for field_name, field_slice in zip(self.field_names, self.slices):
+            if field_slice.stop > line_length:
+                raise IndexError(f"field {field_name} extends past the end of line")
+
+
+class MultiRecordLayout:
+    def __init__(self, record_layouts: Dict[str, List], record_code_position: int, record_code_length: int):
+        start = int(record_code_position or 0)
+        self.code_slice = slice(start, start + int(record_code_length))
+        # a record code mapped to no fields marks a record type that is read past rather than ripped
+        self.layouts: Dict[str, FixedWidthLayout] = {
+            record_code: FixedWidthLayout(field_definitions)
+            for record_code, field_definitions in record_layouts.items()
+            if field_definitions
+        }
+        self.skipped_codes = frozenset(
+            record_code for record_code, field_definitions in record_layouts.items() if not field_definitions
+        )
+
+    def is_included(self, record_text: str) -> bool:
+        return record_text[self.code_slice].strip() not in self.skipped_codes
+
+    def create_row(self, record_text: str) -> FileRow:
+        record_code = record_text[self.code_slice].strip()
+        layout = self.layouts.get(record_code)
+        if layout is None:
+            raise ValueError(f"no record layout is defined for record code {record_code!r}")
+        return FileRow(RowFields(layout.schema, layout.extract_values(record_text)))
+
+
+class DelimitedLayout:
+    def __init__(self, field_definitions: List, strip_method: str = "rstrip"):
+        self.field_names: Tuple[str, ...] = tuple(field_def.field_name for field_def in field_definitions)
+        self.positions: Tuple[int, ...] = tuple(int(field_def.position_in_row) for field_def in field_definitions)
+        self.inner_layouts: Tuple["DelimitedLayout", ...] = tuple(
+            DelimitedLayout(field_def.field_definitions, "strip") if field_def.delimiter else None
+            for field_def in field_definitions
+        )
+        self.inner_delimiters: Tuple[str, ...] = tuple(field_def.delimiter for field_def in field_definitions)
+        self.strip_method = strip_method
+        self.schema = RowSchema(self.field_names)
+        self.extract_values = self._compile_extractor()
+
+    def __call__(self, fields: Sequence[str]) -> Dict[str, object]:
+        return dict(zip(self.field_names, self.extract_values(fields)))
+
+    def _compile_extractor(self):
+        # only the columns named by position_in_row are touched, so wide rows with a few mapped fields
+        # do not pay for stripping every column
+        strip = f".{self.strip_method}()" if self.strip_method else ""
+        namespace = {}
+        values = []
+        for index, (position, inner_layout) in enumerate(zip(self.positions, self.inner_layouts)):
+            if inner_layout is None:
+                values.append(f"fields[{position}]{strip}, ")
+            else:
+                namespace[f"inner_layout_{index}"] = inner_layout
+                values.append(f"inner_layout_{index}(fields[{position}].split({self.inner_delimiters[index]!r})), ")
+        source = (
+            "def extract_values(fields):\n"
+            f"    return ({''.join(values)})\n"
+        )
+        exec(compile(source, f"<delimited layout {id(self):x}>", "exec"), namespace)
+        return namespace["extract_values"]
+
+
+class XmlLayout:
+    def __init__(self, field_definitions: List):
+        self.field_names: Tuple[str, ...] = tuple(field_def.field_name for field_def in field_definitions)
+        self.node_names: Tuple[str, ...] = tuple(
+            field_def.xml_node_name or field_def.field_name for field_def in field_definitions
+        )
+        self.inner_layouts: Tuple["XmlLayout", ...] = tuple(
+            XmlLayout(field_def.field_definitions) if field_def.field_definitions else None
+            for field_def in field_definitions
+        )
+        self.schema = RowSchema(self.field_names)
+        self._nested = any(inner_layout is not None for inner_layout in self.inner_layouts)
+
+    def __call__(self, element) -> Dict[str, object]:
+        return dict(zip(self.field_names, self.extract_values(element)))
+
+    def extract_values(self, element) -> tuple:
+        # the children are indexed by tag in a single pass, so each field is a dict lookup rather than a
+        # scan of the record's children; the first child with a tag wins, as it does for element.find
+        children = {}
+        for child in element:
+            children.setdefault(child.tag, child)
+        try:
+            if not self._nested:
+                return tuple([children[node_name].text for node_name in self.node_names])
+            return tuple([
+                children[node_name].text if inner_layout is None else inner_layout(children[node_name])
+                for node_name, inner_layout in zip(self.node_names, self.inner_layouts)
+            ])
+        except KeyError as ex:
+            raise AttributeError(f"xml node {ex.args[0]} is missing from {element.tag}") from None
@@ -0,0 +1,94 @@
+import hashlib
+import os
+import sqlite3
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class FileLedger:
+    def __init__(self, ledger_file: str, use_hash: bool = False, preload: bool = True):
+        self.ledger_file = ledger_file
+        self.use_hash = use_hash
+        self._connection = sqlite3.connect(ledger_file)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS ripped_files ("
+            "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, content_hash TEXT, "
+            "ripped_at TEXT NOT NULL)"
+        )
+        self._connection.commit()
+        self._entries: Optional[Dict[str, Tuple[int, int, Optional[str]]]] = None
+        if preload:
+            self._entries = {
+                path: (size, mtime_ns, content_hash)
+                for path, size, mtime_ns, content_hash in self._connection.execute(
+                    "SELECT path, size, mtime_ns, content_hash FROM ripped_files"
+                )
+            }
+
+    def is_ripped(self, file_name: str) -> bool:
+        path = os.path.abspath(file_name)
+        entry = self._get_entry(path)
+        if entry is None:
+            return False
+
+        stat = os.stat(path)
+        size, mtime_ns, content_hash = entry
+        if (stat.st_size, stat.st_mtime_ns) == (size, mtime_ns):
+            return True
+
+        if self.use_hash and content_hash and stat.st_size == size and hash_file(path) == content_hash:
+            self._save(path, stat.st_size, stat.st_mtime_ns, content_hash)
+            return True
+
+        return False
+
+    def record(self, file_name: str):
+        path = os.path.abspath(file_name)
+        stat = os.stat(path)
+        self._save(path, stat.st_size, stat.st_mtime_ns, hash_file(path) if self.use_hash else None)
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM ripped_files").fetchone()[0]
+
+    def _get_entry(self, path: str) -> Optional[Tuple[int, int, Optional[str]]]:
+        if self._entries is not None:
+            return self._entries.get(path)
+        return self._connection.execute(
+            "SELECT size, mtime_ns, content_hash FROM ripped_files WHERE path = ?", (path,)
+        ).fetchone()
+
+    def _save(self, path: str, size: int, mtime_ns: int, content_hash: Optional[str]):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO ripped_files (path, size, mtime_ns, content_hash, ripped_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (path, size, mtime_ns, content_hash, datetime.now(timezone.utc).isoformat()),
+        )
+        self._connection.commit()
+        if self._entries is not None:
+            self._entries[path] = (size, mtime_ns, content_hash)
+
+
+def hash_file(file_name: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_name, "rb") as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def open_file_ledger(file_definition, preload: bool = True):
+    if not file_definition.ledger_file:
+        return nullcontext()
+    return FileLedger(file_definition.ledger_file, file_definition.ledger_hash, preload)
@@ -0,0 +1,94 @@
+import importlib
+import json
+import os
+from typing import List, Tuple
+
+from file_ripper.filedefinition import FileDefinition
+
+JSON = "json"
+YAML = "yaml"
+TOML = "toml"
+DEFINITION_FORMATS = (JSON, YAML, TOML)
+DEFINITIONS = "definitions"
+FORMAT_EXTENSIONS = {".json": JSON, ".yaml": YAML, ".yml": YAML, ".toml": TOML}
+
+
+class InvalidDefinitionsError(ValueError):
+    def __init__(self, errors: List[Tuple[int, Exception]]):
+        self.errors = errors
+        messages = "\n".join(f"  definition {index}: {error}" for index, error in errors)
+        super().__init__(f"{len(errors)} invalid file definitions\n{messages}")
+
+
+def validate_definitions_format(definitions_format: str) -> str:
+    if definitions_format not in DEFINITION_FORMATS:
+        raise ValueError(f"definitions_format is not supported: {definitions_format}")
+    return definitions_format
+
+
+def format_from_path(definitions_path: str) -> str:
+    return FORMAT_EXTENSIONS.get(os.path.splitext(definitions_path)[1].lower(), JSON)
+
+
+def parse_definitions(content, definitions_format: str = JSON) -> List[dict]:
+    validate_definitions_format(definitions_format)
+    if definitions_format == YAML:
+        document = load_yaml(content)
+    elif definitions_format == TOML:
+        document = load_toml(content)
+    else:
+        document = load_json(content)
+
+    if isinstance(document, dict):
+        return document[DEFINITIONS] if DEFINITIONS in document else [document]
+    return document or []
+
+
+def create_definitions(definitions: List[dict], indexes: List[int] = None) -> List[FileDefinition]:
+    file_definitions, errors = [], []
+    for index, definition in zip(indexes or range(len(definitions)), definitions):
+        try:
+            file_definitions.append(FileDefinition.create_from_dict(definition))
+        except (ValueError, TypeError, KeyError, AttributeError) as ex:
+            errors.append((index, ex))
+
+    if errors:
+        raise InvalidDefinitionsError(errors)
+    return file_definitions
+
+
+def load_definitions(content, definitions_format: str = JSON) -> List[FileDefinition]:
+    return create_definitions(parse_definitions(content, definitions_format))
+
+
+def load_json(content):
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(content)
+    return orjson.loads(content)
+
+
+def load_yaml(content):
+    yaml = import_loader("yaml", YAML)
+    return yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def load_toml(content):
+    try:
+        toml = importlib.import_module("tomllib")
+    except ImportError:
+        toml = import_loader("tomli", TOML)
+    if isinstance(content, bytes):
+        content = content.decode("utf-8")
+    return toml.loads(content)
+
+
+def import_loader(name: str, definitions_format: str):
+    try:
+        return importlib.import_module(name)
+    except ImportError as ex:
+        raise ImportError(
+            f"{name} is required for {definitions_format} definitions, "
+            f"install it with pip install file-ripper[{definitions_format}]"
+        ) from ex
@@ -0,0 +1,121 @@
+import mmap
+import os
+from collections.abc import Mapping
+from typing import Dict, Iterator
+
+from file_ripper.filedefinition import FileDefinition
+from file_ripper.filelayout import FixedWidthLayout
+from file_ripper.fileinstance import FileRow
+
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+
+
+class MappedRowFields(Mapping):
+    __slots__ = ("layout", "buffer", "offset", "encoding")
+
+    def __init__(self, layout: FixedWidthLayout, buffer, offset: int, encoding: str):
+        self.layout = layout
+        self.buffer = buffer
+        self.offset = offset
+        self.encoding = encoding
+
+    def to_dict(self) -> Dict[str, str]:
+        return {field_name: self[field_name] for field_name in self.layout.field_names}
+
+    def __contains__(self, item):
+        return item in self.layout.schema.positions
+
+    def __len__(self):
+        return len(self.layout.field_names)
+
+    def __iter__(self):
+        return iter(self.layout.field_names)
+
+    def __getitem__(self, item):
+        field_slice = self.layout.slices[self.layout.schema.positions[item]]
+        start = self.offset + field_slice.start
+        return self.buffer[start: self.offset + field_slice.stop].decode(self.encoding).strip()
+
+    def __reversed__(self):
+        return reversed(self.layout.field_names)
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+
+class MappedFixedWidthFile:
+    def __init__(self, file_name: str, file_definition: FileDefinition, encoding: str = "ascii"):
+        self.file_name = file_name
+        self.layout = file_definition.create_fixed_width_layout()
+        self.record_length = file_definition.record_length
+        self.encoding = encoding
+        self._file = open(file_name, "rb")
+        if os.fstat(self._file.fileno()).st_size:
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._buffer = b""
+        self._data_offset = self._find_data_offset(file_definition.has_header)
+
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __iter__(self) -> Iterator[FileRow]:
+        buffer = self._buffer
+        size = len(buffer)
+        start = self._data_offset
+        while start < size:
+            end = buffer.find(b"\n", start)
+            next_start = end + 1
+            if end == -1:
+                end = next_start = size
+            yield self._create_row(start, end)
+            start = next_start
+
+    def __len__(self):
+        # a last record without its line terminator is shorter than record_length but is still a row
+        return -(-(len(self._buffer) - self._data_offset) // self._require_record_length())
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self[index] for index in range(len(self))[item]]
+
+        length = len(self)
+        if item < 0:
+            item += length
+        if not 0 <= item < length:
+            raise IndexError("row index out of range")
+
+        start = self._data_offset + item * self.record_length
+        return self._create_row(start, min(start + self.record_length, len(self._buffer)))
+
+    def _create_row(self, start: int, end: int) -> FileRow:
+        buffer = self._buffer
+        if end > start and buffer[end - 1] == NEWLINE:
+            end -= 1
+        if end > start and buffer[end - 1] == CARRIAGE_RETURN:
+            end -= 1
+        # trailing padding does not count towards the line length, the same as FixedWidthFileService
+        line_length = len(buffer[start:end].rstrip())
+        if line_length < self.layout.line_length:
+            self.layout.raise_short_line(line_length)
+        return FileRow(MappedRowFields(self.layout, buffer, start, self.encoding))
+
+    def _find_data_offset(self, has_header: bool) -> int:
+        if not has_header:
+            return 0
+        header_end = self._buffer.find(b"\n")
+        return len(self._buffer) if header_end == -1 else header_end + 1
+
+    def _require_record_length(self) -> int:
+        if not self.record_length:
+            raise TypeError("record_length is required on the file definition for random access to rows")
+        return self.record_length
@@ -0,0 +1,159 @@
+import asyncio
+import queue
+import threading
+from itertools import islice
+from typing import AsyncIterator, Callable, Iterable, Iterator, List, Optional
+
+import file_ripper.fileconstants as fc
+from file_ripper.fileerrors import RecordError
+from file_ripper.fileinstance import FileRow
+
+DEFAULT_MAX_BATCHES = 4
+POLL_SECONDS = 0.1
+
+_END = object()
+
+
+class PipelineFailure:
+    __slots__ = ("exception",)
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+class RecordBatches:
+    # batches are parsed as they are iterated, and errors holds the records the error_policy skipped so far
+    __slots__ = ("batches", "errors")
+
+    def __init__(self, batches: Iterable, errors: List[RecordError] = None):
+        self.batches = iter(batches)
+        self.errors = errors if errors is not None else []
+
+    def __iter__(self) -> "RecordBatches":
+        return self
+
+    def __next__(self):
+        return next(self.batches)
+
+
+class RowPipeline:
+    def __init__(
+            self,
+            rows: Iterable[FileRow],
+            batch_size: int = fc.DEFAULT_BATCH_SIZE,
+            max_batches: int = DEFAULT_MAX_BATCHES,
+            errors: List[RecordError] = None,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than zero")
+
+        if max_batches < 1:
+            raise ValueError("max_batches must be greater than zero")
+
+        self.rows = rows
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.errors = errors if errors is not None else []
+        self._queue = queue.Queue(maxsize=max_batches)
+        self._stopping = threading.Event()
+        self._finished = False
+        self._thread = None
+
+    def start(self) -> "RowPipeline":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._produce, name="file-ripper-pipeline", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def get(self) -> Optional[List[FileRow]]:
+        if self._finished:
+            return None
+
+        self.start()
+        item = self._get()
+        if item is _END or isinstance(item, PipelineFailure):
+            self._finished = True
+        if isinstance(item, PipelineFailure):
+            raise item.exception
+        return None if item is _END else item
+
+    def drain(self, consumer: Callable[[List[FileRow]], object]) -> int:
+        row_count = 0
+        for batch in self:
+            consumer(batch)
+            row_count += len(batch)
+        return row_count
+
+    def __enter__(self) -> "RowPipeline":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __iter__(self) -> Iterator[List[FileRow]]:
+        self.start()
+        try:
+            while True:
+                batch = self.get()
+                if batch is None:
+                    return
+                yield batch
+        finally:
+            self.close()
+
+    async def __aiter__(self) -> AsyncIterator[List[FileRow]]:
+        loop = asyncio.get_running_loop()
+        self.start()
+        try:
+            while True:
+                batch = await loop.run_in_executor(None, self.get)
+                if batch is None:
+                    return
+                yield batch
+        finally:
+            self.close()
+
+    def _produce(self):
+        # the queue only holds max_batches, so parsing blocks here until the consumer catches up
+        try:
+            for batch in batched(self.rows, self.batch_size):
+                if not self._put(batch):
+                    return
+            self._put(_END)
+        except BaseException as ex:
+            self._put(PipelineFailure(ex))
+
+    def _put(self, item) -> bool:
+        while not self._stopping.is_set():
+            try:
+                self._queue.put(item, timeout=POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self):
+        while True:
+            try:
+                return self._queue.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                if self._stopping.is_set() or not self._thread.is_alive():
+                    # a producer that exited has always queued its last item first
+                    try:
+                        return self._queue.get_nowait()
+                    except queue.Empty:
+                        return _END
+
+
+def batched(items: Iterable, batch_size: int) -> Iterator[list]:
+    items = iter(items)
+    while True:
+        batch = list(islice(items, batch_size))
+        if not batch:
+            return
+        yield batch
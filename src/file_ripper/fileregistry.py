@@ -0,0 +1,60 @@
+import hashlib
+import json
+import os
+from typing import Dict, List, Tuple
+
+from file_ripper.filedefinition import FileDefinition
+from file_ripper.fileloader import create_definitions, format_from_path, parse_definitions, validate_definitions_format
+
+
+class DefinitionRegistry:
+    def __init__(self, definitions_path: str, definitions_format: str = None):
+        self.definitions_path = definitions_path
+        self.definitions_format = validate_definitions_format(definitions_format or format_from_path(definitions_path))
+        self.version = 0
+        self._stat: Tuple[int, int] = None
+        self._content_hash: str = None
+        self._definitions: Dict[Tuple[str, int], FileDefinition] = {}
+
+    @property
+    def file_definitions(self) -> List[FileDefinition]:
+        return list(self._definitions.values())
+
+    def load(self) -> List[FileDefinition]:
+        stat = os.stat(self.definitions_path)
+        file_stat = (stat.st_mtime_ns, stat.st_size)
+        if file_stat == self._stat:
+            return self.file_definitions
+
+        with open(self.definitions_path, "rb") as definitions_file:
+            content = definitions_file.read()
+        content_hash = hashlib.sha256(content).hexdigest()
+        if content_hash != self._content_hash:
+            self._definitions = self._compile(self.parse(content))
+            self._content_hash = content_hash
+            self.version += 1
+
+        self._stat = file_stat
+        return self.file_definitions
+
+    def parse(self, content: bytes) -> List[dict]:
+        return parse_definitions(content, self.definitions_format)
+
+    def _compile(self, definitions: List[dict]) -> Dict[Tuple[str, int], FileDefinition]:
+        # definitions are keyed on their canonical json so an unchanged definition keeps its compiled
+        # FileDefinition across reloads, and only new or edited ones are validated and built again. The
+        # occurrence count keeps identical entries apart, so the registry returns the same list as the loader
+        keys = []
+        occurrences: Dict[str, int] = {}
+        for definition in definitions:
+            text = json.dumps(definition, sort_keys=True, separators=(",", ":"), default=str)
+            occurrences[text] = occurrences.get(text, 0) + 1
+            keys.append((text, occurrences[text]))
+        changed = {
+            key: (index, definition)
+            for index, (key, definition) in enumerate(zip(keys, definitions))
+            if key not in self._definitions
+        }
+        indexes = [index for index, _ in changed.values()]
+        compiled = dict(zip(changed, create_definitions([definition for _, definition in changed.values()], indexes)))
+        return {key: self._definitions[key] if key in self._definitions else compiled[key] for key in keys}
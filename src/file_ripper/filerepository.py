@@ -1,6 +1,239 @@
+import csv
+import json
+import os
+import sqlite3
+from itertools import islice
+from typing import List, Sequence, Union
+
+import file_ripper.fileconstants as fc
+from file_ripper.fileconversion import import_optional
+from file_ripper.fileinstance import FileInstance, FileRow, LazyFileInstance
+
+DEFAULT_TABLE = "file_rows"
+STAGING_TABLE = "file_ripper_staging"
+
+
 class FileRepository:
-    def __init__(self):
-        pass
+    extension = ""
+
+    def __init__(self, output_path: str, field_names: Sequence[str], batch_size: int = fc.DEFAULT_BATCH_SIZE):
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than zero")
+
+        self.output_path = output_path
+        self.field_names = tuple(field_names)
+        self.batch_size = batch_size
+        self._schema = None
+
+    def __call__(self, file_instance: Union[FileInstance, LazyFileInstance]) -> int:
+        # rows are pulled from the file instance a batch at a time, so a lazy instance from rip_file_iter is
+        # written without ever holding the whole file
+        rows = iter(file_instance)
+        target = self.open(file_instance.file_name)
+        row_count = 0
+        try:
+            while True:
+                batch = [self.row_values(row) for row in islice(rows, self.batch_size)]
+                if not batch:
+                    break
+                self.write_batch(target, batch)
+                row_count += len(batch)
+        except BaseException:
+            self.abort(target)
+            raise
+
+        self.commit(target)
+        return row_count
+
+    def output_file_name(self, file_name: str) -> str:
+        base_name = os.path.splitext(os.path.basename(file_name))[0]
+        return os.path.join(self.output_path, f"{base_name}{self.extension}")
+
+    def row_values(self, row: FileRow) -> Sequence:
+        fields = row.fields
+        schema = getattr(fields, "schema", None)
+        if schema is not None and (schema is self._schema or schema.field_names == self.field_names):
+            self._schema = schema
+            return fields.values
+        return tuple(fields.get(field_name) for field_name in self.field_names)
+
+    def open(self, file_name: str):
+        raise NotImplementedError("Please use a valid implementation of FileRepository to store files")
+
+    def write_batch(self, target, batch: List[Sequence]):
+        raise NotImplementedError("Please use a valid implementation of FileRepository to store files")
+
+    def commit(self, target):
+        raise NotImplementedError("Please use a valid implementation of FileRepository to store files")
+
+    def abort(self, target):
+        raise NotImplementedError("Please use a valid implementation of FileRepository to store files")
+
+
+class PartFileRepository(FileRepository):
+    # output is written next to its final name and only renamed into place once every row is written, so a
+    # failed rip never leaves a partial file behind
+    def open(self, file_name: str):
+        os.makedirs(self.output_path, exist_ok=True)
+        output_file_name = self.output_file_name(file_name)
+        return output_file_name, self.open_part(f"{output_file_name}.part")
+
+    def commit(self, target):
+        output_file_name, part = target
+        self.close_part(part)
+        os.replace(f"{output_file_name}.part", output_file_name)
+
+    def abort(self, target):
+        output_file_name, part = target
+        self.close_part(part)
+        os.remove(f"{output_file_name}.part")
+
+    def open_part(self, part_file_name: str):
+        raise NotImplementedError("Please use a valid implementation of FileRepository to store files")
+
+    def close_part(self, part):
+        part.close()
+
+
+class JsonLinesRepository(PartFileRepository):
+    extension = ".jsonl"
+
+    def open_part(self, part_file_name: str):
+        return open(part_file_name, "w", encoding="utf-8")
+
+    def write_batch(self, target, batch: List[Sequence]):
+        _, part = target
+        field_names = self.field_names
+        dumps = json.JSONEncoder(separators=(",", ":")).encode
+        part.write("".join(f"{dumps(dict(zip(field_names, values)))}\n" for values in batch))
+
+
+class CsvRepository(PartFileRepository):
+    extension = ".csv"
+
+    def open_part(self, part_file_name: str):
+        part = open(part_file_name, "w", encoding="utf-8", newline="")
+        writer = csv.writer(part)
+        writer.writerow(self.field_names)
+        return part, writer
+
+    def close_part(self, part):
+        part[0].close()
+
+    def write_batch(self, target, batch: List[Sequence]):
+        _, (_, writer) = target
+        writer.writerows(flatten_values(values) for values in batch)
+
+
+class ParquetRepository(PartFileRepository):
+    extension = ".parquet"
+
+    def open_part(self, part_file_name: str):
+        pyarrow = import_optional("pyarrow", "parquet")
+        parquet = import_optional("pyarrow.parquet", "parquet")
+        schema = pyarrow.schema([(field_name, pyarrow.string()) for field_name in self.field_names])
+        return parquet.ParquetWriter(part_file_name, schema)
+
+    def write_batch(self, target, batch: List[Sequence]):
+        pyarrow = import_optional("pyarrow", "parquet")
+        _, writer = target
+        columns = zip(*(flatten_values(values) for values in batch))
+        writer.write_table(pyarrow.Table.from_arrays(
+            [pyarrow.array(column, type=pyarrow.string()) for column in columns], schema=writer.schema
+        ))
+
+
+class SqliteRepository(FileRepository):
+    # batches are committed to a temp staging table on the file's own connection, so the shared table is only locked
+    # for the single insert that copies a finished file into it and a failed file never leaves rows behind
+    def __init__(
+            self,
+            output_path: str,
+            field_names: Sequence[str],
+            batch_size: int = fc.DEFAULT_BATCH_SIZE,
+            table_name: str = DEFAULT_TABLE,
+    ):
+        super().__init__(output_path, field_names, batch_size)
+        self.table_name = table_name
+
+    def open(self, file_name: str):
+        table = quote_identifier(self.table_name)
+        quoted = [quote_identifier(field_name) for field_name in ("file_name",) + self.field_names]
+        columns = ", ".join(quoted)
+        column_types = ", ".join(f"{column} TEXT" for column in quoted)
+        connection = sqlite3.connect(self.output_path, timeout=60)
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(f"CREATE TABLE IF NOT EXISTS main.{table} ({column_types})")
+            # definitions storing into the same table may have different fields, so missing columns are added
+            existing = {row[1] for row in connection.execute(f"PRAGMA main.table_info({table})")}
+            for field_name in self.field_names:
+                if field_name not in existing:
+                    connection.execute(f"ALTER TABLE main.{table} ADD COLUMN {quote_identifier(field_name)} TEXT")
+            connection.execute(f"CREATE TEMP TABLE {STAGING_TABLE} ({column_types})")
+            connection.commit()
+        except BaseException:
+            connection.close()
+            raise
+        insert = f"INSERT INTO temp.{STAGING_TABLE} ({columns}) VALUES ({', '.join('?' * len(quoted))})"
+        copy = f"INSERT INTO main.{table} ({columns}) SELECT {columns} FROM temp.{STAGING_TABLE}"
+        return connection, insert, copy, file_name
+
+    def write_batch(self, target, batch: List[Sequence]):
+        connection, insert, _, file_name = target
+        connection.executemany(insert, ((file_name, *flatten_values(values)) for values in batch))
+        connection.commit()
+
+    def commit(self, target):
+        connection, _, copy, _ = target
+        try:
+            connection.execute(copy)
+            connection.commit()
+        finally:
+            connection.close()
+
+    def abort(self, target):
+        # the staging table is dropped with the connection, nothing was written to the shared table
+        connection = target[0]
+        connection.rollback()
+        connection.close()
+
+
+def flatten_values(values: Sequence) -> Sequence:
+    # nested records from inner delimiters or xml children are kept as json text in flat formats
+    if any(isinstance(value, dict) for value in values):
+        return [json.dumps(value) if isinstance(value, dict) else value for value in values]
+    return values
+
+
+def quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def output_field_names(file_definition) -> List[str]:
+    layouts = [file_definition.field_definitions] + list((file_definition.record_layouts or {}).values())
+    field_names = {}
+    for layout in layouts:
+        for field_def in layout:
+            field_names.setdefault(field_def.field_name, None)
+    return list(field_names)
+
+
+def create_file_repository(
+        file_definition, output_format: str = None, output_path: str = None, batch_size: int = fc.DEFAULT_BATCH_SIZE
+) -> FileRepository:
+    output_format = (file_definition.output_format or output_format or "").upper()
+    output_path = file_definition.output_path or output_path
+    if output_format not in fc.OUTPUT_FORMATS:
+        raise ValueError(f"output_format must be one of {', '.join(fc.OUTPUT_FORMATS)}")
+    if not output_path:
+        raise ValueError("output_path is required to store files")
 
-    def __call__(self, *args, **kwargs):
-        pass
+    field_names = output_field_names(file_definition)
+    if output_format == fc.SQLITE:
+        return SqliteRepository(output_path, field_names, batch_size, file_definition.output_table or DEFAULT_TABLE)
+    if output_format == fc.CSV:
+        return CsvRepository(output_path, field_names, batch_size)
+    if output_format == fc.PARQUET:
+        return ParquetRepository(output_path, field_names, batch_size)
+    return JsonLinesRepository(output_path, field_names, batch_size)
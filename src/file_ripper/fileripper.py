@@ -1,11 +1,24 @@
+import copy
+import functools
 import glob
+import io
 import os
-from typing import IO, List
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from typing import IO, Callable, List, Tuple
 
+import file_ripper.fileconstants as fc
 from file_ripper.filedefinition import FileDefinition
-from file_ripper.fileinstance import FileInstance
+from file_ripper.fileerrors import RecordError, is_input_file
+from file_ripper.fileinstance import ColumnarFileInstance, FileInstance, FileRow, LazyFileInstance
+from file_ripper.filefilters import bind_record_filters
+from file_ripper.fileledger import FileLedger, open_file_ledger
+from file_ripper.filemapping import MappedFixedWidthFile
+from file_ripper.filepipeline import DEFAULT_MAX_BATCHES, RecordBatches, RowPipeline
+from file_ripper.filerepository import FileRepository, create_file_repository
 from file_ripper.fileservice import create_file_service
 
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
 
 def validate_file_definition(file_definition: FileDefinition):
     if not file_definition.input_directory:
@@ -26,23 +39,314 @@ def move_file_if_needed(file_name: str, file_definition: FileDefinition):
         )
 
 
-def rip_file(file: IO, file_definition: FileDefinition) -> FileInstance:
-    file_service = create_file_service(file_definition)
+def rip_file(
+        file: IO,
+        file_definition: FileDefinition,
+        workers: int = None,
+        executor: Executor = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        columns: List[str] = None,
+        where=None,
+) -> FileInstance:
+    where = bind_record_filters(where, file_definition)
+    file_definition = file_definition.project(columns)
+    if (executor is not None or (workers and workers > 1)) and can_rip_in_chunks(file, file_definition):
+        chunks = find_chunk_boundaries(file.name, chunk_size)
+        if len(chunks) > 1:
+            encoding = getattr(file, "encoding", None) or "utf-8"
+            if executor is not None:
+                return rip_chunks_with_executor(file.name, chunks, file_definition, encoding, executor, where)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return rip_chunks_with_executor(file.name, chunks, file_definition, encoding, executor, where)
+
+    file_service = create_file_service(file_definition, where)
     return file_service.process(file)
 
 
-def rip_files(files: List[IO], file_definition: FileDefinition) -> List[FileInstance]:
-    return [rip_file(f, file_definition) for f in files]
+def can_rip_in_chunks(file: IO, file_definition: FileDefinition) -> bool:
+    file_name = getattr(file, "name", None)
+    # quoted csv fields may contain line breaks, so lines are not safe chunk boundaries for the csv engine, and
+    # skipped records are reported by line number, which a chunk starting mid file cannot know
+    return (
+        file_definition.file_type in (fc.DELIMITED, fc.FIXED)
+        and file_definition.delimited_engine != fc.CSV
+        and file_definition.error_policy == fc.FAIL_FAST
+        and isinstance(file_name, str)
+        and os.path.isfile(file_name)
+    )
+
+
+def find_chunk_boundaries(file_name: str, chunk_size: int) -> List[Tuple[int, int]]:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be greater than zero")
+
+    file_size = os.path.getsize(file_name)
+    boundaries = [0]
+    with open(file_name, "rb") as file:
+        while boundaries[-1] + chunk_size < file_size:
+            file.seek(boundaries[-1] + chunk_size)
+            file.readline()
+            if file.tell() >= file_size:
+                break
+            boundaries.append(file.tell())
+
+    boundaries.append(file_size)
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def rip_chunk(
+        file_name: str, start: int, end: int, file_definition: FileDefinition, encoding: str = "utf-8", where=None
+) -> List[FileRow]:
+    with open(file_name, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+
+    if start > 0:
+        file_definition = copy.copy(file_definition)
+        file_definition.has_header = False
+
+    file_service = create_file_service(file_definition, where)
+    return file_service.process_file_records(io.TextIOWrapper(io.BytesIO(data), encoding=encoding))
+
+
+def rip_chunks_with_executor(
+        file_name: str,
+        chunks: List[Tuple[int, int]],
+        file_definition: FileDefinition,
+        encoding: str,
+        executor: Executor,
+        where=None,
+) -> FileInstance:
+    futures = [
+        executor.submit(rip_chunk, file_name, start, end, file_definition, encoding, where) for start, end in chunks
+    ]
+
+    file_rows = []
+    try:
+        for future in futures:
+            file_rows.extend(future.result())
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+
+    return FileInstance(file_name, file_rows)
+
+
+def rip_file_iter(
+        file: IO, file_definition: FileDefinition, columns: List[str] = None, where=None
+) -> LazyFileInstance:
+    where = bind_record_filters(where, file_definition)
+    file_service = create_file_service(file_definition.project(columns), where)
+    return file_service.process_iter(file)
+
+
+def rip_file_batches(
+        file: IO,
+        file_definition: FileDefinition,
+        batch_size: int = fc.DEFAULT_BATCH_SIZE,
+        columnar: bool = False,
+        columns: List[str] = None,
+        where=None,
+) -> RecordBatches:
+    where = bind_record_filters(where, file_definition)
+    file_service = create_file_service(file_definition.project(columns), where)
+    return file_service.iter_batches(file, batch_size, columnar)
+
+
+def rip_file_pipeline(
+        file: IO,
+        file_definition: FileDefinition,
+        batch_size: int = fc.DEFAULT_BATCH_SIZE,
+        max_batches: int = DEFAULT_MAX_BATCHES,
+        columns: List[str] = None,
+        where=None,
+) -> RowPipeline:
+    where = bind_record_filters(where, file_definition)
+    file_service = create_file_service(file_definition.project(columns), where)
+    return file_service.process_pipeline(file, batch_size, max_batches)
+
+
+def pipe_file(
+        file: IO,
+        file_definition: FileDefinition,
+        consumer: Callable[[List[FileRow]], object],
+        batch_size: int = fc.DEFAULT_BATCH_SIZE,
+        max_batches: int = DEFAULT_MAX_BATCHES,
+        columns: List[str] = None,
+        where=None,
+) -> Tuple[int, List[RecordError]]:
+    pipeline = rip_file_pipeline(file, file_definition, batch_size, max_batches, columns, where)
+    return pipeline.drain(consumer), pipeline.errors
+
+
+def rip_file_columnar(
+        file: IO, file_definition: FileDefinition, columns: List[str] = None, where=None
+) -> ColumnarFileInstance:
+    where = bind_record_filters(where, file_definition)
+    file_service = create_file_service(file_definition.project(columns), where)
+    return file_service.process_columnar(file)
+
+
+def rip_mapped_file(
+        file_name: str, file_definition: FileDefinition, encoding: str = "ascii", columns: List[str] = None
+) -> MappedFixedWidthFile:
+    if file_definition.file_type != fc.FIXED:
+        raise ValueError("only fixed width files can be memory mapped")
+    if file_definition.record_layouts:
+        raise ValueError("files with record_layouts cannot be memory mapped")
+    return MappedFixedWidthFile(file_name, file_definition.project(columns), encoding)
 
 
-def find_and_rip_files(file_definition: FileDefinition) -> List[FileInstance]:
+def rip_files(
+        files: List[IO], file_definition: FileDefinition, columns: List[str] = None, where=None
+) -> List[FileInstance]:
+    where = bind_record_filters(where, file_definition)
+    file_definition = file_definition.project(columns)
+    return [rip_file(f, file_definition, where=where) for f in files]
+
+
+def open_and_rip_file(file_name: str, file_definition: FileDefinition, where=None) -> FileInstance:
+    with open(file_name, "r") as file:
+        return rip_file(file, file_definition, where=where)
+
+
+def store_file(
+        file: IO,
+        file_definition: FileDefinition,
+        repository: FileRepository = None,
+        columns: List[str] = None,
+        where=None,
+) -> Tuple[int, List[RecordError]]:
+    where = bind_record_filters(where, file_definition)
+    file_definition = file_definition.project(columns)
+    if repository is None:
+        repository = create_file_repository(file_definition)
+    # rows are parsed lazily and handed to the repository in batches, so the file is never held in memory
+    file_instance = rip_file_iter(file, file_definition, where=where)
+    return repository(file_instance), file_instance.errors
+
+
+def open_and_store_file(
+        file_name: str, file_definition: FileDefinition, where=None, repository: FileRepository = None
+) -> Tuple[str, int, List[RecordError]]:
+    with open(file_name, "r") as file:
+        row_count, errors = store_file(file, file_definition, repository, where=where)
+    return file_name, row_count, errors
+
+
+def find_and_rip_files(
+        file_definition: FileDefinition,
+        workers: int = None,
+        executor: Executor = None,
+        columns: List[str] = None,
+        where=None,
+) -> List[FileInstance]:
+    return find_and_process_files(file_definition, open_and_rip_file, workers, executor, columns, where)
+
+
+def find_and_store_files(
+        file_definition: FileDefinition,
+        repository: FileRepository = None,
+        workers: int = None,
+        executor: Executor = None,
+        columns: List[str] = None,
+        where=None,
+) -> List[Tuple[str, int, List[RecordError]]]:
+    if repository is None:
+        repository = create_file_repository(file_definition.project(columns))
+    store = functools.partial(open_and_store_file, repository=repository)
+    return find_and_process_files(file_definition, store, workers, executor, columns, where)
+
+
+def find_and_process_files(
+        file_definition: FileDefinition,
+        process_file: Callable,
+        workers: int = None,
+        executor: Executor = None,
+        columns: List[str] = None,
+        where=None,
+) -> list:
     validate_file_definition(file_definition)
-    file_output_list = []
+    where = bind_record_filters(where, file_definition)
+    file_definition = file_definition.project(columns)
+    file_names = glob.glob(f"{file_definition.input_directory}/{file_definition.file_mask}")
+    file_names = [file_name for file_name in file_names if is_input_file(file_name)]
+
+    with open_file_ledger(file_definition) as ledger:
+        if ledger is not None:
+            file_names = [file_name for file_name in file_names if not ledger.is_ripped(file_name)]
+
+        if executor is not None:
+            return rip_file_names_with_executor(file_names, file_definition, executor, ledger, where, process_file)
+
+        if workers and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return rip_file_names_with_executor(file_names, file_definition, executor, ledger, where, process_file)
+
+        return [
+            rip_found_file(file_name, file_definition, ledger=ledger, where=where, process_file=process_file)
+            for file_name in file_names
+        ]
+
+
+def rip_found_file(
+        file_name: str,
+        file_definition: FileDefinition,
+        executor: Executor = None,
+        ledger: FileLedger = None,
+        where=None,
+        process_file: Callable = open_and_rip_file,
+):
+    if executor is not None:
+        file_instance = executor.submit(process_file, file_name, file_definition, where).result()
+    else:
+        file_instance = process_file(file_name, file_definition, where)
+
+    file_ripped(file_name, file_definition, ledger)
+    return file_instance
+
+
+def rip_new_file(
+        file_name: str, file_definition: FileDefinition, executor: Executor = None, repository: FileRepository = None
+):
+    process_file = open_and_rip_file
+    if repository is not None:
+        process_file = functools.partial(open_and_store_file, repository=repository)
+
+    with open_file_ledger(file_definition, preload=False) as ledger:
+        if ledger is not None and ledger.is_ripped(file_name):
+            return None
+        return rip_found_file(file_name, file_definition, executor, ledger, process_file=process_file)
+
+
+def file_ripped(file_name: str, file_definition: FileDefinition, ledger: FileLedger = None):
+    if ledger is not None:
+        ledger.record(file_name)
+    move_file_if_needed(file_name, file_definition)
+
 
-    for file_name in glob.glob(f"{file_definition.input_directory}/{file_definition.file_mask}"):
-        with open(file_name, "r") as file:
-            file_output_list.append(rip_file(file, file_definition))
+def rip_file_names_with_executor(
+        file_names: List[str],
+        file_definition: FileDefinition,
+        executor: Executor,
+        ledger: FileLedger = None,
+        where=None,
+        process_file: Callable = open_and_rip_file,
+) -> list:
+    futures = {
+        executor.submit(process_file, file_name, file_definition, where): file_name for file_name in file_names
+    }
+    file_instances = {}
 
-        move_file_if_needed(file_name, file_definition)
+    try:
+        for future in as_completed(futures):
+            file_name = futures[future]
+            file_instances[file_name] = future.result()
+            file_ripped(file_name, file_definition, ledger)
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
 
-    return file_output_list
+    return [file_instances[file_name] for file_name in file_names]
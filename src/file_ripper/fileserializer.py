@@ -0,0 +1,108 @@
+import json
+from json.encoder import encode_basestring_ascii
+from typing import IO, Dict, Iterator, Sequence, Union
+
+from dataclasses_json.core import _ExtendedEncoder
+
+import file_ripper.fileconstants as fc
+from file_ripper.fileinstance import FileInstance, FileRow, LazyFileInstance, RowFields, RowSchema
+
+
+class FileInstanceSerializer:
+    def __init__(self, compact: bool = False, batch_size: int = fc.DEFAULT_BATCH_SIZE):
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than zero")
+
+        self.compact = compact
+        self.batch_size = batch_size
+        self._templates: Dict[RowSchema, str] = {}
+        self._encode_value = _ExtendedEncoder().encode
+        self._dumps = None
+        if compact:
+            self._dumps = load_compact_dumps()
+
+    def to_json(self, file_instance: Union[FileInstance, LazyFileInstance]) -> str:
+        return "".join(self.iter_json(file_instance))
+
+    def write(self, file_instance: Union[FileInstance, LazyFileInstance], file: IO):
+        for chunk in self.iter_json(file_instance):
+            file.write(chunk)
+
+    def iter_json(self, file_instance: Union[FileInstance, LazyFileInstance]) -> Iterator[str]:
+        if self.compact:
+            yield from self._iter_compact_json(file_instance)
+            return
+
+        # matches dataclass_json's to_json byte for byte: ", " and ": " separators with ascii escapes
+        yield f'{{"fileName": {self._encode_value(file_instance.file_name)}, "fileRows": ['
+        separator = ""
+        batch = []
+        for row in file_instance:
+            batch.append(self.encode_row(row))
+            if len(batch) == self.batch_size:
+                yield separator + ", ".join(batch)
+                separator = ", "
+                batch = []
+        if batch:
+            yield separator + ", ".join(batch)
+        yield "]}"
+
+    def encode_row(self, row: FileRow) -> str:
+        fields = row.fields
+        if type(fields) is RowFields:
+            template = self._templates.get(fields.schema)
+            if template is None:
+                template = self._templates[fields.schema] = self.create_template(fields.schema.field_names)
+            return template % self.encode_values(fields.values)
+
+        return self.create_template(fields.keys()) % self.encode_values(fields.values())
+
+    def encode_values(self, values: Sequence) -> tuple:
+        try:
+            return tuple(map(encode_basestring_ascii, values))
+        except TypeError:
+            encode = self._encode_value
+            return tuple(encode_basestring_ascii(value) if type(value) is str else encode(value) for value in values)
+
+    @staticmethod
+    def create_template(field_names) -> str:
+        # the keys are encoded once per schema, leaving a placeholder for each value
+        items = ", ".join(f"{encode_basestring_ascii(field_name).replace('%', '%%')}: %s" for field_name in field_names)
+        return f'{{"fields": {{{items}}}}}'
+
+    def _iter_compact_json(self, file_instance: Union[FileInstance, LazyFileInstance]) -> Iterator[str]:
+        dumps = self._dumps
+        yield f'{{"fileName":{dumps(file_instance.file_name)},"fileRows":['
+        separator = ""
+        batch = []
+        for row in file_instance:
+            fields = row.fields
+            batch.append({"fields": fields.to_dict() if type(fields) is RowFields else fields})
+            if len(batch) == self.batch_size:
+                yield separator + dumps(batch)[1:-1]
+                separator = ","
+                batch = []
+        if batch:
+            yield separator + dumps(batch)[1:-1]
+        yield "]}"
+
+
+def load_compact_dumps():
+    default = _ExtendedEncoder().default
+    try:
+        import orjson
+    except ImportError:
+        return json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=default).encode
+
+    def dumps(value) -> str:
+        return orjson.dumps(value, default=default).decode("utf-8")
+
+    return dumps
+
+
+def file_instance_to_json(file_instance: Union[FileInstance, LazyFileInstance], compact: bool = False) -> str:
+    return FileInstanceSerializer(compact).to_json(file_instance)
+
+
+def write_file_instance_json(file_instance: Union[FileInstance, LazyFileInstance], file: IO, compact: bool = False):
+    FileInstanceSerializer(compact).write(file_instance, file)
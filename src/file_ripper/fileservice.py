@@ -1,104 +1,337 @@
 import abc
-from typing import IO
-from xml.etree.ElementTree import fromstring
+import csv
+import io
+from typing import IO, Callable, Iterable, Iterator, List
+from xml.etree import ElementTree
+from xml.etree.ElementTree import iterparse
 
 import file_ripper.fileconstants as fc
+from file_ripper.fileconversion import import_optional
+from file_ripper.fileerrors import LineCounter, RecordErrorHandler, strip_line_break
+from file_ripper.filefilters import compile_record_filter
 from file_ripper.filedefinition import FileDefinition
-from file_ripper.fileinstance import FileInstance, FileRow
+from file_ripper.fileinstance import ColumnarFileInstance, FileInstance, FileRow, LazyFileInstance, RowFields
+from file_ripper.filelayout import DelimitedLayout
+from file_ripper.filepipeline import DEFAULT_MAX_BATCHES, RecordBatches, RowPipeline, batched
 
 
 class FileService(abc.ABC):
-    def __init__(self, file_definition):
+    def __init__(self, file_definition, where=None):
         self.file_definition = file_definition
+        self.record_filter = compile_record_filter(where, file_definition)
+        self.errors = []
 
     def process(self, file: IO) -> FileInstance:
+        self.errors = []
         records = self.process_file_records(file)
-        return FileInstance(file.name, records)
+        return FileInstance(file.name, records, self.errors)
 
-    def process_file_records(self, file):
+    def process_iter(self, file: IO) -> LazyFileInstance:
+        self.errors = []
+        return LazyFileInstance(file.name, self.iter_file_records(file), self.errors)
+
+    def process_pipeline(
+            self, file: IO, batch_size: int = fc.DEFAULT_BATCH_SIZE, max_batches: int = DEFAULT_MAX_BATCHES
+    ) -> RowPipeline:
+        self.errors = []
+        return RowPipeline(self.iter_file_records(file), batch_size, max_batches, self.errors)
+
+    def iter_batches(self, file: IO, batch_size: int = fc.DEFAULT_BATCH_SIZE, columnar: bool = False) -> RecordBatches:
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than zero")
+
+        self.errors = []
+        if not columnar:
+            return RecordBatches(batched(self.iter_file_records(file), batch_size), self.errors)
+
+        # columns are transposed straight from the extracted values, no FileRow is built for a columnar batch
+        field_names = self.columnar_field_names()
+        batches = (
+            dict(zip(field_names, map(list, zip(*batch))))
+            for batch in batched(self.iter_record_values(file), batch_size)
+        )
+        return RecordBatches(batches, self.errors)
+
+    def process_columnar(self, file: IO) -> ColumnarFileInstance:
+        self.errors = []
+        file_instance = ColumnarFileInstance.from_rows(
+            file.name, self.iter_file_records(file), self.columnar_field_names()
+        )
+        file_instance.errors = self.errors
+        return file_instance
+
+    def columnar_field_names(self) -> List[str]:
+        return [field_def.field_name for field_def in self.file_definition.field_definitions]
+
+    def process_file_records(self, file) -> List[FileRow]:
+        return list(self.iter_file_records(file))
+
+    def iter_file_records(self, file) -> Iterator[FileRow]:
+        raise NotImplementedError("Please use a valid implementation of FileService to read files")
+
+    def iter_record_values(self, file) -> Iterator[tuple]:
         raise NotImplementedError("Please use a valid implementation of FileService to read files")
 
+    def iter_processed(
+            self,
+            file: IO,
+            iter_records: Callable[[Iterable], Iterator],
+            process: Callable,
+            raw_text: Callable = strip_line_break,
+            count_lines: bool = True,
+    ) -> Iterator:
+        if self.file_definition.error_policy == fc.FAIL_FAST:
+            return map(process, iter_records(file))
+        return self.iter_processed_or_skipped(file, iter_records, process, raw_text, count_lines)
+
+    def iter_processed_or_skipped(
+            self,
+            file: IO,
+            iter_records: Callable[[Iterable], Iterator],
+            process: Callable,
+            raw_text: Callable,
+            count_lines: bool,
+    ) -> Iterator:
+        # records are pulled one at a time, so the counter is on the last line of the record being processed
+        lines = LineCounter(file) if count_lines else None
+        records = iter_records(lines if count_lines else file)
+        with RecordErrorHandler(self.file_definition, getattr(file, "name", None), self.errors) as handle_error:
+            for record_number, record in enumerate(records, 1):
+                try:
+                    row = process(record)
+                except Exception as ex:
+                    handle_error(lines.line_number if count_lines else record_number, raw_text(record), ex)
+                    continue
+                yield row
+
 
 class XmlFileService(FileService):
-    def __init__(self, file_definition):
-        super().__init__(file_definition)
-
-    def process_file_records(self, file: IO):
-        tree = fromstring("".join(file.readlines()))
-
-        file_rows = []
-        for item in tree.findall(f"./{self.file_definition.record_xml_element}"):
-            record = {}
-            for field_def in self.file_definition.field_definitions:
-                if not field_def.field_definitions:
-                    record[field_def.field_name] = item.find(f"{field_def.field_name}").text
-                else:
-                    inner_record = {}
-                    for inner_def in field_def.field_definitions:
-                        inner_record[inner_def.field_name] = (item
-                                                              .find(field_def.field_name)
-                                                              .find(inner_def.field_name)
-                                                              .text)
-                    record[field_def.field_name] = inner_record
-            file_rows.append(FileRow(record))
-
-        return file_rows
+    def __init__(self, file_definition, where=None):
+        super().__init__(file_definition, where)
+
+    def iter_file_records(self, file: IO):
+        layout = self.file_definition.create_xml_layout()
+        schema, extract_values = layout.schema, layout.extract_values
+
+        def create_row(element):
+            return schema.create_row(extract_values(element))
+
+        # xml has no usable line numbers, so skipped records are numbered by their position in the file
+        yield from self.iter_processed(file, self.iter_record_elements, create_row, self.element_text, False)
+
+    def iter_record_values(self, file: IO):
+        extract_values = self.file_definition.create_xml_layout().extract_values
+        yield from self.iter_processed(file, self.iter_record_elements, extract_values, self.element_text, False)
+
+    def element_text(self, element) -> str:
+        if self.file_definition.xml_engine == fc.LXML:
+            return import_optional("lxml.etree", "lxml").tostring(element, encoding="unicode").strip()
+        return ElementTree.tostring(element, encoding="unicode").strip()
+
+    def iter_record_elements(self, file: IO):
+        if self.file_definition.xml_engine == fc.LXML:
+            elements = self.iter_lxml_record_elements(file)
+        else:
+            elements = self.iter_etree_record_elements(file)
+        if self.record_filter is not None:
+            elements = filter(self.record_filter, elements)
+        return elements
+
+    def iter_etree_record_elements(self, file: IO):
+        root = None
+        depth = 0
+        for event, element in iterparse(file, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = element
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth == 1:
+                if element.tag == self.file_definition.record_xml_element:
+                    yield element
+                root.clear()
+
+    def iter_lxml_record_elements(self, file: IO):
+        etree = import_optional("lxml.etree", "lxml")
+        # lxml only reports the record elements, so the rest of the document never reaches python
+        for _, element in etree.iterparse(
+                binary_source(file), events=("end",), tag=self.file_definition.record_xml_element
+        ):
+            parent = element.getparent()
+            if parent is None or parent.getparent() is not None:
+                continue
+
+            yield element
+            element.clear(keep_tail=True)
+            while element.getprevious() is not None:
+                del parent[0]
+
+
+class EncodedReader:
+    def __init__(self, file: IO, encoding: str = "utf-8"):
+        self.file = file
+        self.encoding = encoding
+
+    def read(self, size: int = -1) -> bytes:
+        return self.file.read(size).encode(self.encoding)
+
+
+def binary_source(file: IO):
+    if not isinstance(file, io.TextIOBase):
+        return file
+    buffer = getattr(file, "buffer", None)
+    return buffer if buffer is not None else EncodedReader(file)
 
 
 class FlatFileService(FileService, abc.ABC):
-    def __init__(self, file_definition: FileDefinition):
-        super().__init__(file_definition)
+    def __init__(self, file_definition: FileDefinition, where=None):
+        super().__init__(file_definition, where)
+        self._record_processor = None
 
-    def process_file_records(self, file: IO):
-        records = []
-        lines = file.readlines()
+    def iter_file_records(self, file: IO):
+        yield from self.iter_processed(file, self.iter_lines, self.create_record_processor())
+
+    def iter_lines(self, file: IO) -> Iterator[str]:
+        lines = iter(file)
         if self.file_definition.has_header:
-            lines.pop(0)
+            next(lines, None)
+        # filters run on the raw line, so discarded records are never sliced or length checked
+        if self.record_filter is not None:
+            lines = filter(self.record_filter, lines)
+        return lines
 
-        for line in lines:
-            records.append(self.process_record(line))
+    def create_record_processor(self) -> Callable[[str], FileRow]:
+        return self.process_record
 
-        return records
+    def cached_record_processor(self) -> Callable[[str], FileRow]:
+        # the layout is compiled on the first process_record call and reused for every line after it
+        if self._record_processor is None:
+            self._record_processor = self.create_record_processor()
+        return self._record_processor
 
     def process_record(self, record_text):
         raise NotImplementedError("Please use a valid implementation of FileService to read files")
 
 
 class DelimitedFileService(FlatFileService):
-    def process_record(self, record_text):
-        fields = [field.rstrip() for field in record_text.split(self.file_definition.delimiter)]
+    def iter_file_records(self, file: IO):
+        layout = self.create_split_layout()
+        schema, extract_values = layout.schema, layout.extract_values
+
+        def create_row(fields):
+            return FileRow(RowFields(schema, extract_values(fields)))
+
+        yield from self.iter_processed(file, self.iter_split_rows, create_row, self.join_fields)
+
+    def iter_record_values(self, file: IO):
+        extract_values = self.create_split_layout().extract_values
+        yield from self.iter_processed(file, self.iter_split_rows, extract_values, self.join_fields)
+
+    def create_split_layout(self) -> DelimitedLayout:
+        if self.file_definition.delimited_engine == fc.CSV:
+            return self.file_definition.create_delimited_layout(strip_method="")
+        return self.file_definition.create_delimited_layout()
+
+    def iter_split_rows(self, file: Iterable[str]) -> Iterator[list]:
+        if self.file_definition.delimited_engine == fc.CSV:
+            # a single reader over the whole file, so quoted fields may span lines
+            rows = filter(None, csv.reader(file, **self.csv_options()))
+        else:
+            delimiter = self.file_definition.delimiter
+            rows = (line.split(delimiter) for line in file)
 
-        record = {}
-        for field_def in self.file_definition.field_definitions:
-            if not field_def.delimiter:
-                record[field_def.field_name] = fields[field_def.position_in_row]
-            else:
-                inner_fields = [field.strip() for field in fields[field_def.position_in_row].split(field_def.delimiter)]
-                inner_record = {}
-                for inner_def in field_def.field_definitions:
-                    inner_record[inner_def.field_name] = inner_fields[inner_def.position_in_row]
-                record[field_def.field_name] = inner_record
+        if self.file_definition.has_header:
+            next(rows, None)
+        # filters run on the split fields, so discarded records are never projected
+        if self.record_filter is not None:
+            rows = filter(self.record_filter, rows)
+        return rows
+
+    def join_fields(self, fields: List[str]) -> str:
+        if self.file_definition.delimited_engine == fc.CSV:
+            # quotes and escapes are written back, so a quarantined record parses to the same fields when replayed
+            text = io.StringIO()
+            csv.writer(text, lineterminator="", **self.csv_options()).writerow(fields)
+            return text.getvalue()
+        return strip_line_break(self.file_definition.delimiter.join(fields))
+
+    def create_record_processor(self):
+        if self.file_definition.delimited_engine == fc.CSV:
+            layout = self.file_definition.create_delimited_layout(strip_method="")
+            csv_options = self.csv_options()
+
+            def process_record(record_text):
+                fields = next(csv.reader([record_text], **csv_options))
+                return FileRow(RowFields(layout.schema, layout.extract_values(fields)))
 
-        return FileRow(record)
+            return process_record
+
+        layout = self.file_definition.create_delimited_layout()
+        delimiter = self.file_definition.delimiter
+
+        def process_record(record_text):
+            return FileRow(RowFields(layout.schema, layout.extract_values(record_text.split(delimiter))))
+
+        return process_record
+
+    def process_record(self, record_text):
+        return self.cached_record_processor()(record_text)
+
+    def csv_options(self) -> dict:
+        return {
+            "delimiter": self.file_definition.delimiter,
+            "quotechar": self.file_definition.quote_char or '"',
+            "escapechar": self.file_definition.escape_char or None,
+        }
 
 
 class FixedWidthFileService(FlatFileService):
+    def iter_file_records(self, file: IO):
+        if not self.file_definition.record_layouts:
+            yield from super().iter_file_records(file)
+            return
+
+        # one pass over the file, each line is dispatched to the layout of its record code
+        layout = self.file_definition.create_multi_record_layout()
+
+        def iter_included_lines(lines):
+            lines = self.iter_lines(lines)
+            return filter(layout.is_included, lines) if layout.skipped_codes else lines
+
+        yield from self.iter_processed(file, iter_included_lines, layout.create_row)
+
+    def iter_record_values(self, file: IO):
+        extract_values = self.file_definition.create_fixed_width_layout().extract_values
+        yield from self.iter_processed(file, self.iter_lines, extract_values)
+
+    def columnar_field_names(self) -> List[str]:
+        if self.file_definition.record_layouts:
+            raise ValueError("files with record_layouts cannot be ripped into columns")
+        return super().columnar_field_names()
+
+    def create_record_processor(self):
+        if self.file_definition.record_layouts:
+            return self.file_definition.create_multi_record_layout().create_row
+
+        layout = self.file_definition.create_fixed_width_layout()
+
+        def process_record(record_text):
+            return FileRow(RowFields(layout.schema, layout.extract_values(record_text)))
+
+        return process_record
+
     def process_record(self, record_text):
-        record = {}
-        for field_def in self.file_definition.field_definitions:
-            end_position = field_def.start_position + field_def.field_length
-            if end_position > len(record_text.rstrip()):
-                raise IndexError(f"field {field_def.field_name} extends past the end of line")
-            record[field_def.field_name] = record_text[field_def.start_position: end_position].rstrip().lstrip()
-        return FileRow(record)
+        return self.cached_record_processor()(record_text)
 
 
-def create_file_service(file_definition):
+def create_file_service(file_definition, where=None):
     if file_definition.file_type == fc.XML:
-        return XmlFileService(file_definition)
+        return XmlFileService(file_definition, where)
     elif file_definition.file_type == fc.DELIMITED:
-        return DelimitedFileService(file_definition)
+        return DelimitedFileService(file_definition, where)
     elif file_definition.file_type == fc.FIXED:
-        return FixedWidthFileService(file_definition)
+        return FixedWidthFileService(file_definition, where)
     else:
         raise ValueError(f"file_definition is configured for unsupported file_type: {file_definition.file_type}")
@@ -0,0 +1,146 @@
+import asyncio
+import fnmatch
+import glob
+import os
+from typing import AsyncIterator, Dict, Optional, Set, Tuple
+
+from file_ripper.filedefinition import FileDefinition
+from file_ripper.fileerrors import QUARANTINE_EXTENSION
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+
+class DirectoryWatcher:
+    def __init__(
+            self,
+            file_definition: FileDefinition,
+            settle_seconds: float = 2.0,
+            poll_seconds: float = 1.0,
+            rescan_seconds: float = 60.0,
+            use_events: bool = True,
+    ):
+        self.file_definition = file_definition
+        self.input_directory = os.path.abspath(file_definition.input_directory)
+        self.settle_seconds = settle_seconds
+        self.poll_seconds = poll_seconds
+        self.rescan_seconds = rescan_seconds
+        self.use_events = use_events and Observer is not None
+        self._pending: Dict[str, Tuple[Optional[Tuple[int, int]], float]] = {}
+        self._closed: Set[str] = set()
+        self._ripping: Dict[str, Tuple[int, int]] = {}
+        self._ripped: Dict[str, Tuple[int, int]] = {}
+
+    async def watch(self, stopping: asyncio.Event) -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+        observer = self._start_observer(loop) if self.use_events else None
+        rescan_seconds = self.rescan_seconds if observer is not None else self.poll_seconds
+
+        try:
+            self.scan()
+            last_scan = loop.time()
+            while not stopping.is_set():
+                for file_name in self.complete_files(loop.time()):
+                    yield file_name
+
+                if loop.time() - last_scan >= rescan_seconds:
+                    self.scan()
+                    last_scan = loop.time()
+
+                try:
+                    await asyncio.wait_for(stopping.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+
+    def scan(self):
+        for file_name in glob.glob(f"{self.input_directory}/{self.file_definition.file_mask}"):
+            if os.path.isfile(file_name):
+                self.add_file(file_name)
+
+        for file_name in [file_name for file_name in self._ripped if not os.path.exists(file_name)]:
+            del self._ripped[file_name]
+
+    def add_file(self, file_name: str):
+        file_name = os.path.abspath(file_name)
+        if self.matches(file_name) and file_name not in self._pending:
+            self._pending[file_name] = (None, 0.0)
+
+    def close_file(self, file_name: str):
+        file_name = os.path.abspath(file_name)
+        if self.matches(file_name):
+            self.add_file(file_name)
+            self._closed.add(file_name)
+
+    def matches(self, file_name: str) -> bool:
+        directory, base_name = os.path.split(file_name)
+        return (
+            directory == self.input_directory
+            and not base_name.endswith(QUARANTINE_EXTENSION)
+            and fnmatch.fnmatch(base_name, self.file_definition.file_mask)
+        )
+
+    def complete_files(self, now: float):
+        for file_name, (signature, changed_at) in list(self._pending.items()):
+            try:
+                stat = os.stat(file_name)
+            except FileNotFoundError:
+                self._forget(file_name)
+                continue
+
+            current_signature = (stat.st_size, stat.st_mtime_ns)
+            if file_name in self._ripping or self._ripped.get(file_name) == current_signature:
+                self._forget(file_name)
+                continue
+
+            closed = file_name in self._closed
+            if current_signature != signature and not closed:
+                self._pending[file_name] = (current_signature, now)
+                continue
+
+            if closed or now - changed_at >= self.settle_seconds:
+                self._forget(file_name)
+                self._ripping[file_name] = current_signature
+                yield file_name
+
+    def rip_finished(self, file_name: str, ripped: bool):
+        # the signature is only remembered once the rip succeeds, a failed file is picked up again by the next scan
+        signature = self._ripping.pop(file_name, None)
+        if ripped and signature is not None:
+            self._ripped[file_name] = signature
+
+    def _forget(self, file_name: str):
+        self._pending.pop(file_name, None)
+        self._closed.discard(file_name)
+
+    def _start_observer(self, loop):
+        observer = Observer()
+        observer.schedule(_WatcherEventHandler(self, loop), self.input_directory, recursive=False)
+        observer.start()
+        return observer
+
+
+class _WatcherEventHandler(FileSystemEventHandler):
+    def __init__(self, watcher: DirectoryWatcher, loop):
+        super().__init__()
+        self.watcher = watcher
+        self.loop = loop
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.loop.call_soon_threadsafe(self.watcher.add_file, event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.loop.call_soon_threadsafe(self.watcher.add_file, event.dest_path)
+
+    def on_closed(self, event):
+        if not event.is_directory:
+            self.loop.call_soon_threadsafe(self.watcher.close_file, event.src_path)
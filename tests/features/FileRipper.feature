@@ -34,6 +34,15 @@ Feature: File Ripper Business Features
     Then data is returned for all files
     And files are still in input directory
 
+  Scenario: File ripper looks up files and processes them across worker processes
+    Given files stored on file system
+    And a fixed file definition
+    And file definition has input directory, file mask
+    And file definition has completed directory
+    When the files are found and ripped with 2 workers
+    Then data is returned for all files
+    And files are in completed directory
+
   Scenario: File ripper looks up files, processes them, and moves them to completed
     Given files stored on file system
     And a fixed file definition
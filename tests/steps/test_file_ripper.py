@@ -201,6 +201,13 @@ def step_impl(context):
     return context
 
 
+@when(parse('the files are found and ripped with {workers:d} workers'), target_fixture="context")
+def step_impl(workers, context):
+    context.file_names = [file.name for file in context.files]
+    context.file_output_list = find_and_rip_files(context.file_definition, workers=workers)
+    return context
+
+
 @then("the file data is returned")
 def step_impl(context):
     assert context.file.name == context.output_file_name
@@ -50,4 +50,106 @@ class FileConstantsTests(TestCase):
         self.assertEqual(fc.COMPLETED_DIRECTORY, 'completed_directory')
 
     def test_position_in_row(self):
-        self.assertEqual('position_in_row', fc.POSITION_IN_ROW)
\ No newline at end of file
+        self.assertEqual('position_in_row', fc.POSITION_IN_ROW)
+
+    def test_data_type(self):
+        self.assertEqual('data_type', fc.DATA_TYPE)
+
+    def test_data_format(self):
+        self.assertEqual('data_format', fc.DATA_FORMAT)
+
+    def test_data_types(self):
+        self.assertEqual(('STRING', 'INT', 'DECIMAL', 'DATE', 'BOOL'), fc.DATA_TYPES)
+
+    def test_record_length(self):
+        self.assertEqual('record_length', fc.RECORD_LENGTH)
+
+    def test_time_interval(self):
+        self.assertEqual('time_interval', fc.TIME_INTERVAL)
+
+    def test_ledger_file(self):
+        self.assertEqual('ledger_file', fc.LEDGER_FILE)
+
+    def test_ledger_hash(self):
+        self.assertEqual('ledger_hash', fc.LEDGER_HASH)
+
+    def test_xml_engine(self):
+        self.assertEqual('xml_engine', fc.XML_ENGINE)
+
+    def test_etree(self):
+        self.assertEqual('ETREE', fc.ETREE)
+
+    def test_lxml(self):
+        self.assertEqual('LXML', fc.LXML)
+
+    def test_xml_engines(self):
+        self.assertEqual(('ETREE', 'LXML'), fc.XML_ENGINES)
+
+    def test_delimited_engine(self):
+        self.assertEqual('delimited_engine', fc.DELIMITED_ENGINE)
+
+    def test_split(self):
+        self.assertEqual('SPLIT', fc.SPLIT)
+
+    def test_csv(self):
+        self.assertEqual('CSV', fc.CSV)
+
+    def test_delimited_engines(self):
+        self.assertEqual(('SPLIT', 'CSV'), fc.DELIMITED_ENGINES)
+
+    def test_quote_char(self):
+        self.assertEqual('quote_char', fc.QUOTE_CHAR)
+
+    def test_escape_char(self):
+        self.assertEqual('escape_char', fc.ESCAPE_CHAR)
+
+    def test_record_layouts(self):
+        self.assertEqual('record_layouts', fc.RECORD_LAYOUTS)
+
+    def test_record_code_position(self):
+        self.assertEqual('record_code_position', fc.RECORD_CODE_POSITION)
+
+    def test_record_code_length(self):
+        self.assertEqual('record_code_length', fc.RECORD_CODE_LENGTH)
+
+    def test_output_format(self):
+        self.assertEqual('output_format', fc.OUTPUT_FORMAT)
+
+    def test_output_path(self):
+        self.assertEqual('output_path', fc.OUTPUT_PATH)
+
+    def test_output_table(self):
+        self.assertEqual('output_table', fc.OUTPUT_TABLE)
+
+    def test_jsonl(self):
+        self.assertEqual('JSONL', fc.JSONL)
+
+    def test_parquet(self):
+        self.assertEqual('PARQUET', fc.PARQUET)
+
+    def test_sqlite(self):
+        self.assertEqual('SQLITE', fc.SQLITE)
+
+    def test_output_formats(self):
+        self.assertEqual(('JSONL', 'CSV', 'PARQUET', 'SQLITE'), fc.OUTPUT_FORMATS)
+
+    def test_error_policy(self):
+        self.assertEqual('error_policy', fc.ERROR_POLICY)
+
+    def test_quarantine_path(self):
+        self.assertEqual('quarantine_path', fc.QUARANTINE_PATH)
+
+    def test_fail_fast(self):
+        self.assertEqual('FAIL_FAST', fc.FAIL_FAST)
+
+    def test_skip(self):
+        self.assertEqual('SKIP', fc.SKIP)
+
+    def test_quarantine(self):
+        self.assertEqual('QUARANTINE', fc.QUARANTINE)
+
+    def test_error_policies(self):
+        self.assertEqual(('FAIL_FAST', 'SKIP', 'QUARANTINE'), fc.ERROR_POLICIES)
+
+    def test_default_batch_size(self):
+        self.assertEqual(10000, fc.DEFAULT_BATCH_SIZE)
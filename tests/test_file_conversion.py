@@ -0,0 +1,123 @@
+import importlib.util
+import unittest
+from datetime import date
+from decimal import Decimal
+from unittest import TestCase
+
+import file_ripper.fileconstants as fc
+from file_ripper.filedefinition import FileDefinition, FieldDefinition
+from file_ripper.fileinstance import ColumnarFileInstance, FileInstance, FileRow
+
+has_numpy = importlib.util.find_spec('numpy') is not None
+has_pandas = importlib.util.find_spec('pandas') is not None
+
+
+class FileConversionTests(TestCase):
+    def setUp(self) -> None:
+        self.file_definition = FileDefinition(fc.DELIMITED, [
+            FieldDefinition('name', fc.DELIMITED, position_in_row=0),
+            FieldDefinition('age', fc.DELIMITED, position_in_row=1, data_type=fc.INT),
+            FieldDefinition('balance', fc.DELIMITED, position_in_row=2, data_type=fc.DECIMAL),
+            FieldDefinition('dob', fc.DELIMITED, position_in_row=3, data_type=fc.DATE, data_format='%m/%d/%Y'),
+            FieldDefinition('active', fc.DELIMITED, position_in_row=4, data_type=fc.BOOL),
+        ], delimiter='|')
+        self.file_instance = FileInstance('file_name', [
+            FileRow({'name': 'Aaron', 'age': '39', 'balance': '10.25', 'dob': '09/04/1980', 'active': 'Y'}),
+            FileRow({'name': 'Gene', 'age': '61', 'balance': '-3.50', 'dob': '01/15/1958', 'active': 'false'}),
+        ])
+
+
+class ConvertColumnsTests(FileConversionTests):
+    def test_file_instance(self):
+        columns = self.file_instance.convert_columns(self.file_definition)
+        self.assertEqual(['Aaron', 'Gene'], columns['name'])
+        self.assertEqual([39, 61], columns['age'])
+        self.assertEqual([Decimal('10.25'), Decimal('-3.50')], columns['balance'])
+        self.assertEqual([date(1980, 9, 4), date(1958, 1, 15)], columns['dob'])
+        self.assertEqual([True, False], columns['active'])
+
+    def test_iso_date_default(self):
+        self.file_definition.field_definitions[3].data_format = ''
+        columnar = ColumnarFileInstance('file_name', {'dob': ['1980-09-04']})
+        self.assertEqual([date(1980, 9, 4)], columnar.convert_columns(self.file_definition)['dob'])
+
+    def test_blank_values(self):
+        columnar = ColumnarFileInstance('file_name', {
+            'name': ['', 'Gene'], 'age': ['', '61'], 'balance': [' ', '1.5'], 'dob': ['', '01/15/1958'],
+            'active': ['', 'y'],
+        })
+        columns = columnar.convert_columns(self.file_definition)
+        self.assertEqual(['', 'Gene'], columns['name'])
+        self.assertEqual([None, 61], columns['age'])
+        self.assertEqual([None, Decimal('1.5')], columns['balance'])
+        self.assertEqual([None, date(1958, 1, 15)], columns['dob'])
+        self.assertEqual([None, True], columns['active'])
+
+    def test_invalid_value(self):
+        columnar = ColumnarFileInstance('file_name', {'age': ['old']})
+        with self.assertRaises(ValueError):
+            columnar.convert_columns(self.file_definition)
+
+
+@unittest.skipUnless(has_numpy, 'numpy is not installed')
+class ToNumpyTests(FileConversionTests):
+    def test_dtypes(self):
+        arrays = self.file_instance.to_numpy(self.file_definition)
+        self.assertEqual('int64', arrays['age'].dtype.name)
+        self.assertEqual('float64', arrays['balance'].dtype.name)
+        self.assertEqual('bool', arrays['active'].dtype.name)
+        self.assertEqual('object', arrays['name'].dtype.name)
+
+    def test_values(self):
+        arrays = self.file_instance.to_numpy(self.file_definition)
+        self.assertEqual([39, 61], arrays['age'].tolist())
+        self.assertEqual([10.25, -3.5], arrays['balance'].tolist())
+        self.assertEqual([True, False], arrays['active'].tolist())
+        self.assertEqual(['1980-09-04', '1958-01-15'], [str(value)[:10] for value in arrays['dob']])
+
+    def test_projected_rows(self):
+        file_instance = FileInstance('file_name', [FileRow({'age': '39'}), FileRow({'age': '61'})])
+        arrays = file_instance.to_numpy(self.file_definition)
+        self.assertEqual(['age'], list(arrays))
+        self.assertEqual([39, 61], arrays['age'].tolist())
+
+    def test_iso_date(self):
+        self.file_definition.field_definitions[3].data_format = ''
+        columnar = ColumnarFileInstance('file_name', {'dob': ['1980-09-04']})
+        self.assertEqual('datetime64[D]', columnar.to_numpy(self.file_definition)['dob'].dtype.name)
+
+    def test_blank_values(self):
+        import numpy
+
+        columnar = ColumnarFileInstance('file_name', {
+            'age': ['', '61'], 'balance': [' ', '1.5'], 'dob': ['', '01/15/1958'], 'active': ['', 'y'],
+        })
+        arrays = columnar.to_numpy(self.file_definition)
+        self.assertTrue(numpy.isnan(arrays['age'][0]))
+        self.assertEqual(61, arrays['age'][1])
+        self.assertTrue(numpy.isnan(arrays['balance'][0]))
+        self.assertTrue(numpy.isnat(arrays['dob'][0]))
+        self.assertEqual([None, True], arrays['active'].tolist())
+
+    def test_blank_iso_date(self):
+        import numpy
+
+        self.file_definition.field_definitions[3].data_format = ''
+        columnar = ColumnarFileInstance('file_name', {'dob': [' ', '1980-09-04']})
+        self.assertTrue(numpy.isnat(columnar.to_numpy(self.file_definition)['dob'][0]))
+
+
+@unittest.skipUnless(has_pandas, 'pandas is not installed')
+class ToDataFrameTests(FileConversionTests):
+    def test_dataframe(self):
+        data_frame = self.file_instance.to_dataframe(self.file_definition)
+        self.assertEqual(['name', 'age', 'balance', 'dob', 'active'], list(data_frame.columns))
+        self.assertEqual([39, 61], data_frame['age'].tolist())
+        self.assertEqual(1980, data_frame['dob'][0].year)
+        self.assertEqual([True, False], data_frame['active'].tolist())
+
+    def test_blank_values(self):
+        columnar = ColumnarFileInstance('file_name', {'age': ['', '61'], 'dob': ['', '01/15/1958']})
+        data_frame = columnar.to_dataframe(self.file_definition)
+        self.assertEqual([True, False], data_frame['age'].isna().tolist())
+        self.assertEqual([True, False], data_frame['dob'].isna().tolist())
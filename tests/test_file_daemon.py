@@ -0,0 +1,146 @@
+import asyncio
+import json
+import os
+import shutil
+import threading
+from unittest import TestCase
+
+import file_ripper.fileconstants as fc
+from file_ripper.filedaemon import FileRipperDaemon
+from file_ripper.filedefinition import FileDefinition, FieldDefinition
+from file_ripper.fileregistry import DefinitionRegistry
+
+
+class FileRipperDaemonTests(TestCase):
+    def setUp(self) -> None:
+        self.directory = os.path.abspath('daemon-files')
+        self.file_definitions = [self.create_file_definition('feed1'), self.create_file_definition('feed2')]
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    @staticmethod
+    def to_definition(file_definition):
+        return {
+            'fileType': file_definition.file_type,
+            'fieldDefinitions': [{'fieldName': 'name', 'startPosition': 0, 'fieldLength': 13}],
+            'inputDirectory': file_definition.input_directory,
+            'completedDirectory': file_definition.completed_directory,
+            'fileMask': file_definition.file_mask,
+            'timeInterval': file_definition.time_interval,
+        }
+
+    def create_file_definition(self, feed_name):
+        input_directory = os.path.join(self.directory, feed_name)
+        os.makedirs(input_directory)
+        with open(os.path.join(input_directory, f'{feed_name}.txt'), 'w') as f:
+            f.write('Aaron        39       09/04/1980\n')
+        return FileDefinition(fc.FIXED, [FieldDefinition('name', fc.FIXED, 0, 13)], input_directory=input_directory,
+                              completed_directory=os.path.join(input_directory, 'completed'), file_mask='*.txt')
+
+    def assert_ripped(self, file_definition):
+        self.assertEqual([], [name for name in os.listdir(file_definition.input_directory) if name.endswith('.txt')])
+        self.assertEqual(1, len(os.listdir(file_definition.completed_directory)))
+
+    def test_run_once(self):
+        asyncio.run(FileRipperDaemon(self.file_definitions).run_once())
+        for file_definition in self.file_definitions:
+            self.assert_ripped(file_definition)
+
+    def test_run_until_stopped(self):
+        daemon = FileRipperDaemon(self.file_definitions, interval_minutes=60)
+
+        async def run_and_stop():
+            asyncio.get_running_loop().call_later(0.2, daemon.stop)
+            await asyncio.wait_for(daemon.run(), timeout=10)
+
+        asyncio.run(run_and_stop())
+        for file_definition in self.file_definitions:
+            self.assert_ripped(file_definition)
+
+    def test_run_rips_new_files_each_interval(self):
+        file_definition = self.file_definitions[0]
+        file_definition.time_interval = 0.001
+        daemon = FileRipperDaemon([file_definition], interval_minutes=60)
+
+        async def add_file_and_stop():
+            await asyncio.sleep(0.2)
+            with open(os.path.join(file_definition.input_directory, 'second.txt'), 'w') as f:
+                f.write('Gene         61       01/15/1958\n')
+            await asyncio.sleep(0.3)
+            daemon.stop()
+
+        async def run():
+            await asyncio.gather(daemon.run(), add_file_and_stop())
+
+        asyncio.run(run())
+        self.assertEqual(2, len(os.listdir(file_definition.completed_directory)))
+
+    def test_failing_definition_does_not_stop_others(self):
+        self.file_definitions[0].input_directory = ''
+        with self.assertLogs(level='ERROR'):
+            asyncio.run(FileRipperDaemon(self.file_definitions).run_once())
+        self.assert_ripped(self.file_definitions[1])
+
+    def test_workers(self):
+        asyncio.run(FileRipperDaemon(self.file_definitions, workers=2).run_once())
+        for file_definition in self.file_definitions:
+            self.assert_ripped(file_definition)
+
+    def test_run_reloads_changed_definitions(self):
+        definitions_path = os.path.join(self.directory, 'definitions.json')
+        second = self.file_definitions[1]
+        second.time_interval = 0.001
+        with open(definitions_path, 'w') as f:
+            json.dump([self.to_definition(self.file_definitions[0])], f)
+        daemon = FileRipperDaemon(DefinitionRegistry(definitions_path), interval_minutes=60, reload_seconds=0.05)
+
+        async def add_definition_and_stop():
+            await asyncio.sleep(0.2)
+            with open(definitions_path, 'w') as f:
+                json.dump([self.to_definition(fd) for fd in self.file_definitions], f)
+            stat = os.stat(definitions_path)
+            os.utime(definitions_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            await asyncio.sleep(0.3)
+            daemon.stop()
+
+        async def run():
+            await asyncio.gather(daemon.run(), add_definition_and_stop())
+
+        asyncio.run(run())
+        for file_definition in self.file_definitions:
+            self.assert_ripped(file_definition)
+
+    def test_replaced_definition_waits_for_in_flight_rip(self):
+        daemon = FileRipperDaemon(self.file_definitions[:1])
+        release = threading.Event()
+        started = []
+
+        async def rip(file_definition):
+            await daemon._run_in_thread(file_definition, release.wait)
+
+        async def schedule(file_definition):
+            started.append(file_definition)
+
+        async def run():
+            async with daemon._running():
+                schedules = {}
+                daemon._update_schedules(schedules, rip)
+                await asyncio.sleep(0.1)
+                daemon.file_definitions = self.file_definitions[1:]
+                daemon._update_schedules(schedules, schedule)
+                await asyncio.sleep(0.1)
+                started_before_release = list(started)
+                release.set()
+                await asyncio.wait_for(schedules[id(self.file_definitions[1])][1], timeout=10)
+                return started_before_release
+
+        try:
+            self.assertEqual([], asyncio.run(run()))
+        finally:
+            release.set()
+        self.assertEqual(self.file_definitions[1:], started)
+
+    def test_invalid_max_concurrency(self):
+        with self.assertRaises(ValueError):
+            FileRipperDaemon(self.file_definitions, max_concurrency=0)
@@ -1,3 +1,4 @@
+import pickle
 from unittest import TestCase
 
 import file_ripper.fileconstants as fc
@@ -29,6 +30,16 @@ class TestFieldDefinitionConstruction(TestCase):
         field_definition = FieldDefinition('name', fc.XML, xml_node_name='')
         self.assertEqual('name', field_definition.xml_node_name)
 
+    def test_data_type_defaults_to_string(self):
+        self.assertEqual(fc.STRING, FieldDefinition('name', fc.XML).data_type)
+
+    def test_data_type_is_upper_cased(self):
+        self.assertEqual(fc.INT, FieldDefinition('age', fc.XML, data_type='int').data_type)
+
+    def test_data_type_invalid(self):
+        with self.assertRaises(ValueError):
+            FieldDefinition('age', fc.XML, data_type='integer')
+
 
 class TestFieldDefinitionCreateFromDict(TestCase):
     def setUp(self) -> None:
@@ -37,7 +48,9 @@ class TestFieldDefinitionCreateFromDict(TestCase):
             fc.START_POSITION: 10,
             fc.FIELD_LENGTH: 5,
             fc.XML_NODE_NAME: 'personAge',
-            fc.POSITION_IN_ROW: 0
+            fc.POSITION_IN_ROW: 0,
+            'dataType': fc.DATE,
+            'dataFormat': '%m/%d/%Y',
         })
 
     def test_file_type_set(self):
@@ -55,6 +68,12 @@ class TestFieldDefinitionCreateFromDict(TestCase):
     def test_xml_node_name_set(self):
         self.assertEqual('personAge', self.field_definition.xml_node_name)
 
+    def test_data_type_set(self):
+        self.assertEqual(fc.DATE, self.field_definition.data_type)
+
+    def test_data_format_set(self):
+        self.assertEqual('%m/%d/%Y', self.field_definition.data_format)
+
 
 class TestFileDefinitionConstruction(TestCase):
     def setUp(self) -> None:
@@ -103,6 +122,142 @@ class TestFileDefinitionConstruction(TestCase):
         with self.assertRaises(ValueError):
             FileDefinition(fc.XML, [self.field_definition], record_xml_element='')
 
+    def test_record_length_invalid(self):
+        with self.assertRaises(ValueError):
+            FileDefinition(fc.FIXED, [self.field_definition], record_length=0)
+
+    def test_time_interval_invalid(self):
+        with self.assertRaises(ValueError):
+            FileDefinition(fc.FIXED, [self.field_definition], time_interval=0)
+
+    def test_xml_engine_defaults_to_etree(self):
+        self.assertEqual(fc.ETREE, self.file_definition.xml_engine)
+
+    def test_xml_engine_is_upper_cased(self):
+        file_definition = FileDefinition(fc.XML, [self.field_definition], record_xml_element='person',
+                                         xml_engine='lxml')
+        self.assertEqual(fc.LXML, file_definition.xml_engine)
+
+    def test_xml_engine_invalid(self):
+        with self.assertRaises(ValueError):
+            FileDefinition(fc.XML, [self.field_definition], record_xml_element='person', xml_engine='sax')
+
+    def test_delimited_engine_defaults_to_split(self):
+        self.assertEqual(fc.SPLIT, self.file_definition.delimited_engine)
+
+    def test_delimited_engine_is_upper_cased(self):
+        file_definition = FileDefinition(fc.DELIMITED, [self.field_definition], delimiter=',', delimited_engine='csv',
+                                          quote_char="'", escape_char='\\')
+        self.assertEqual(fc.CSV, file_definition.delimited_engine)
+        self.assertEqual("'", file_definition.quote_char)
+        self.assertEqual('\\', file_definition.escape_char)
+
+    def test_delimited_engine_invalid(self):
+        with self.assertRaises(ValueError):
+            FileDefinition(fc.DELIMITED, [self.field_definition], delimiter=',', delimited_engine='pandas')
+
+    def test_csv_engine_delimiter_too_long(self):
+        with self.assertRaises(ValueError):
+            FileDefinition(fc.DELIMITED, [self.field_definition], delimiter='||', delimited_engine='csv')
+
+    def test_quote_char_too_long(self):
+        with self.assertRaises(ValueError):
+            FileDefinition(fc.DELIMITED, [self.field_definition], delimiter=',', quote_char='""')
+
+    def test_output_format_is_upper_cased(self):
+        file_definition = FileDefinition(fc.DELIMITED, [self.field_definition], delimiter=',', output_format='jsonl',
+                                         output_path='output')
+        self.assertEqual(fc.JSONL, file_definition.output_format)
+        self.assertEqual('output', file_definition.output_path)
+
+    def test_output_format_invalid(self):
+        with self.assertRaises(ValueError):
+            FileDefinition(fc.DELIMITED, [self.field_definition], delimiter=',', output_format='xlsx')
+
+    def test_error_policy_defaults_to_fail_fast(self):
+        self.assertEqual(fc.FAIL_FAST, self.file_definition.error_policy)
+
+    def test_error_policy_is_upper_cased(self):
+        file_definition = FileDefinition(fc.DELIMITED, [self.field_definition], delimiter=',',
+                                         error_policy='quarantine', quarantine_path='rejects')
+        self.assertEqual(fc.QUARANTINE, file_definition.error_policy)
+        self.assertEqual('rejects', file_definition.quarantine_path)
+
+    def test_error_policy_invalid(self):
+        with self.assertRaises(ValueError):
+            FileDefinition(fc.DELIMITED, [self.field_definition], delimiter=',', error_policy='ignore')
+
+    def test_project(self):
+        age = FieldDefinition('age', 'XML')
+        file_definition = FileDefinition('XML', [self.field_definition, age], record_xml_element='person')
+        projection = file_definition.project(['age'])
+        self.assertEqual([age], projection.field_definitions)
+        self.assertEqual('person', projection.record_xml_element)
+        self.assertEqual(2, len(file_definition.field_definitions))
+
+    def test_project_without_columns(self):
+        self.assertIs(self.file_definition, self.file_definition.project(None))
+
+    def test_project_empty_columns(self):
+        with self.assertRaises(ValueError):
+            self.file_definition.project([])
+
+    def test_project_unknown_column(self):
+        with self.assertRaises(ValueError):
+            self.file_definition.project(['age'])
+
+    def test_record_layouts(self):
+        layouts = {'H': [FieldDefinition('date', fc.FIXED, 1, 8)], 'D': [FieldDefinition('name', fc.FIXED, 1, 13)]}
+        file_definition = FileDefinition(fc.FIXED, [], record_layouts=layouts, record_code_length=1)
+        self.assertEqual(layouts, file_definition.record_layouts)
+        self.assertEqual(0, file_definition.record_code_position)
+
+    def test_record_layouts_require_record_code_length(self):
+        with self.assertRaises(ValueError):
+            FileDefinition(fc.FIXED, [], record_layouts={'D': [FieldDefinition('name', fc.FIXED, 1, 13)]})
+
+    def test_record_layouts_only_for_fixed(self):
+        with self.assertRaises(ValueError):
+            FileDefinition(fc.XML, [], record_xml_element='person', record_code_length=1,
+                           record_layouts={'D': [self.field_definition]})
+
+    def test_project_record_layouts(self):
+        name = FieldDefinition('name', fc.FIXED, 1, 13)
+        file_definition = FileDefinition(fc.FIXED, [], record_code_length=1, record_layouts={
+            'H': [FieldDefinition('date', fc.FIXED, 1, 8)], 'D': [name, FieldDefinition('age', fc.FIXED, 14, 3)],
+        })
+        projection = file_definition.project(['name'])
+        self.assertEqual({'H': [], 'D': [name]}, projection.record_layouts)
+        with self.assertRaises(ValueError):
+            file_definition.project(['salary'])
+
+    def test_pickle_round_trip(self):
+        self.assertEqual(self.file_definition, pickle.loads(pickle.dumps(self.file_definition)))
+
+
+class TestFileDefinitionCreateMultiRecordFromDict(TestCase):
+    def setUp(self) -> None:
+        self.file_definition = FileDefinition.create_from_dict({
+            'fileType': fc.FIXED,
+            'recordCodePosition': 0,
+            'recordCodeLength': 1,
+            'recordLayouts': {
+                'H': [{'fieldName': 'date', 'startPosition': 1, 'fieldLength': 8}],
+                'D': [{'fieldName': 'name', 'startPosition': 1, 'fieldLength': 13}],
+            },
+        })
+
+    def test_field_definitions(self):
+        self.assertEqual([], self.file_definition.field_definitions)
+
+    def test_record_layouts(self):
+        self.assertEqual(['H', 'D'], list(self.file_definition.record_layouts))
+        self.assertEqual('name', self.file_definition.record_layouts['D'][0].field_name)
+        self.assertEqual(fc.FIXED, self.file_definition.record_layouts['D'][0].file_type)
+
+    def test_record_code_length(self):
+        self.assertEqual(1, self.file_definition.record_code_length)
+
 
 class TestFileDefinitionCreateDelimitedFromDict(TestCase):
     def setUp(self) -> None:
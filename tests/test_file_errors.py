@@ -0,0 +1,244 @@
+import csv
+import io
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+import file_ripper.fileconstants as fc
+from file_ripper.filedefinition import FileDefinition, FieldDefinition
+from file_ripper.fileerrors import LineCounter, RecordError, RecordErrorHandler, quarantine_file_name
+from file_ripper.filefilters import FieldIn
+from file_ripper.fileripper import (
+    find_and_rip_files, pipe_file, rip_file, rip_file_batches, rip_file_columnar, rip_file_iter, store_file
+)
+
+
+class FileErrorsTests(TestCase):
+    def setUp(self) -> None:
+        self.directory = os.path.abspath('error-files')
+        os.makedirs(self.directory)
+        self.file_name = os.path.join(self.directory, 'people.txt')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def write_file(self, text):
+        with open(self.file_name, 'w') as f:
+            f.write(text)
+
+    def default_quarantine_file_name(self):
+        return os.path.join(self.directory, 'quarantine', 'people.txt.quarantine')
+
+    def read_quarantine(self, file_name=None):
+        with open(file_name or self.default_quarantine_file_name()) as f:
+            return [RecordError.from_json(line) for line in f]
+
+
+class RecordErrorHandlerTests(FileErrorsTests):
+    def create_file_definition(self, error_policy, quarantine_path=''):
+        return FileDefinition(fc.FIXED, [FieldDefinition('name', fc.FIXED, 0, 5)], error_policy=error_policy,
+                              quarantine_path=quarantine_path)
+
+    def test_fail_fast_raises(self):
+        handler = RecordErrorHandler(self.create_file_definition(fc.FAIL_FAST), self.file_name)
+        with self.assertRaises(IndexError):
+            handler(3, 'abc', IndexError('string index out of range'))
+
+    def test_skip_collects(self):
+        errors = []
+        with RecordErrorHandler(self.create_file_definition(fc.SKIP), self.file_name, errors) as handler:
+            handler(3, 'abc', IndexError('string index out of range'))
+        self.assertEqual([RecordError(3, 'abc', 'IndexError: string index out of range')], errors)
+        self.assertEqual([], os.listdir(self.directory))
+
+    def test_quarantine_writes_side_file(self):
+        with RecordErrorHandler(self.create_file_definition(fc.QUARANTINE), self.file_name) as handler:
+            handler(3, 'abc', IndexError('string index out of range'))
+            handler(7, 'x"y', ValueError('bad'))
+        self.assertEqual(handler.errors, self.read_quarantine())
+        with open(self.default_quarantine_file_name()) as f:
+            self.assertEqual({'lineNumber': 3, 'rawText': 'abc', 'error': 'IndexError: string index out of range'},
+                             json.loads(f.readline()))
+
+    def test_quarantine_without_errors_writes_nothing(self):
+        with RecordErrorHandler(self.create_file_definition(fc.QUARANTINE), self.file_name):
+            pass
+        self.assertEqual([], os.listdir(self.directory))
+
+    def test_quarantine_path(self):
+        quarantine_path = os.path.join(self.directory, 'quarantine')
+        file_definition = self.create_file_definition(fc.QUARANTINE, quarantine_path)
+        self.assertEqual(os.path.join(quarantine_path, 'people.txt.quarantine'),
+                         quarantine_file_name(file_definition, self.file_name))
+
+    def test_quarantine_default_directory(self):
+        file_definition = self.create_file_definition(fc.QUARANTINE)
+        self.assertEqual(self.default_quarantine_file_name(), quarantine_file_name(file_definition, self.file_name))
+
+    def test_quarantine_requires_file_name(self):
+        with self.assertRaises(ValueError):
+            RecordErrorHandler(self.create_file_definition(fc.QUARANTINE), None)
+
+    def test_line_counter(self):
+        lines = LineCounter(io.StringIO('a\nb\nc\n'))
+        self.assertEqual(0, lines.line_number)
+        self.assertEqual('a\n', next(lines))
+        self.assertEqual(['b\n', 'c\n'], list(lines))
+        self.assertEqual(3, lines.line_number)
+
+
+class FixedWidthErrorPolicyTests(FileErrorsTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.write_file('Name    Age\nAaron   39\nGene\nMason   12\n\nXander  04\n')
+        self.file_definition = FileDefinition(fc.FIXED, [
+            FieldDefinition('name', fc.FIXED, 0, 8),
+            FieldDefinition('age', fc.FIXED, 8, 2),
+        ], has_header=True)
+
+    def rip(self, rip=rip_file, **kwargs):
+        with open(self.file_name, 'r') as file:
+            return rip(file, self.file_definition, **kwargs)
+
+    def test_fail_fast(self):
+        with self.assertRaises(IndexError):
+            self.rip()
+
+    def test_skip(self):
+        self.file_definition.error_policy = fc.SKIP
+        file_instance = self.rip()
+        self.assertEqual(['Aaron', 'Mason', 'Xander'], [row['name'] for row in file_instance])
+        self.assertEqual([3, 5], [error.line_number for error in file_instance.errors])
+        self.assertEqual(['Gene', ''], [error.raw_text for error in file_instance.errors])
+        self.assertTrue(file_instance.errors[0].error.startswith('IndexError'))
+        self.assertFalse(os.path.exists(self.default_quarantine_file_name()))
+
+    def test_skip_is_not_serialized(self):
+        self.file_definition.error_policy = fc.SKIP
+        self.assertNotIn('errors', json.loads(self.rip().to_json()))
+
+    def test_quarantine(self):
+        self.file_definition.error_policy = fc.QUARANTINE
+        file_instance = self.rip()
+        self.assertEqual(3, len(file_instance))
+        self.assertEqual(file_instance.errors, self.read_quarantine())
+
+    def test_quarantine_lazy_rip(self):
+        self.file_definition.error_policy = fc.QUARANTINE
+        with open(self.file_name, 'r') as file:
+            file_instance = rip_file_iter(file, self.file_definition)
+            self.assertEqual([], file_instance.errors)
+            self.assertEqual(3, len(list(file_instance)))
+        self.assertEqual([3, 5], [error.line_number for error in self.read_quarantine()])
+
+    def test_quarantine_is_not_ripped_again(self):
+        self.file_definition.error_policy = fc.QUARANTINE
+        self.file_definition.input_directory = self.directory
+        self.file_definition.completed_directory = os.path.join(self.directory, 'completed')
+        self.file_definition.file_mask = '*'
+        first = find_and_rip_files(self.file_definition)
+        self.assertEqual([3], [len(file_instance) for file_instance in first])
+        self.write_file('Name    Age\nGene\nMason   12\n')
+        second = find_and_rip_files(self.file_definition)
+        self.assertEqual([['Mason']], [[row['name'] for row in file_instance] for file_instance in second])
+        self.assertEqual(['people.txt'], os.listdir(self.file_definition.completed_directory))
+        self.assertEqual([2], [error.line_number for error in self.read_quarantine()])
+
+    def test_skip_with_where(self):
+        self.file_definition.error_policy = fc.SKIP
+        file_instance = self.rip(where=FieldIn('name', ['Aaron', 'Gene', 'Xander', '']))
+        self.assertEqual(['Aaron', 'Xander'], [row['name'] for row in file_instance])
+        self.assertEqual([3, 5], [error.line_number for error in file_instance.errors])
+
+    def test_skip_columnar(self):
+        self.file_definition.error_policy = fc.SKIP
+        file_instance = self.rip(rip_file_columnar)
+        self.assertEqual(['Aaron', 'Mason', 'Xander'], file_instance.column('name'))
+        self.assertEqual(2, len(file_instance.errors))
+
+    def test_skip_batches(self):
+        self.file_definition.error_policy = fc.SKIP
+        with open(self.file_name, 'r') as file:
+            batches = rip_file_batches(file, self.file_definition, batch_size=2, columnar=True)
+            self.assertEqual([['Aaron', 'Mason'], ['Xander']], [batch['name'] for batch in batches])
+        self.assertEqual([3, 5], [error.line_number for error in batches.errors])
+
+    def test_skip_pipeline(self):
+        self.file_definition.error_policy = fc.SKIP
+        rows = []
+        with open(self.file_name, 'r') as file:
+            row_count, errors = pipe_file(file, self.file_definition, rows.extend, batch_size=2)
+        self.assertEqual(['Aaron', 'Mason', 'Xander'], [row['name'] for row in rows])
+        self.assertEqual((3, [3, 5]), (row_count, [error.line_number for error in errors]))
+
+    def test_skip_store_file(self):
+        self.file_definition.error_policy = fc.SKIP
+        self.file_definition.output_format = fc.JSONL
+        self.file_definition.output_path = os.path.join(self.directory, 'output')
+        with open(self.file_name, 'r') as file:
+            row_count, errors = store_file(file, self.file_definition)
+        self.assertEqual((3, [3, 5]), (row_count, [error.line_number for error in errors]))
+
+    def test_skip_is_not_ripped_in_chunks(self):
+        self.file_definition.error_policy = fc.SKIP
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            file_instance = self.rip(executor=executor, chunk_size=8)
+        self.assertEqual([3, 5], [error.line_number for error in file_instance.errors])
+
+    def test_multi_record_unknown_code(self):
+        self.write_file('DAaron\nX0000\nDGenes\n')
+        self.file_definition = FileDefinition(fc.FIXED, [], record_code_length=1, error_policy=fc.SKIP,
+                                              record_layouts={'D': [FieldDefinition('name', fc.FIXED, 1, 5)]})
+        file_instance = self.rip()
+        self.assertEqual(['Aaron', 'Genes'], [row['name'] for row in file_instance])
+        self.assertEqual([RecordError(2, 'X0000', "ValueError: no record layout is defined for record code 'X'")],
+                         file_instance.errors)
+
+
+class DelimitedErrorPolicyTests(FileErrorsTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.file_definition = FileDefinition(fc.DELIMITED, [
+            FieldDefinition('name', fc.DELIMITED, position_in_row=0),
+            FieldDefinition('age', fc.DELIMITED, position_in_row=1),
+        ], delimiter=',', has_header=True, error_policy=fc.QUARANTINE)
+
+    def rip(self):
+        with open(self.file_name, 'r') as file:
+            return rip_file(file, self.file_definition)
+
+    def test_split_engine_missing_column(self):
+        self.write_file('name,age\nAaron,39\nGene\nMason,12\n')
+        file_instance = self.rip()
+        self.assertEqual(['Aaron', 'Mason'], [row['name'] for row in file_instance])
+        self.assertEqual([RecordError(3, 'Gene', 'IndexError: list index out of range')], self.read_quarantine())
+
+    def test_csv_engine_quarantine_keeps_quoting(self):
+        self.file_definition.delimited_engine = fc.CSV
+        self.write_file('name,age\n"Smith, John","say ""hi"""\n"Jones, ""JJ"""\n')
+        file_instance = self.rip()
+        self.assertEqual(['Smith, John'], [row['name'] for row in file_instance])
+        raw_text = self.read_quarantine()[0].raw_text
+        self.assertEqual('"Jones, ""JJ"""', raw_text)
+        self.assertEqual([['Jones, "JJ"']], list(csv.reader([raw_text])))
+
+    def test_csv_engine_reports_last_line_of_record(self):
+        self.file_definition.delimited_engine = fc.CSV
+        self.write_file('name,age\n"Aaron\nSmith",39\n"Gene"\nMason,12\n')
+        file_instance = self.rip()
+        self.assertEqual(['Aaron\nSmith', 'Mason'], [row['name'] for row in file_instance])
+        self.assertEqual([(4, 'Gene')], [(error.line_number, error.raw_text) for error in file_instance.errors])
+
+
+class XmlErrorPolicyTests(FileErrorsTests):
+    def test_missing_node_is_numbered_by_record(self):
+        self.write_file('<people><person><name>Aaron</name></person><person><age>61</age></person></people>')
+        file_definition = FileDefinition(fc.XML, [FieldDefinition('name', fc.XML)], record_xml_element='person',
+                                         error_policy=fc.SKIP)
+        with open(self.file_name, 'r') as file:
+            file_instance = rip_file(file, file_definition)
+        self.assertEqual(['Aaron'], [row['name'] for row in file_instance])
+        self.assertEqual(2, file_instance.errors[0].line_number)
+        self.assertEqual('<person><age>61</age></person>', file_instance.errors[0].raw_text)
@@ -0,0 +1,154 @@
+import os
+from unittest import TestCase
+from xml.etree.ElementTree import fromstring
+
+import file_ripper.fileconstants as fc
+from file_ripper.filedefinition import FileDefinition, FieldDefinition
+from file_ripper.filefilters import FieldEquals, FieldIn, FieldPrefix, RecordCode, compile_record_filter
+from file_ripper.fileripper import find_and_rip_files, rip_file, rip_file_iter
+
+
+class CompileRecordFilterTests(TestCase):
+    def setUp(self) -> None:
+        self.fixed_definition = FileDefinition(fc.FIXED, [
+            FieldDefinition('type', fc.FIXED, 0, 2),
+            FieldDefinition('name', fc.FIXED, 2, 10),
+        ])
+        self.delimited_definition = FileDefinition(fc.DELIMITED, [
+            FieldDefinition('type', fc.DELIMITED, position_in_row=0),
+            FieldDefinition('name', fc.DELIMITED, position_in_row=1),
+        ], delimiter='|')
+        self.xml_definition = FileDefinition(fc.XML, [
+            FieldDefinition('type', fc.XML, xml_node_name='recordType'),
+            FieldDefinition('name', fc.XML),
+        ], record_xml_element='record')
+
+    def test_no_filter(self):
+        self.assertIsNone(compile_record_filter(None, self.fixed_definition))
+        self.assertIsNone(compile_record_filter([], self.fixed_definition))
+
+    def test_field_equals_fixed(self):
+        matches = compile_record_filter(FieldEquals('name', 'Aaron'), self.fixed_definition)
+        self.assertTrue(matches('01Aaron     \n'))
+        self.assertFalse(matches('01Gene      \n'))
+        self.assertFalse(matches('01\n'))
+
+    def test_field_in_delimited(self):
+        matches = compile_record_filter(FieldIn('type', ['01', '02']), self.delimited_definition)
+        self.assertTrue(matches(['02 ', 'Aaron\n']))
+        self.assertFalse(matches(['03', 'Aaron\n']))
+
+    def test_field_in_delimited_short_row(self):
+        matches = compile_record_filter(FieldIn('name', ['Aaron']), self.delimited_definition)
+        self.assertFalse(matches(['01']))
+
+    def test_field_in_csv_keeps_whitespace(self):
+        self.delimited_definition.delimited_engine = fc.CSV
+        matches = compile_record_filter(FieldIn('type', ['01']), self.delimited_definition)
+        self.assertFalse(matches(['01 ', 'Aaron']))
+
+    def test_field_prefix_xml(self):
+        matches = compile_record_filter(FieldPrefix('type', 'A'), self.xml_definition)
+        self.assertTrue(matches(fromstring('<record><recordType>AB</recordType></record>')))
+        self.assertFalse(matches(fromstring('<record><recordType>BA</recordType></record>')))
+        self.assertFalse(matches(fromstring('<record><name>Aaron</name></record>')))
+
+    def test_record_code(self):
+        matches = compile_record_filter(RecordCode('01'), self.fixed_definition)
+        self.assertTrue(matches('01Aaron     \n'))
+        self.assertFalse(matches('02Aaron     \n'))
+
+    def test_record_code_offset(self):
+        matches = compile_record_filter(RecordCode('Aa', start_position=2), self.fixed_definition)
+        self.assertTrue(matches('01Aaron     \n'))
+
+    def test_record_code_only_for_fixed(self):
+        with self.assertRaises(ValueError):
+            compile_record_filter(RecordCode('01'), self.delimited_definition)
+
+    def test_filters_are_combined(self):
+        matches = compile_record_filter([RecordCode('01'), FieldPrefix('name', 'G')], self.fixed_definition)
+        self.assertTrue(matches('01Gene      \n'))
+        self.assertFalse(matches('01Aaron     \n'))
+        self.assertFalse(matches('02Gene      \n'))
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            compile_record_filter(FieldEquals('age', '39'), self.fixed_definition)
+
+
+class RipFileWhereTests(TestCase):
+    def setUp(self) -> None:
+        self.file_name = 'Valid-filtered-09032019.txt'
+        with open(self.file_name, 'w') as f:
+            f.write('HD20190903\n')
+            f.write('01Aaron        39\n')
+            f.write('02Extra\n')
+            f.write('01Gene         61\n')
+            f.write('TR0002\n')
+        self.file_definition = FileDefinition(fc.FIXED, [
+            FieldDefinition('type', fc.FIXED, 0, 2),
+            FieldDefinition('name', fc.FIXED, 2, 13),
+            FieldDefinition('age', fc.FIXED, 15, 2),
+        ], input_directory=os.getcwd(), file_mask=self.file_name)
+
+    def tearDown(self) -> None:
+        os.remove(self.file_name)
+
+    def test_record_code_skips_other_record_types(self):
+        with open(self.file_name, 'r') as file:
+            file_instance = rip_file(file, self.file_definition, where=RecordCode('01'))
+        self.assertEqual(['Aaron', 'Gene'], [row['name'] for row in file_instance])
+
+    def test_where_and_columns(self):
+        with open(self.file_name, 'r') as file:
+            file_instance = rip_file(file, self.file_definition, columns=['name'],
+                                     where=[RecordCode('01'), FieldEquals('age', '61')])
+        self.assertEqual([{'name': 'Gene'}], [row.fields.to_dict() for row in file_instance])
+
+    def test_where_in_chunks(self):
+        with open(self.file_name, 'r') as file:
+            file_instance = rip_file(file, self.file_definition, workers=2, chunk_size=10, where=RecordCode('01'))
+        self.assertEqual(['Aaron', 'Gene'], [row['name'] for row in file_instance])
+
+    def test_rip_file_iter_where(self):
+        with open(self.file_name, 'r') as file:
+            self.assertEqual(1, len(list(rip_file_iter(file, self.file_definition, where=FieldEquals('name', 'Gene')))))
+
+    def test_find_and_rip_files_where(self):
+        file_instances = find_and_rip_files(self.file_definition, where=FieldIn('type', ['01']))
+        self.assertEqual(2, len(file_instances[0]))
+
+    def test_where_delimited(self):
+        with open(self.file_name, 'w') as f:
+            f.write('type|name\n01|Aaron\n02|Extra\n01|Gene\n')
+        file_definition = FileDefinition(fc.DELIMITED, [
+            FieldDefinition('type', fc.DELIMITED, position_in_row=0),
+            FieldDefinition('name', fc.DELIMITED, position_in_row=1),
+        ], delimiter='|', has_header=True)
+        for engine in fc.DELIMITED_ENGINES:
+            file_definition.delimited_engine = engine
+            with open(self.file_name, 'r') as file:
+                file_instance = rip_file(file, file_definition, where=FieldEquals('type', '01'))
+            self.assertEqual(['Aaron', 'Gene'], [row['name'] for row in file_instance])
+
+    def test_where_xml(self):
+        with open(self.file_name, 'w') as f:
+            f.write('<records><record><type>01</type><name>Aaron</name></record>'
+                    '<record><type>02</type><name>Extra</name></record></records>')
+        file_definition = FileDefinition(fc.XML, [
+            FieldDefinition('type', fc.XML),
+            FieldDefinition('name', fc.XML),
+        ], record_xml_element='record')
+        with open(self.file_name, 'r') as file:
+            file_instance = rip_file(file, file_definition, where=FieldPrefix('type', '02'))
+        self.assertEqual(['Extra'], [row['name'] for row in file_instance])
+
+    def test_where_record_layouts(self):
+        file_definition = FileDefinition(fc.FIXED, [], record_code_length=2, record_layouts={
+            'HD': [], 'TR': [], '02': [],
+            '01': [FieldDefinition('name', fc.FIXED, 2, 13), FieldDefinition('age', fc.FIXED, 15, 2)],
+        })
+        with open(self.file_name, 'r') as file:
+            file_instance = rip_file(file, file_definition, where=FieldEquals('age', '61'))
+        self.assertEqual(['Gene'], [row['name'] for row in file_instance])
@@ -1,6 +1,7 @@
+import pickle
 from unittest import TestCase
 
-from file_ripper.fileinstance import FileRow, FileInstance
+from file_ripper.fileinstance import FileRow, FileInstance, ColumnarFileInstance, LazyFileInstance, RowSchema
 
 
 class TestFileRowConstruction(TestCase):
@@ -201,3 +202,164 @@ class TestFileInstanceEquality(TestCase):
 
     def test_different_file_rows(self):
         self.assertFalse(FileInstance(self.file_name, self.file_rows) == FileInstance(self.file_name, [FileRow({})]))
+
+
+class TestLazyFileInstance(TestCase):
+    def setUp(self) -> None:
+        self.file_rows = [FileRow({'name': 'Aaron', 'age': '39'}), FileRow({'name': 'Gene', 'age': '61'})]
+        self.file_instance = LazyFileInstance('file_name', (row for row in self.file_rows))
+
+    def test_iter(self):
+        self.assertEqual(self.file_rows, list(self.file_instance))
+
+    def test_iter_twice(self):
+        list(self.file_instance)
+        with self.assertRaises(TypeError):
+            iter(self.file_instance)
+
+    def test_len(self):
+        with self.assertRaises(TypeError):
+            len(self.file_instance)
+
+    def test_indexing(self):
+        with self.assertRaises(TypeError):
+            self.file_instance[0]
+
+    def test_to_json(self):
+        with self.assertRaises(TypeError):
+            self.file_instance.to_json()
+
+    def test_to_file_instance(self):
+        file_instance = self.file_instance.to_file_instance()
+        self.assertEqual(FileInstance('file_name', self.file_rows), file_instance)
+        self.assertEqual(2, len(file_instance))
+
+    def test_to_columnar(self):
+        self.assertEqual(['Aaron', 'Gene'], self.file_instance.to_columnar().column('name'))
+
+
+class TestColumnarFileInstance(TestCase):
+    def setUp(self) -> None:
+        self.file_rows = [FileRow({'name': 'Aaron', 'age': '39'}), FileRow({'name': 'Gene', 'age': '61'}),
+                          FileRow({'name': 'Xander', 'age': '4'})]
+        self.file_instance = ColumnarFileInstance.from_rows('file_name', self.file_rows, ['name', 'age'])
+
+    def test_columns(self):
+        self.assertEqual({'name': ['Aaron', 'Gene', 'Xander'], 'age': ['39', '61', '4']}, self.file_instance.columns)
+
+    def test_column(self):
+        self.assertEqual(['39', '61', '4'], self.file_instance.column('age'))
+
+    def test_field_names(self):
+        self.assertEqual(['name', 'age'], self.file_instance.field_names)
+
+    def test_field_names_from_first_row(self):
+        file_instance = ColumnarFileInstance.from_rows('file_name', iter(self.file_rows))
+        self.assertEqual(['name', 'age'], file_instance.field_names)
+        self.assertEqual(3, len(file_instance))
+
+    def test_no_rows(self):
+        self.assertEqual(0, len(ColumnarFileInstance.from_rows('file_name', [])))
+
+    def test_len(self):
+        self.assertEqual(3, len(self.file_instance))
+
+    def test_row(self):
+        self.assertEqual(self.file_rows[1], self.file_instance.row(1))
+
+    def test_indexing(self):
+        self.assertEqual(self.file_rows[2], self.file_instance[2])
+        self.assertEqual(self.file_rows[-1], self.file_instance[-1])
+
+    def test_slicing(self):
+        self.assertEqual(self.file_rows[1:], self.file_instance[1:])
+
+    def test_index_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.file_instance.row(3)
+
+    def test_iter(self):
+        self.assertEqual(self.file_rows, list(self.file_instance))
+
+    def test_contains(self):
+        self.assertTrue(FileRow({'name': 'Gene', 'age': '61'}) in self.file_instance)
+        self.assertFalse(FileRow({'name': 'Gene', 'age': '62'}) in self.file_instance)
+
+    def test_to_columnar(self):
+        self.assertEqual(self.file_instance, FileInstance('file_name', self.file_rows).to_columnar())
+
+    def test_to_json(self):
+        self.assertEqual('{"fileName": "file_name", "columns": {"name": ["Aaron", "Gene", "Xander"], '
+                         '"age": ["39", "61", "4"]}}', self.file_instance.to_json())
+
+
+class TestRowSchema(TestCase):
+    def setUp(self) -> None:
+        self.schema = RowSchema(['name', 'age'])
+
+    def test_field_names(self):
+        self.assertEqual(('name', 'age'), self.schema.field_names)
+
+    def test_positions(self):
+        self.assertEqual({'name': 0, 'age': 1}, self.schema.positions)
+
+    def test_create_row(self):
+        row = self.schema.create_row(('Aaron', '39'))
+        self.assertTrue(isinstance(row, FileRow))
+        self.assertIs(self.schema, row.fields.schema)
+
+    def test_equality(self):
+        self.assertEqual(RowSchema(['name', 'age']), self.schema)
+        self.assertNotEqual(RowSchema(['age', 'name']), self.schema)
+
+
+class TestSchemaFileRow(TestCase):
+    def setUp(self) -> None:
+        self.schema = RowSchema(['name', 'age', 'dob'])
+        self.row = self.schema.create_row(('Xander', '6', '11/22/63'))
+
+    def test_indexing(self):
+        self.assertEqual('Xander', self.row['name'])
+        self.assertEqual('11/22/63', self.row['dob'])
+
+    def test_missing_key(self):
+        with self.assertRaises(KeyError):
+            self.row['addr']
+
+    def test_contains(self):
+        self.assertTrue('age' in self.row)
+        self.assertFalse('addr' in self.row)
+
+    def test_len(self):
+        self.assertEqual(3, len(self.row))
+
+    def test_iter(self):
+        self.assertEqual(['name', 'age', 'dob'], list(self.row))
+
+    def test_reversed(self):
+        self.assertEqual(['dob', 'age', 'name'], list(reversed(self.row)))
+
+    def test_fields_to_dict(self):
+        self.assertEqual({'name': 'Xander', 'age': '6', 'dob': '11/22/63'}, self.row.fields.to_dict())
+
+    def test_equals_dict_row(self):
+        self.assertEqual(FileRow({'name': 'Xander', 'age': '6', 'dob': '11/22/63'}), self.row)
+        self.assertEqual(self.row, FileRow({'name': 'Xander', 'age': '6', 'dob': '11/22/63'}))
+
+    def test_shared_schema_equality(self):
+        self.assertEqual(self.schema.create_row(['Xander', '6', '11/22/63']), self.row)
+        self.assertNotEqual(self.schema.create_row(('Xander', '7', '11/22/63')), self.row)
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(self.row, '__dict__'))
+        self.assertFalse(hasattr(self.row.fields, '__dict__'))
+
+    def test_to_json(self):
+        self.assertEqual('{"fields": {"name": "Xander", "age": "6", "dob": "11/22/63"}}', self.row.to_json())
+
+    def test_pickle_round_trip(self):
+        self.assertEqual(self.row, pickle.loads(pickle.dumps(self.row)))
+
+    def test_file_instance_to_json(self):
+        self.assertEqual(FileInstance('file_name', [FileRow(self.row.fields.to_dict())]).to_json(),
+                         FileInstance('file_name', [self.row]).to_json())
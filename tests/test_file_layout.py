@@ -0,0 +1,114 @@
+from unittest import TestCase
+from xml.etree.ElementTree import fromstring
+
+import file_ripper.fileconstants as fc
+from file_ripper.filedefinition import FileDefinition, FieldDefinition
+from file_ripper.filelayout import DelimitedLayout, FixedWidthLayout, XmlLayout
+
+
+class FixedWidthLayoutTests(TestCase):
+    def setUp(self) -> None:
+        self.file_definition = FileDefinition(fc.FIXED, [
+            FieldDefinition('name', fc.FIXED, 0, 13),
+            FieldDefinition('age', fc.FIXED, 13, 9),
+            FieldDefinition('dob', fc.FIXED, 22, 10),
+        ])
+        self.layout = self.file_definition.create_fixed_width_layout()
+
+    def test_create_from_file_definition(self):
+        self.assertTrue(isinstance(self.layout, FixedWidthLayout))
+        self.assertEqual(('name', 'age', 'dob'), self.layout.field_names)
+
+    def test_slices(self):
+        self.assertEqual((slice(0, 13), slice(13, 22), slice(22, 32)), self.layout.slices)
+
+    def test_line_length(self):
+        self.assertEqual(32, self.layout.line_length)
+
+    def test_extract_values(self):
+        self.assertEqual(('Aaron', '39', '09/04/1980'),
+                         self.layout.extract_values('Aaron        39       09/04/1980\n'))
+
+    def test_call(self):
+        self.assertEqual({'name': 'Aaron', 'age': '39', 'dob': '09/04/1980'},
+                         self.layout('Aaron        39       09/04/1980\n'))
+
+    def test_single_field(self):
+        layout = FixedWidthLayout([FieldDefinition('name', fc.FIXED, 2, 5)])
+        self.assertEqual(('Aaron',), layout.extract_values('  Aaron\n'))
+
+    def test_line_too_short(self):
+        with self.assertRaises(IndexError) as context:
+            self.layout('Aaron        39       09/04\n')
+        self.assertEqual('field dob extends past the end of line', str(context.exception))
+
+
+class DelimitedLayoutTests(TestCase):
+    def setUp(self) -> None:
+        self.file_definition = FileDefinition(fc.DELIMITED, [
+            FieldDefinition('name', fc.DELIMITED, position_in_row=0),
+            FieldDefinition('age', fc.DELIMITED, position_in_row=4),
+            FieldDefinition('address', fc.DELIMITED, position_in_row=2, delimiter='&', field_definitions=[
+                FieldDefinition('city', fc.DELIMITED, position_in_row=1),
+                FieldDefinition('state', fc.DELIMITED, position_in_row=0),
+            ]),
+        ], delimiter='|')
+        self.layout = self.file_definition.create_delimited_layout()
+
+    def test_create_from_file_definition(self):
+        self.assertTrue(isinstance(self.layout, DelimitedLayout))
+        self.assertEqual(('name', 'age', 'address'), self.layout.field_names)
+        self.assertEqual((0, 4, 2), self.layout.positions)
+
+    def test_extract_values_projects_positions(self):
+        fields = 'Aaron |skipped|IA & Des Moines|skipped|39\n'.split('|')
+        self.assertEqual(('Aaron', '39', {'city': 'Des Moines', 'state': 'IA'}), self.layout.extract_values(fields))
+
+    def test_extract_values_without_strip(self):
+        layout = self.file_definition.create_delimited_layout(strip_method='')
+        self.assertEqual(' 39 ', layout(['Aaron', '', 'IA&Des Moines', '', ' 39 '])['age'])
+
+    def test_call(self):
+        self.assertEqual({'name': 'Aaron', 'age': '39', 'address': {'city': 'Des Moines', 'state': 'IA'}},
+                         self.layout(['Aaron', '', 'IA&Des Moines', '', '39']))
+
+    def test_row_too_short(self):
+        with self.assertRaises(IndexError):
+            self.layout.extract_values(['Aaron', '', 'IA&Des Moines'])
+
+
+class XmlLayoutTests(TestCase):
+    def setUp(self) -> None:
+        self.file_definition = FileDefinition(fc.XML, [
+            FieldDefinition('name', fc.XML, xml_node_name='fullName'),
+            FieldDefinition('age', fc.XML),
+            FieldDefinition('address', fc.XML, field_definitions=[
+                FieldDefinition('city', fc.XML),
+                FieldDefinition('zip', fc.XML, xml_node_name='zipCode'),
+            ]),
+        ], record_xml_element='person')
+        self.layout = self.file_definition.create_xml_layout()
+        self.element = fromstring('<person><age>39</age><fullName>Aaron</fullName><extra/>'
+                                  '<address><zipCode>50315</zipCode><city>Des Moines</city></address></person>')
+
+    def test_create_from_file_definition(self):
+        self.assertTrue(isinstance(self.layout, XmlLayout))
+        self.assertEqual(('name', 'age', 'address'), self.layout.field_names)
+        self.assertEqual(('fullName', 'age', 'address'), self.layout.node_names)
+
+    def test_extract_values_uses_xml_node_name(self):
+        self.assertEqual(('Aaron', '39', {'city': 'Des Moines', 'zip': '50315'}),
+                         self.layout.extract_values(self.element))
+
+    def test_call(self):
+        layout = XmlLayout(self.file_definition.field_definitions[:2])
+        self.assertEqual({'name': 'Aaron', 'age': '39'}, layout(self.element))
+
+    def test_first_matching_child_wins(self):
+        layout = XmlLayout([FieldDefinition('age', fc.XML)])
+        self.assertEqual(('39',), layout.extract_values(fromstring('<person><age>39</age><age>40</age></person>')))
+
+    def test_missing_node(self):
+        with self.assertRaises(AttributeError) as context:
+            self.layout.extract_values(fromstring('<person><fullName>Aaron</fullName></person>'))
+        self.assertEqual('xml node age is missing from person', str(context.exception))
@@ -0,0 +1,113 @@
+import os
+import shutil
+from unittest import TestCase
+
+import file_ripper.fileconstants as fc
+from file_ripper.filedefinition import FileDefinition, FieldDefinition
+from file_ripper.fileledger import FileLedger, hash_file, open_file_ledger
+from file_ripper.fileripper import find_and_rip_files, rip_new_file
+
+
+class FileLedgerTests(TestCase):
+    def setUp(self) -> None:
+        self.directory = os.path.abspath('ledger-files')
+        os.makedirs(self.directory)
+        self.ledger_file = os.path.join(self.directory, 'ledger.db')
+        self.file_name = self.write_file('a.txt', 'Aaron        39       09/04/1980\n')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def write_file(self, name, text):
+        file_name = os.path.join(self.directory, name)
+        with open(file_name, 'w') as f:
+            f.write(text)
+        return file_name
+
+    def change_mtime(self, file_name):
+        stat = os.stat(file_name)
+        os.utime(file_name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class FileLedgerRecordTests(FileLedgerTests):
+    def test_not_ripped(self):
+        with FileLedger(self.ledger_file) as ledger:
+            self.assertFalse(ledger.is_ripped(self.file_name))
+
+    def test_recorded_file_is_ripped(self):
+        with FileLedger(self.ledger_file) as ledger:
+            ledger.record(self.file_name)
+            self.assertTrue(ledger.is_ripped(self.file_name))
+            self.assertEqual(1, len(ledger))
+
+    def test_persisted_across_instances(self):
+        with FileLedger(self.ledger_file) as ledger:
+            ledger.record(self.file_name)
+        with FileLedger(self.ledger_file) as ledger:
+            self.assertTrue(ledger.is_ripped(self.file_name))
+        with FileLedger(self.ledger_file, preload=False) as ledger:
+            self.assertTrue(ledger.is_ripped(self.file_name))
+
+    def test_changed_file_is_not_ripped(self):
+        with FileLedger(self.ledger_file) as ledger:
+            ledger.record(self.file_name)
+            self.write_file('a.txt', 'Gene         61       01/15/1958\nMason        12       04/13/2007\n')
+            self.assertFalse(ledger.is_ripped(self.file_name))
+
+    def test_touched_file_without_hash_is_not_ripped(self):
+        with FileLedger(self.ledger_file) as ledger:
+            ledger.record(self.file_name)
+            self.change_mtime(self.file_name)
+            self.assertFalse(ledger.is_ripped(self.file_name))
+
+    def test_touched_file_with_same_hash_is_ripped(self):
+        with FileLedger(self.ledger_file, use_hash=True) as ledger:
+            ledger.record(self.file_name)
+            self.change_mtime(self.file_name)
+            self.assertTrue(ledger.is_ripped(self.file_name))
+
+    def test_same_size_different_content_with_hash_is_not_ripped(self):
+        with FileLedger(self.ledger_file, use_hash=True) as ledger:
+            ledger.record(self.file_name)
+            self.write_file('a.txt', 'Gene         61       01/15/1958\n')
+            self.change_mtime(self.file_name)
+            self.assertFalse(ledger.is_ripped(self.file_name))
+
+    def test_hash_file(self):
+        self.assertEqual(64, len(hash_file(self.file_name)))
+
+
+class FindAndRipFilesWithLedgerTests(FileLedgerTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.file_definition = FileDefinition(fc.FIXED, [FieldDefinition('name', fc.FIXED, 0, 13)],
+                                              input_directory=self.directory, file_mask='*.txt',
+                                              ledger_file=self.ledger_file)
+
+    def test_open_file_ledger_without_ledger_file(self):
+        self.file_definition.ledger_file = ''
+        with open_file_ledger(self.file_definition) as ledger:
+            self.assertIsNone(ledger)
+
+    def test_unchanged_files_are_skipped(self):
+        self.assertEqual(1, len(find_and_rip_files(self.file_definition)))
+        self.assertEqual(0, len(find_and_rip_files(self.file_definition)))
+        self.write_file('b.txt', 'Gene         61       01/15/1958\n')
+        file_instances = find_and_rip_files(self.file_definition)
+        self.assertEqual(1, len(file_instances))
+        self.assertTrue(file_instances[0].file_name.endswith('b.txt'))
+
+    def test_unchanged_files_are_skipped_with_workers(self):
+        self.assertEqual(1, len(find_and_rip_files(self.file_definition, workers=2)))
+        self.assertEqual(0, len(find_and_rip_files(self.file_definition, workers=2)))
+
+    def test_rip_new_file(self):
+        self.assertIsNotNone(rip_new_file(self.file_name, self.file_definition))
+        self.assertIsNone(rip_new_file(self.file_name, self.file_definition))
+
+    def test_failed_file_is_not_recorded(self):
+        self.write_file('b.txt', 'short\n')
+        with self.assertRaises(IndexError):
+            find_and_rip_files(self.file_definition)
+        with FileLedger(self.ledger_file) as ledger:
+            self.assertFalse(ledger.is_ripped(os.path.join(self.directory, 'b.txt')))
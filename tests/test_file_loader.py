@@ -0,0 +1,106 @@
+import importlib.util
+import json
+import unittest
+from unittest import TestCase
+
+import file_ripper.fileconstants as fc
+from file_ripper.fileloader import (
+    InvalidDefinitionsError, format_from_path, load_definitions, parse_definitions, validate_definitions_format
+)
+
+has_yaml = importlib.util.find_spec('yaml') is not None
+has_toml = importlib.util.find_spec('tomllib') is not None or importlib.util.find_spec('tomli') is not None
+
+YAML_DEFINITIONS = '''
+- fileType: DELIMITED
+  delimiter: "|"
+  fileMask: a-*.txt
+  fieldDefinitions:
+    - fieldName: name
+      positionInRow: 0
+- fileType: FIXED
+  fileMask: b-*.txt
+  fieldDefinitions:
+    - fieldName: name
+      startPosition: 0
+      fieldLength: 13
+'''
+
+TOML_DEFINITIONS = '''
+[[definitions]]
+fileType = "DELIMITED"
+delimiter = "|"
+fileMask = "a-*.txt"
+fieldDefinitions = [{fieldName = "name", positionInRow = 0}]
+
+[[definitions]]
+fileType = "FIXED"
+fileMask = "b-*.txt"
+fieldDefinitions = [{fieldName = "name", startPosition = 0, fieldLength = 13}]
+'''
+
+
+def create_definition(file_mask):
+    return {
+        'fileType': fc.FIXED,
+        'fieldDefinitions': [{'fieldName': 'name', 'startPosition': 0, 'fieldLength': 13}],
+        'fileMask': file_mask,
+    }
+
+
+class FileLoaderTests(TestCase):
+    def assert_definitions(self, file_definitions):
+        self.assertEqual(['a-*.txt', 'b-*.txt'], [fd.file_mask for fd in file_definitions])
+        self.assertEqual('|', file_definitions[0].delimiter)
+        self.assertEqual(13, file_definitions[1].field_definitions[0].field_length)
+
+    def test_load_json(self):
+        content = json.dumps([create_definition('a-*.txt'), create_definition('b-*.txt')])
+        file_definitions = load_definitions(content.encode(), 'json')
+        self.assertEqual(['a-*.txt', 'b-*.txt'], [fd.file_mask for fd in file_definitions])
+
+    def test_load_json_single_definition(self):
+        file_definitions = load_definitions(json.dumps(create_definition('a-*.txt')), 'json')
+        self.assertEqual(['a-*.txt'], [fd.file_mask for fd in file_definitions])
+
+    @unittest.skipUnless(has_yaml, 'PyYAML is not installed')
+    def test_load_yaml(self):
+        self.assert_definitions(load_definitions(YAML_DEFINITIONS, 'yaml'))
+
+    @unittest.skipUnless(has_toml, 'tomli is not installed')
+    def test_load_toml(self):
+        self.assert_definitions(load_definitions(TOML_DEFINITIONS.encode(), 'toml'))
+
+    def test_definitions_key(self):
+        content = json.dumps({'definitions': [create_definition('a-*.txt')]})
+        self.assertEqual(1, len(parse_definitions(content)))
+
+    def test_empty_document(self):
+        self.assertEqual([], load_definitions('[]', 'json'))
+
+    def test_every_invalid_definition_is_reported(self):
+        missing_file_type = create_definition('a-*.txt')
+        missing_file_type['fileType'] = ''
+        missing_field_length = create_definition('c-*.txt')
+        del missing_field_length['fieldDefinitions'][0]['fieldLength']
+        content = json.dumps([missing_file_type, create_definition('b-*.txt'), missing_field_length])
+        with self.assertRaises(InvalidDefinitionsError) as context:
+            load_definitions(content)
+        self.assertEqual([0, 2], [index for index, _ in context.exception.errors])
+        self.assertIn('definition 0: file_type is required', str(context.exception))
+        self.assertIn('definition 2: start_position and field_length', str(context.exception))
+
+    def test_invalid_definitions_error_is_value_error(self):
+        with self.assertRaises(ValueError):
+            load_definitions(json.dumps([{'fileType': fc.FIXED}]))
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            validate_definitions_format('xml')
+
+    def test_format_from_path(self):
+        self.assertEqual('yaml', format_from_path('definitions.yml'))
+        self.assertEqual('yaml', format_from_path('definitions.YAML'))
+        self.assertEqual('toml', format_from_path('definitions.toml'))
+        self.assertEqual('json', format_from_path('definitions.json'))
+        self.assertEqual('json', format_from_path('definitions'))
@@ -0,0 +1,119 @@
+import os
+from unittest import TestCase
+
+import file_ripper.fileconstants as fc
+from file_ripper.filedefinition import FileDefinition, FieldDefinition
+from file_ripper.fileinstance import FileRow
+from file_ripper.filemapping import MappedFixedWidthFile
+from file_ripper.fileripper import rip_mapped_file
+
+
+class MappedFixedWidthFileTests(TestCase):
+    def setUp(self) -> None:
+        self.file_name = 'Valid-mapped-09032019.txt'
+        with open(self.file_name, 'w', newline='') as f:
+            f.write('Name         Age      DOB       \n')
+            f.write('Aaron        39       09/04/1980\n')
+            f.write('Gene         61       01/15/1958\n')
+            f.write('Xander       4        11/22/2014\n')
+            f.write('Mason        12       04/13/2007\n')
+        self.file_definition = FileDefinition(fc.FIXED, [
+            FieldDefinition('name', fc.FIXED, 0, 13),
+            FieldDefinition('age', fc.FIXED, 13, 9),
+            FieldDefinition('dob', fc.FIXED, 22, 10),
+        ], has_header=True, record_length=33)
+        self.mapped_file = rip_mapped_file(self.file_name, self.file_definition)
+
+    def tearDown(self) -> None:
+        self.mapped_file.close()
+        os.remove(self.file_name)
+
+    def test_rip_mapped_file(self):
+        self.assertTrue(isinstance(self.mapped_file, MappedFixedWidthFile))
+        self.assertEqual(self.file_name, self.mapped_file.file_name)
+
+    def test_rip_mapped_file_not_fixed(self):
+        file_definition = FileDefinition(fc.DELIMITED, [FieldDefinition('name', fc.DELIMITED, position_in_row=0)],
+                                         delimiter='|')
+        with self.assertRaises(ValueError):
+            rip_mapped_file(self.file_name, file_definition)
+
+    def test_iter(self):
+        rows = list(self.mapped_file)
+        self.assertEqual(4, len(rows))
+        self.assertEqual(FileRow({'name': 'Aaron', 'age': '39', 'dob': '09/04/1980'}), rows[0])
+        self.assertEqual(['Aaron', 'Gene', 'Xander', 'Mason'], [row['name'] for row in rows])
+
+    def test_len(self):
+        self.assertEqual(4, len(self.mapped_file))
+
+    def test_random_access(self):
+        self.assertEqual('Xander', self.mapped_file[2]['name'])
+        self.assertEqual('04/13/2007', self.mapped_file[-1]['dob'])
+        self.assertEqual(['Gene', 'Xander'], [row['name'] for row in self.mapped_file[1:3]])
+
+    def test_random_access_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.mapped_file[4]
+
+    def test_random_access_without_record_length(self):
+        self.file_definition.record_length = None
+        with rip_mapped_file(self.file_name, self.file_definition) as mapped_file:
+            with self.assertRaises(TypeError):
+                mapped_file[0]
+
+    def test_fields_protocol(self):
+        row = self.mapped_file[0]
+        self.assertEqual(['name', 'age', 'dob'], list(row))
+        self.assertTrue('age' in row)
+        self.assertEqual(3, len(row))
+        self.assertEqual({'name': 'Aaron', 'age': '39', 'dob': '09/04/1980'}, row.fields.to_dict())
+
+    def test_to_json(self):
+        self.assertEqual(
+            '{"fields": {"name": "Aaron", "age": "39", "dob": "09/04/1980"}}', self.mapped_file[0].to_json()
+        )
+
+    def test_crlf_line_endings(self):
+        with open(self.file_name, 'w', newline='') as f:
+            f.write('Aaron        39       09/04/1980\r\n')
+            f.write('Gene         61       01/15/1958\r\n')
+        self.file_definition.has_header = False
+        self.file_definition.record_length = 34
+        with rip_mapped_file(self.file_name, self.file_definition) as mapped_file:
+            self.assertEqual(2, len(mapped_file))
+            self.assertEqual('01/15/1958', mapped_file[1]['dob'])
+            self.assertEqual(['Aaron', 'Gene'], [row['name'] for row in mapped_file])
+
+    def test_line_too_short(self):
+        with open(self.file_name, 'a') as f:
+            f.write('Steve        20\n')
+        with rip_mapped_file(self.file_name, self.file_definition) as mapped_file:
+            with self.assertRaises(IndexError):
+                list(mapped_file)
+
+    def test_last_line_without_line_break(self):
+        with open(self.file_name, 'w', newline='') as f:
+            f.write('AAAA\nBBBB\nCCCC')
+        file_definition = FileDefinition(fc.FIXED, [FieldDefinition('code', fc.FIXED, 0, 4)], record_length=5)
+        with rip_mapped_file(self.file_name, file_definition) as mapped_file:
+            self.assertEqual(3, len(mapped_file))
+            self.assertEqual('CCCC', mapped_file[2]['code'])
+            self.assertEqual('CCCC', mapped_file[-1]['code'])
+            self.assertEqual(['AAAA', 'BBBB', 'CCCC'], [row['code'] for row in mapped_file])
+
+    def test_padded_line_too_short(self):
+        with open(self.file_name, 'a') as f:
+            f.write('Steve        20                  \n')
+        with rip_mapped_file(self.file_name, self.file_definition) as mapped_file:
+            with self.assertRaises(IndexError):
+                list(mapped_file)
+            with self.assertRaises(IndexError):
+                mapped_file[-1]
+
+    def test_empty_file(self):
+        with open(self.file_name, 'w'):
+            pass
+        with rip_mapped_file(self.file_name, self.file_definition) as mapped_file:
+            self.assertEqual([], list(mapped_file))
+            self.assertEqual(0, len(mapped_file))
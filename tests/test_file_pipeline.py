@@ -0,0 +1,126 @@
+import asyncio
+import io
+import threading
+import time
+from unittest import TestCase
+
+import file_ripper.fileconstants as fc
+from file_ripper.filedefinition import FileDefinition, FieldDefinition
+from file_ripper.fileinstance import RowSchema
+from file_ripper.filepipeline import RowPipeline
+from file_ripper.fileripper import pipe_file, rip_file_pipeline
+
+
+class RowPipelineTests(TestCase):
+    def setUp(self) -> None:
+        self.schema = RowSchema(['number'])
+        self.produced = 0
+
+    def rows(self, count):
+        for number in range(count):
+            self.produced += 1
+            yield self.schema.create_row((str(number),))
+
+    def test_drain(self):
+        batches = []
+        self.assertEqual(10, RowPipeline(self.rows(10), batch_size=4).drain(batches.append))
+        self.assertEqual([4, 4, 2], [len(batch) for batch in batches])
+        self.assertEqual('9', batches[-1][-1]['number'])
+
+    def test_empty_rows(self):
+        self.assertEqual([], list(RowPipeline(self.rows(0))))
+
+    def test_parsing_pauses_for_slow_consumer(self):
+        pipeline = RowPipeline(self.rows(1000), batch_size=10, max_batches=2)
+        released = threading.Event()
+
+        def consumer(batch):
+            released.wait(5)
+
+        thread = threading.Thread(target=pipeline.drain, args=(consumer,))
+        thread.start()
+        time.sleep(0.3)
+        # one batch being consumed, two queued and one waiting to be queued
+        self.assertLessEqual(self.produced, 40)
+        released.set()
+        thread.join(5)
+        self.assertEqual(1000, self.produced)
+
+    def test_producer_error_is_raised(self):
+        def rows():
+            yield from self.rows(5)
+            raise IndexError('short line')
+
+        with self.assertRaises(IndexError):
+            RowPipeline(rows(), batch_size=2).drain(lambda batch: None)
+
+    def test_consumer_error_stops_parsing(self):
+        def consumer(batch):
+            raise ValueError('insert failed')
+
+        pipeline = RowPipeline(self.rows(100000), batch_size=10, max_batches=1)
+        with self.assertRaises(ValueError):
+            pipeline.drain(consumer)
+        self.assertFalse(pipeline._thread.is_alive())
+        self.assertLess(self.produced, 100000)
+
+    def test_async_iteration(self):
+        async def consume():
+            return [batch async for batch in RowPipeline(self.rows(25), batch_size=10)]
+
+        batches = asyncio.run(consume())
+        self.assertEqual([10, 10, 5], [len(batch) for batch in batches])
+
+    def test_async_iteration_break_stops_parsing(self):
+        pipeline = RowPipeline(self.rows(100000), batch_size=10, max_batches=1)
+
+        async def consume():
+            async for _ in pipeline:
+                break
+
+        asyncio.run(consume())
+        self.assertFalse(pipeline._thread.is_alive())
+        self.assertLess(self.produced, 100000)
+
+    def test_invalid_sizes(self):
+        with self.assertRaises(ValueError):
+            RowPipeline([], batch_size=0)
+        with self.assertRaises(ValueError):
+            RowPipeline([], max_batches=0)
+
+
+class PipeFileTests(TestCase):
+    def create_file(self, text):
+        file = io.StringIO(text)
+        file.name = 'people.txt'
+        return file
+
+    def test_pipe_delimited_file(self):
+        file_definition = FileDefinition(fc.DELIMITED, [
+            FieldDefinition('name', fc.DELIMITED, position_in_row=0),
+            FieldDefinition('age', fc.DELIMITED, position_in_row=1),
+        ], delimiter='|', has_header=True)
+        batches = []
+        file = self.create_file('name|age\nAaron|39\nGene|61\nMason|12\n')
+        self.assertEqual((3, []), pipe_file(file, file_definition, batches.append, batch_size=2))
+        self.assertEqual([['Aaron', 'Gene'], ['Mason']], [[row['name'] for row in batch] for batch in batches])
+
+    def test_pipe_fixed_width_file(self):
+        file_definition = FileDefinition(fc.FIXED, [
+            FieldDefinition('name', fc.FIXED, start_position=0, field_length=6),
+            FieldDefinition('age', fc.FIXED, start_position=6, field_length=2),
+        ])
+        file = self.create_file('Aaron 39\nGene  61\n')
+        rows = [row for batch in rip_file_pipeline(file, file_definition, columns=['age']) for row in batch]
+        self.assertEqual([{'age': '39'}, {'age': '61'}], [row.fields.to_dict() for row in rows])
+
+    def test_pipe_xml_file_async(self):
+        file_definition = FileDefinition(fc.XML, [FieldDefinition('name', fc.XML)], record_xml_element='person')
+        file = self.create_file(
+            '<people><person><name>Aaron</name></person><person><name>Gene</name></person></people>'
+        )
+
+        async def consume():
+            return [row['name'] async for batch in rip_file_pipeline(file, file_definition) for row in batch]
+
+        self.assertEqual(['Aaron', 'Gene'], asyncio.run(consume()))
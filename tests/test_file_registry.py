@@ -0,0 +1,101 @@
+import json
+import os
+from unittest import TestCase
+
+import file_ripper.fileconstants as fc
+from file_ripper.fileloader import InvalidDefinitionsError
+from file_ripper.fileregistry import DefinitionRegistry
+
+
+def create_definition(file_mask):
+    return {
+        'fileType': fc.FIXED,
+        'fieldDefinitions': [{'fieldName': 'name', 'startPosition': 0, 'fieldLength': 13}],
+        'fileMask': file_mask,
+    }
+
+
+class DefinitionRegistryTests(TestCase):
+    def setUp(self) -> None:
+        self.definitions_path = 'definitions.json'
+        self.write_definitions([create_definition('a-*.txt'), create_definition('b-*.txt')])
+        self.registry = DefinitionRegistry(self.definitions_path)
+
+    def tearDown(self) -> None:
+        os.remove(self.definitions_path)
+
+    def write_definitions(self, definitions):
+        with open(self.definitions_path, 'w') as f:
+            json.dump(definitions, f)
+        stat = os.stat(self.definitions_path)
+        os.utime(self.definitions_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_load(self):
+        file_definitions = self.registry.load()
+        self.assertEqual(['a-*.txt', 'b-*.txt'], [fd.file_mask for fd in file_definitions])
+        self.assertEqual('name', file_definitions[0].field_definitions[0].field_name)
+        self.assertEqual(1, self.registry.version)
+
+    def test_load_single_definition(self):
+        self.write_definitions(create_definition('a-*.txt'))
+        self.assertEqual(['a-*.txt'], [fd.file_mask for fd in self.registry.load()])
+
+    def test_unchanged_file_is_not_parsed_again(self):
+        first = self.registry.load()
+        second = self.registry.load()
+        self.assertIs(first[0], second[0])
+        self.assertEqual(1, self.registry.version)
+
+    def test_touched_file_with_same_content_is_not_compiled_again(self):
+        first = self.registry.load()
+        self.write_definitions([create_definition('a-*.txt'), create_definition('b-*.txt')])
+        second = self.registry.load()
+        self.assertIs(first[1], second[1])
+        self.assertEqual(1, self.registry.version)
+
+    def test_only_changed_definitions_are_compiled_again(self):
+        first = self.registry.load()
+        self.write_definitions([create_definition('a-*.txt'), create_definition('c-*.txt')])
+        second = self.registry.load()
+        self.assertIs(first[0], second[0])
+        self.assertEqual('c-*.txt', second[1].file_mask)
+        self.assertEqual(2, self.registry.version)
+
+    def test_invalid_definition_keeps_previous_definitions(self):
+        first = self.registry.load()
+        definition = create_definition('c-*.txt')
+        definition['fileType'] = ''
+        self.write_definitions([definition])
+        with self.assertRaises(ValueError):
+            self.registry.load()
+        self.assertEqual(first, self.registry.file_definitions)
+
+    def test_invalid_definitions_report_their_position_in_file(self):
+        self.registry.load()
+        definition = create_definition('c-*.txt')
+        definition['fileType'] = ''
+        self.write_definitions([create_definition('a-*.txt'), create_definition('b-*.txt'), definition])
+        with self.assertRaises(InvalidDefinitionsError) as context:
+            self.registry.load()
+        self.assertEqual([2], [index for index, _ in context.exception.errors])
+
+    def test_identical_definitions_are_kept(self):
+        self.write_definitions([create_definition(file_mask) for file_mask in ('a-*.txt', 'a-*.txt', 'b-*.txt')])
+        file_definitions = self.registry.load()
+        self.assertEqual(['a-*.txt', 'a-*.txt', 'b-*.txt'], [fd.file_mask for fd in file_definitions])
+        self.assertIsNot(file_definitions[0], file_definitions[1])
+
+    def test_identical_invalid_definitions_report_every_position(self):
+        definition = create_definition('c-*.txt')
+        definition['fileType'] = ''
+        self.write_definitions([definition, create_definition('a-*.txt'), definition])
+        with self.assertRaises(InvalidDefinitionsError) as context:
+            self.registry.load()
+        self.assertEqual([0, 2], [index for index, _ in context.exception.errors])
+
+    def test_format_from_extension(self):
+        self.assertEqual('yaml', DefinitionRegistry('definitions.yaml').definitions_format)
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            DefinitionRegistry(self.definitions_path, 'xml')
@@ -0,0 +1,258 @@
+import csv
+import importlib.util
+import io
+import json
+import os
+import shutil
+import sqlite3
+import unittest
+from unittest import TestCase
+
+import file_ripper.fileconstants as fc
+from file_ripper.filedefinition import FileDefinition, FieldDefinition
+from file_ripper.fileinstance import LazyFileInstance
+from file_ripper.filerepository import (
+    CsvRepository,
+    JsonLinesRepository,
+    ParquetRepository,
+    SqliteRepository,
+    create_file_repository,
+    output_field_names,
+)
+from file_ripper.fileripper import find_and_store_files, rip_file, rip_new_file, store_file
+
+
+class FileRepositoryTests(TestCase):
+    def setUp(self) -> None:
+        self.directory = os.path.abspath('repository-files')
+        os.makedirs(self.directory)
+        self.output_path = os.path.join(self.directory, 'output')
+        self.file_definition = FileDefinition(
+            file_type=fc.DELIMITED,
+            delimiter='|',
+            field_definitions=[
+                FieldDefinition('name', fc.DELIMITED, position_in_row=0),
+                FieldDefinition('age', fc.DELIMITED, position_in_row=1),
+                FieldDefinition('dob', fc.DELIMITED, position_in_row=2),
+            ],
+            input_directory=self.directory,
+            file_mask='*.txt',
+        )
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def write_file(self, name, text):
+        file_name = os.path.join(self.directory, name)
+        with open(file_name, 'w') as f:
+            f.write(text)
+        return file_name
+
+    def create_file(self, name='people.txt'):
+        file = io.StringIO('Aaron|39|09/04/1980\nGene|61|01/15/1958\nMason|12|04/13/2007\n')
+        file.name = name
+        return file
+
+    def failing_file_instance(self):
+        def rows():
+            yield from rip_file(self.create_file(), self.file_definition).file_rows
+            raise ValueError('bad record')
+
+        return LazyFileInstance('people.txt', rows())
+
+    def read_json_lines(self, name):
+        with open(os.path.join(self.output_path, name)) as f:
+            return [json.loads(line) for line in f]
+
+
+class JsonLinesRepositoryTests(FileRepositoryTests):
+    def test_store_file(self):
+        repository = JsonLinesRepository(self.output_path, ['name', 'age', 'dob'])
+        self.assertEqual((3, []), store_file(self.create_file(), self.file_definition, repository))
+        self.assertEqual(
+            [
+                {'name': 'Aaron', 'age': '39', 'dob': '09/04/1980'},
+                {'name': 'Gene', 'age': '61', 'dob': '01/15/1958'},
+                {'name': 'Mason', 'age': '12', 'dob': '04/13/2007'},
+            ],
+            self.read_json_lines('people.jsonl'),
+        )
+
+    def test_store_file_in_batches(self):
+        repository = JsonLinesRepository(self.output_path, ['name', 'age', 'dob'], batch_size=2)
+        self.assertEqual((3, []), store_file(self.create_file(), self.file_definition, repository))
+        self.assertEqual(['Aaron', 'Gene', 'Mason'], [row['name'] for row in self.read_json_lines('people.jsonl')])
+
+    def test_store_file_columns(self):
+        self.file_definition.output_format = fc.JSONL
+        self.file_definition.output_path = self.output_path
+        self.assertEqual((3, []), store_file(self.create_file(), self.file_definition, columns=['dob', 'name']))
+        self.assertEqual({'dob': '09/04/1980', 'name': 'Aaron'}, self.read_json_lines('people.jsonl')[0])
+
+    def test_failed_file_leaves_no_output(self):
+        repository = JsonLinesRepository(self.output_path, ['name', 'age', 'dob'], batch_size=1)
+        with self.assertRaises(ValueError):
+            repository(self.failing_file_instance())
+        self.assertEqual([], os.listdir(self.output_path))
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            JsonLinesRepository(self.output_path, ['name'], batch_size=0)
+
+
+class CsvRepositoryTests(FileRepositoryTests):
+    def test_store_file(self):
+        repository = CsvRepository(self.output_path, ['name', 'age', 'dob'])
+        self.assertEqual((3, []), store_file(self.create_file(), self.file_definition, repository))
+        with open(os.path.join(self.output_path, 'people.csv'), newline='') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(['name', 'age', 'dob'], rows[0])
+        self.assertEqual(['Gene', '61', '01/15/1958'], rows[2])
+        self.assertEqual(4, len(rows))
+
+
+@unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+class ParquetRepositoryTests(FileRepositoryTests):
+    def test_store_file(self):
+        import pyarrow.parquet as parquet
+
+        repository = ParquetRepository(self.output_path, ['name', 'age', 'dob'], batch_size=2)
+        self.assertEqual((3, []), store_file(self.create_file(), self.file_definition, repository))
+        table = parquet.read_table(os.path.join(self.output_path, 'people.parquet'))
+        self.assertEqual(['Aaron', 'Gene', 'Mason'], table.column('name').to_pylist())
+        self.assertEqual(['name', 'age', 'dob'], table.schema.names)
+
+
+class SqliteRepositoryTests(FileRepositoryTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.output_path = os.path.join(self.directory, 'rows.db')
+
+    def select(self, query):
+        with sqlite3.connect(self.output_path) as connection:
+            return connection.execute(query).fetchall()
+
+    def test_store_files_append_to_table(self):
+        repository = SqliteRepository(self.output_path, ['name', 'age', 'dob'], table_name='people')
+        store_file(self.create_file('a.txt'), self.file_definition, repository)
+        store_file(self.create_file('b.txt'), self.file_definition, repository)
+        self.assertEqual(
+            [('a.txt', 3), ('b.txt', 3)],
+            self.select('SELECT file_name, COUNT(*) FROM people GROUP BY file_name ORDER BY file_name'),
+        )
+        self.assertEqual(
+            [('Gene', '61')], self.select("SELECT name, age FROM people WHERE file_name = 'a.txt' AND name = 'Gene'")
+        )
+
+    def test_definitions_with_different_fields_share_a_table(self):
+        store_file(self.create_file('a.txt'), self.file_definition, create_file_repository(
+            self.file_definition, fc.SQLITE, self.output_path
+        ))
+        file_definition = FileDefinition(fc.FIXED, [
+            FieldDefinition('person', fc.FIXED, 0, 6),
+            FieldDefinition('age', fc.FIXED, 6, 2),
+        ])
+        file = io.StringIO('Aaron 39\nGene  61\n')
+        file.name = 'b.txt'
+        repository = create_file_repository(file_definition, fc.SQLITE, self.output_path)
+        self.assertEqual((2, []), store_file(file, file_definition, repository))
+        self.assertEqual(
+            [('a.txt', 'Aaron', None, '39'), ('b.txt', None, 'Aaron', '39')],
+            self.select("SELECT file_name, name, person, age FROM file_rows WHERE age = '39' ORDER BY file_name"),
+        )
+
+    def test_concurrent_files(self):
+        repository = SqliteRepository(self.output_path, ['name', 'age', 'dob'], table_name='people')
+        first, second = repository.open('a.txt'), repository.open('b.txt')
+        repository.write_batch(first, [('Aaron', '39', '09/04/1980')])
+        repository.write_batch(second, [('Gene', '61', '01/15/1958')])
+        repository.commit(second)
+        self.assertEqual([('b.txt', 'Gene')], self.select('SELECT file_name, name FROM people'))
+        repository.write_batch(first, [('Mason', '12', '04/13/2007')])
+        repository.commit(first)
+        self.assertEqual(
+            [('a.txt', 2), ('b.txt', 1)],
+            self.select('SELECT file_name, COUNT(*) FROM people GROUP BY file_name ORDER BY file_name'),
+        )
+
+    def test_failed_file_is_rolled_back(self):
+        repository = SqliteRepository(self.output_path, ['name', 'age', 'dob'], batch_size=1)
+        with self.assertRaises(ValueError):
+            repository(self.failing_file_instance())
+        self.assertEqual([(0,)], self.select('SELECT COUNT(*) FROM file_rows'))
+
+
+class CreateFileRepositoryTests(FileRepositoryTests):
+    def test_format_from_file_definition(self):
+        self.file_definition.output_format = fc.CSV
+        self.file_definition.output_path = self.output_path
+        self.assertIsInstance(create_file_repository(self.file_definition, fc.JSONL), CsvRepository)
+
+    def test_format_from_arguments(self):
+        repository = create_file_repository(self.file_definition, 'sqlite', self.output_path)
+        self.assertIsInstance(repository, SqliteRepository)
+        self.assertEqual('file_rows', repository.table_name)
+
+    def test_output_table(self):
+        self.file_definition.output_table = 'people'
+        self.assertEqual('people', create_file_repository(self.file_definition, fc.SQLITE, self.output_path).table_name)
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            create_file_repository(self.file_definition, 'XLSX', self.output_path)
+
+    def test_missing_output_path(self):
+        with self.assertRaises(ValueError):
+            create_file_repository(self.file_definition, fc.JSONL)
+
+    def test_output_field_names_for_record_layouts(self):
+        file_definition = FileDefinition(
+            file_type=fc.FIXED,
+            field_definitions=[],
+            record_code_length=1,
+            record_layouts={
+                'H': [
+                    FieldDefinition('code', fc.FIXED, start_position=0, field_length=1),
+                    FieldDefinition('batch', fc.FIXED, start_position=1, field_length=4),
+                ],
+                'D': [
+                    FieldDefinition('code', fc.FIXED, start_position=0, field_length=1),
+                    FieldDefinition('name', fc.FIXED, start_position=1, field_length=8),
+                ],
+            },
+        )
+        self.assertEqual(['code', 'batch', 'name'], output_field_names(file_definition))
+
+
+class FindAndStoreFilesTests(FileRepositoryTests):
+    def setUp(self) -> None:
+        super().setUp()
+        self.write_file('a.txt', 'Aaron|39|09/04/1980\nGene|61|01/15/1958\n')
+        self.write_file('b.txt', 'Mason|12|04/13/2007\n')
+        self.file_definition.output_format = fc.JSONL
+        self.file_definition.output_path = self.output_path
+
+    def test_find_and_store_files(self):
+        results = find_and_store_files(self.file_definition)
+        self.assertEqual({'a.txt': 2, 'b.txt': 1}, {os.path.basename(name): count for name, count, _ in results})
+        self.assertEqual(['Mason'], [row['name'] for row in self.read_json_lines('b.jsonl')])
+
+    def test_find_and_store_files_skip(self):
+        self.write_file('b.txt', 'Mason|12\nXander|4|11/22/2014\n')
+        self.file_definition.error_policy = fc.SKIP
+        results = find_and_store_files(self.file_definition)
+        results = {os.path.basename(name): (count, errors) for name, count, errors in results}
+        self.assertEqual((2, []), results['a.txt'])
+        self.assertEqual(1, results['b.txt'][0])
+        self.assertEqual([1], [error.line_number for error in results['b.txt'][1]])
+
+    def test_find_and_store_files_with_workers(self):
+        results = find_and_store_files(self.file_definition, workers=2)
+        self.assertEqual([2, 1], [count for _, count, _ in sorted(results)])
+        self.assertEqual(['a.jsonl', 'b.jsonl'], sorted(os.listdir(self.output_path)))
+
+    def test_rip_new_file_with_repository(self):
+        repository = create_file_repository(self.file_definition)
+        file_name = os.path.join(self.directory, 'a.txt')
+        self.assertEqual((file_name, 2, []), rip_new_file(file_name, self.file_definition, repository=repository))
+        self.assertEqual(2, len(self.read_json_lines('a.jsonl')))
@@ -0,0 +1,142 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+import file_ripper.fileconstants as fc
+from file_ripper.filedefinition import FileDefinition, FieldDefinition
+from file_ripper.fileripper import (
+    find_and_rip_files, find_chunk_boundaries, rip_file, rip_file_batches, rip_file_columnar, rip_file_iter, rip_files
+)
+
+
+class FileRipperTests(TestCase):
+    def setUp(self) -> None:
+        self.file_name = 'Valid-chunked-09032019.txt'
+        self.lines = ['Name|DOB|Age\n'] + [f'Person{i}|01/01/2000|{i}\n' for i in range(50)]
+        with open(self.file_name, 'w') as f:
+            f.writelines(self.lines)
+        self.file_definition = FileDefinition(fc.DELIMITED, [
+            FieldDefinition('name', fc.DELIMITED, position_in_row=0),
+            FieldDefinition('dob', fc.DELIMITED, position_in_row=1),
+            FieldDefinition('age', fc.DELIMITED, position_in_row=2),
+        ], has_header=True, delimiter='|')
+
+    def tearDown(self) -> None:
+        os.remove(self.file_name)
+
+    def assert_all_rows(self, file_instance):
+        self.assertEqual(self.file_name, file_instance.file_name)
+        self.assertEqual(50, len(file_instance))
+        self.assertEqual([f'Person{i}' for i in range(50)], [row['name'] for row in file_instance])
+
+
+class FindChunkBoundariesTests(FileRipperTests):
+    def test_chunks_cover_file(self):
+        chunks = find_chunk_boundaries(self.file_name, 100)
+        self.assertEqual(0, chunks[0][0])
+        self.assertEqual(os.path.getsize(self.file_name), chunks[-1][1])
+        for (_, end), (start, _) in zip(chunks, chunks[1:]):
+            self.assertEqual(end, start)
+
+    def test_chunks_end_on_newlines(self):
+        with open(self.file_name, 'rb') as f:
+            data = f.read()
+        for start, end in find_chunk_boundaries(self.file_name, 100):
+            self.assertTrue(data[start:end].endswith(b'\n'))
+
+    def test_chunk_larger_than_file(self):
+        self.assertEqual([(0, os.path.getsize(self.file_name))], find_chunk_boundaries(self.file_name, 1024 * 1024))
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            find_chunk_boundaries(self.file_name, 0)
+
+
+class RipFileInChunksTests(FileRipperTests):
+    def test_executor(self):
+        with open(self.file_name, 'r') as file, ThreadPoolExecutor(max_workers=4) as executor:
+            self.assert_all_rows(rip_file(file, self.file_definition, executor=executor, chunk_size=100))
+
+    def test_workers(self):
+        with open(self.file_name, 'r') as file:
+            self.assert_all_rows(rip_file(file, self.file_definition, workers=2, chunk_size=100))
+
+    def test_header_only_skipped_in_first_chunk(self):
+        self.file_definition.has_header = False
+        with open(self.file_name, 'r') as file, ThreadPoolExecutor(max_workers=4) as executor:
+            file_instance = rip_file(file, self.file_definition, executor=executor, chunk_size=100)
+        self.assertEqual(51, len(file_instance))
+        self.assertEqual('Name', file_instance[0]['name'])
+
+    def test_single_chunk_parsed_in_process(self):
+        with open(self.file_name, 'r') as file:
+            self.assert_all_rows(rip_file(file, self.file_definition, workers=2))
+
+    def test_csv_engine_is_not_chunked(self):
+        self.file_definition.delimited_engine = fc.CSV
+        with open(self.file_name, 'a') as f:
+            f.write('"Person\n50"|01/01/2000|50\n')
+        with open(self.file_name, 'r', newline='') as file, ThreadPoolExecutor(max_workers=4) as executor:
+            file_instance = rip_file(file, self.file_definition, executor=executor, chunk_size=100)
+        self.assertEqual(51, len(file_instance))
+        self.assertEqual('Person\n50', file_instance[50]['name'])
+
+
+class ColumnProjectionTests(FileRipperTests):
+    def test_rip_file_columns(self):
+        with open(self.file_name, 'r') as file:
+            file_instance = rip_file(file, self.file_definition, columns=['age', 'name'])
+        self.assertEqual({'age': '0', 'name': 'Person0'}, file_instance[0].fields.to_dict())
+        self.assertEqual(['age', 'name'], list(file_instance[0]))
+
+    def test_rip_file_columns_in_chunks(self):
+        with open(self.file_name, 'r') as file, ThreadPoolExecutor(max_workers=4) as executor:
+            file_instance = rip_file(file, self.file_definition, executor=executor, chunk_size=100, columns=['name'])
+        self.assert_all_rows(file_instance)
+        self.assertEqual(['name'], list(file_instance[49]))
+
+    def test_rip_file_columns_skips_other_fields(self):
+        # an inner delimited field that would fail to split is never touched when it is not selected
+        self.file_definition.field_definitions.append(
+            FieldDefinition('address', fc.DELIMITED, position_in_row=9, delimiter='&', field_definitions=[
+                FieldDefinition('city', fc.DELIMITED, position_in_row=0),
+            ])
+        )
+        with open(self.file_name, 'r') as file:
+            self.assert_all_rows(rip_file(file, self.file_definition, columns=['name']))
+
+    def test_rip_file_iter_columns(self):
+        with open(self.file_name, 'r') as file:
+            self.assertEqual(['dob'], list(next(iter(rip_file_iter(file, self.file_definition, columns=['dob'])))))
+
+    def test_rip_file_columnar_columns(self):
+        with open(self.file_name, 'r') as file:
+            self.assertEqual(['age'], rip_file_columnar(file, self.file_definition, columns=['age']).field_names)
+
+    def test_rip_file_batches_columns(self):
+        with open(self.file_name, 'r') as file:
+            batches = list(rip_file_batches(file, self.file_definition, 20, columnar=True, columns=['age']))
+        self.assertEqual([['age']] * 3, [list(batch) for batch in batches])
+        self.assertEqual([20, 20, 10], [len(batch['age']) for batch in batches])
+
+    def test_rip_files_columns(self):
+        with open(self.file_name, 'r') as file:
+            file_instances = rip_files([file], self.file_definition, columns=['name'])
+        self.assertEqual(['name'], list(file_instances[0][0]))
+
+    def test_find_and_rip_files_columns(self):
+        self.file_definition.input_directory = os.getcwd()
+        self.file_definition.file_mask = self.file_name
+        file_instances = find_and_rip_files(self.file_definition, columns=['name'])
+        self.assertEqual(1, len(file_instances))
+        self.assertEqual(['name'], list(file_instances[0][0]))
+
+    def test_definition_is_not_changed(self):
+        with open(self.file_name, 'r') as file:
+            rip_file(file, self.file_definition, columns=['name'])
+        self.assertEqual(3, len(self.file_definition.field_definitions))
+
+    def test_unknown_column(self):
+        with open(self.file_name, 'r') as file:
+            with self.assertRaises(ValueError):
+                rip_file(file, self.file_definition, columns=['name', 'salary'])
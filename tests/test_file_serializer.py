@@ -0,0 +1,51 @@
+import io
+import json
+from decimal import Decimal
+from unittest import TestCase
+
+from file_ripper.fileinstance import FileInstance, FileRow, LazyFileInstance, RowSchema
+from file_ripper.fileserializer import FileInstanceSerializer, file_instance_to_json, write_file_instance_json
+
+
+class FileInstanceSerializerTests(TestCase):
+    def setUp(self) -> None:
+        schema = RowSchema(['first_name', 'age', 'address'])
+        self.file_instance = FileInstance('people☃.txt', [
+            schema.create_row(('Aaron', '39', {'street_name': 'Main', 'city': 'Des Moines'})),
+            schema.create_row(('Gene', None, {})),
+            FileRow({'first_name': 'Masén "M"\n', 'per%cent': '12', 'amount': Decimal('1.50')}),
+            FileRow({}),
+        ])
+
+    def test_matches_to_json(self):
+        self.assertEqual(self.file_instance.to_json(), file_instance_to_json(self.file_instance))
+
+    def test_matches_to_json_across_batches(self):
+        serializer = FileInstanceSerializer(batch_size=1)
+        self.assertEqual(self.file_instance.to_json(), serializer.to_json(self.file_instance))
+
+    def test_empty_file_matches_to_json(self):
+        file_instance = FileInstance('empty.txt', [])
+        self.assertEqual(file_instance.to_json(), file_instance_to_json(file_instance))
+
+    def test_lazy_file_instance(self):
+        rows = iter(self.file_instance.file_rows)
+        self.assertEqual(self.file_instance.to_json(), file_instance_to_json(LazyFileInstance('people☃.txt', rows)))
+
+    def test_write(self):
+        file = io.StringIO()
+        write_file_instance_json(self.file_instance, file)
+        self.assertEqual(self.file_instance.to_json(), file.getvalue())
+
+    def test_compact(self):
+        compact = file_instance_to_json(self.file_instance, compact=True)
+        self.assertNotIn(', ', compact.replace('Des Moines', ''))
+        self.assertEqual(json.loads(self.file_instance.to_json()), json.loads(compact))
+
+    def test_compact_across_batches(self):
+        compact = FileInstanceSerializer(compact=True, batch_size=3).to_json(self.file_instance)
+        self.assertEqual(json.loads(self.file_instance.to_json()), json.loads(compact))
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            FileInstanceSerializer(batch_size=0)
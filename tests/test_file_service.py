@@ -1,11 +1,16 @@
+import importlib.util
+import io
 import os
 import unittest
 from unittest import TestCase
+from xml.etree.ElementTree import ParseError
 
 import file_ripper.fileconstants as fc
 from file_ripper.filedefinition import FileDefinition, FieldDefinition
 from file_ripper.fileservice import XmlFileService, FileService, FlatFileService, create_file_service
 
+has_lxml = importlib.util.find_spec('lxml') is not None
+
 
 class CreateFileServiceTests(TestCase):
     """Test cases for file service factory function code"""
@@ -70,6 +75,19 @@ class FileServiceTests(unittest.TestCase):
         self.assertEqual('4', file_records[2]['age'])
         self.assertEqual('11/22/2014', file_records[2]['dob'])
 
+    def assert_valid_batches(self):
+        with open(self.file_name, 'r') as file:
+            batches = list(self.file_service.iter_batches(file, batch_size=3))
+        self.assertEqual([3, 1], [len(batch) for batch in batches])
+        self.assert_valid_records(batches[0] + batches[1])
+
+    def assert_valid_columnar_batches(self):
+        with open(self.file_name, 'r') as file:
+            batches = list(self.file_service.iter_batches(file, batch_size=3, columnar=True))
+        self.assertEqual(['name', 'age', 'dob'], list(batches[0]))
+        self.assertEqual(['Aaron', 'Gene', 'Xander'], batches[0]['name'])
+        self.assertEqual({'name': ['Mason'], 'age': ['12'], 'dob': ['04/13/2007']}, batches[1])
+
     def test_process_records_not_implemented(self):
         file_service = FileService(FileDefinition(fc.FIXED, [FieldDefinition('hello', 'file_type')]))
         with self.assertRaises(NotImplementedError):
@@ -114,6 +132,50 @@ class DelimitedFileServiceTests(FileServiceTests):
             file_instance = self.file_service.process(file)
             self.assert_valid_file_output(file_instance.file_name, file_instance.file_rows)
 
+    def test_iter_file_records_is_lazy(self):
+        with open(self.file_name, 'r') as file:
+            records = self.file_service.iter_file_records(file)
+            self.assertFalse(isinstance(records, list))
+            self.assertEqual('Aaron', next(records)['name'])
+            self.assert_valid_records([self.file_service.process_record('Aaron|09/04/1980|39\n')] + list(records))
+
+    def test_process_record_reuses_layout(self):
+        self.assertEqual('Aaron', self.file_service.process_record('Aaron|09/04/1980|39\n')['name'])
+        process_record = self.file_service.cached_record_processor()
+        self.assertEqual('61', self.file_service.process_record('Gene|01/15/1958|61\n')['age'])
+        self.assertIs(process_record, self.file_service.cached_record_processor())
+
+    def test_iter_file_records_without_header(self):
+        self.file_definition.has_header = False
+        with open(self.file_name, 'r') as file:
+            records = list(self.file_service.iter_file_records(file))
+            self.assertEqual(5, len(records))
+            self.assertEqual('Name', records[0]['name'])
+
+    def test_process_columnar(self):
+        with open(self.file_name, 'r') as file:
+            file_instance = self.file_service.process_columnar(file)
+            self.assertEqual(['name', 'age', 'dob'], file_instance.field_names)
+            self.assertEqual(['Aaron', 'Gene', 'Xander', 'Mason'], file_instance.column('name'))
+            self.assert_valid_records(file_instance)
+
+    def test_process_iter(self):
+        with open(self.file_name, 'r') as file:
+            file_instance = self.file_service.process_iter(file)
+            self.assertEqual(self.file_name, file_instance.file_name)
+            self.assert_valid_records(list(file_instance))
+
+    def test_iter_batches(self):
+        self.assert_valid_batches()
+
+    def test_iter_batches_columnar(self):
+        self.assert_valid_columnar_batches()
+
+    def test_iter_batches_invalid_batch_size(self):
+        with open(self.file_name, 'r') as file:
+            with self.assertRaises(ValueError):
+                self.file_service.iter_batches(file, batch_size=0)
+
 
 class DelimitedFileServiceNestedObjectTests(NestedObjectTests):
     def setUp(self):
@@ -144,6 +206,58 @@ class DelimitedFileServiceNestedObjectTests(NestedObjectTests):
             self.assert_valid_file_output(file_instance.file_name, file_instance.file_rows)
 
 
+class CsvDelimitedFileServiceTests(DelimitedFileServiceTests):
+    def setUp(self):
+        super().setUp()
+        self.file_definition.delimited_engine = fc.CSV
+
+    def write_file(self, *lines):
+        with open(self.file_name, 'w', newline='') as f:
+            f.write('Name|DOB|Age\n')
+            f.writelines(lines)
+
+    def test_process_quoted_fields(self):
+        self.write_file('"Smith|Aaron"|09/04/1980|"39"\n', '"Gene ""The Dream"""|01/15/1958|61\n')
+        with open(self.file_name, 'r', newline='') as file:
+            file_rows = self.file_service.process(file).file_rows
+            self.assertEqual('Smith|Aaron', file_rows[0]['name'])
+            self.assertEqual('39', file_rows[0]['age'])
+            self.assertEqual('Gene "The Dream"', file_rows[1]['name'])
+
+    def test_process_quoted_line_break(self):
+        self.write_file('"Aaron\nSmith"|09/04/1980|39\n', 'Gene|01/15/1958|61\n')
+        with open(self.file_name, 'r', newline='') as file:
+            file_rows = self.file_service.process(file).file_rows
+            self.assertEqual(2, len(file_rows))
+            self.assertEqual('Aaron\nSmith', file_rows[0]['name'])
+
+    def test_process_quote_and_escape_char(self):
+        self.file_definition.quote_char = "'"
+        self.file_definition.escape_char = '\\'
+        self.write_file("'Aaron | Smith'|09/04/1980|39\n", 'Gene\\|Jr|01/15/1958|61\n')
+        with open(self.file_name, 'r', newline='') as file:
+            file_rows = self.file_service.process(file).file_rows
+            self.assertEqual('Aaron | Smith', file_rows[0]['name'])
+            self.assertEqual('Gene|Jr', file_rows[1]['name'])
+            self.assertEqual('61', file_rows[1]['age'])
+
+    def test_process_skips_blank_lines(self):
+        self.write_file('Aaron|09/04/1980|39\n', '\n', 'Gene|01/15/1958|61\n')
+        with open(self.file_name, 'r', newline='') as file:
+            self.assertEqual(2, len(self.file_service.process(file)))
+
+    def test_process_short_row(self):
+        self.write_file('Aaron|09/04/1980\n')
+        with open(self.file_name, 'r', newline='') as file:
+            self.assertRaises(IndexError, self.file_service.process, file)
+
+
+class CsvDelimitedFileServiceNestedObjectTests(DelimitedFileServiceNestedObjectTests):
+    def setUp(self):
+        super().setUp()
+        self.file_definition.delimited_engine = fc.CSV
+
+
 class FixedFileServiceTests(FileServiceTests):
     def setUp(self):
         super(FixedFileServiceTests, self).create_file_definitions(fc.FIXED)
@@ -172,6 +286,101 @@ class FixedFileServiceTests(FileServiceTests):
                 }))
             self.assertRaises(IndexError, self.file_service.process, file)
 
+    def test_process_record_reuses_layout(self):
+        self.assertEqual('Aaron', self.file_service.process_record('Aaron        39       09/04/1980\n')['name'])
+        process_record = self.file_service.cached_record_processor()
+        self.assertEqual('Gene', self.file_service.process_record('Gene         61       01/15/1958\n')['name'])
+        self.assertIs(process_record, self.file_service.cached_record_processor())
+
+    def test_iter_batches(self):
+        self.assert_valid_batches()
+
+    def test_iter_batches_columnar(self):
+        self.assert_valid_columnar_batches()
+
+    def test_iter_batches_columnar_records_too_short(self):
+        self.file_definition.field_definitions.append(FieldDefinition('address', fc.FIXED, 32, 2))
+        with open(self.file_name, 'r') as file:
+            with self.assertRaises(IndexError):
+                list(self.file_service.iter_batches(file, columnar=True))
+
+
+class MultiRecordFixedFileServiceTests(TestCase):
+    def setUp(self):
+        self.file_definition = FileDefinition(fc.FIXED, [], record_code_length=1, record_layouts={
+            'H': [FieldDefinition('record_type', fc.FIXED, 0, 1), FieldDefinition('file_date', fc.FIXED, 1, 8)],
+            'D': [FieldDefinition('record_type', fc.FIXED, 0, 1), FieldDefinition('name', fc.FIXED, 1, 13),
+                  FieldDefinition('age', fc.FIXED, 14, 2)],
+            'T': [FieldDefinition('record_type', fc.FIXED, 0, 1), FieldDefinition('count', fc.FIXED, 1, 4)],
+        })
+        self.file_service = create_file_service(self.file_definition)
+        self.file_name = 'Valid-multi-record-09032019.txt'
+        with open(self.file_name, 'w') as f:
+            f.write('H20190903\n')
+            f.write('DAaron        39\n')
+            f.write('DGene         61\n')
+            f.write('T0002\n')
+
+    def tearDown(self):
+        os.remove(self.file_name)
+
+    def test_process(self):
+        with open(self.file_name, 'r') as file:
+            file_rows = self.file_service.process(file).file_rows
+        self.assertEqual({'record_type': 'H', 'file_date': '20190903'}, file_rows[0].fields.to_dict())
+        self.assertEqual({'record_type': 'D', 'name': 'Aaron', 'age': '39'}, file_rows[1].fields.to_dict())
+        self.assertEqual('Gene', file_rows[2]['name'])
+        self.assertEqual({'record_type': 'T', 'count': '0002'}, file_rows[3].fields.to_dict())
+
+    def test_rows_of_a_record_type_share_a_schema(self):
+        with open(self.file_name, 'r') as file:
+            file_rows = self.file_service.process(file).file_rows
+        self.assertIs(file_rows[1].fields.schema, file_rows[2].fields.schema)
+
+    def test_unknown_record_code(self):
+        with open(self.file_name, 'a') as f:
+            f.write('X0000\n')
+        with open(self.file_name, 'r') as file:
+            with self.assertRaises(ValueError):
+                self.file_service.process(file)
+
+    def test_record_code_without_fields_is_skipped(self):
+        self.file_definition.record_layouts['H'] = []
+        self.file_definition.record_layouts['T'] = []
+        with open(self.file_name, 'r') as file:
+            file_rows = self.file_service.process(file).file_rows
+        self.assertEqual(['Aaron', 'Gene'], [row['name'] for row in file_rows])
+
+    def test_record_code_position(self):
+        with open(self.file_name, 'w') as f:
+            f.write('01DAaron\n02HHeader\n')
+        self.file_definition.record_code_position = 2
+        self.file_definition.record_layouts = {
+            'D': [FieldDefinition('name', fc.FIXED, 3, 5)],
+            'H': [FieldDefinition('title', fc.FIXED, 3, 6)],
+        }
+        with open(self.file_name, 'r') as file:
+            file_rows = self.file_service.process(file).file_rows
+        self.assertEqual([{'name': 'Aaron'}, {'title': 'Header'}], [row.fields.to_dict() for row in file_rows])
+
+    def test_process_record(self):
+        self.assertEqual('Aaron', self.file_service.process_record('DAaron        39\n')['name'])
+
+    def test_process_columnar(self):
+        with open(self.file_name, 'r') as file:
+            with self.assertRaises(ValueError):
+                self.file_service.process_columnar(file)
+
+    def test_iter_batches(self):
+        with open(self.file_name, 'r') as file:
+            batches = list(self.file_service.iter_batches(file, batch_size=2))
+        self.assertEqual([['H', 'D'], ['D', 'T']], [[row['record_type'] for row in batch] for batch in batches])
+
+    def test_iter_batches_columnar(self):
+        with open(self.file_name, 'r') as file:
+            with self.assertRaises(ValueError):
+                self.file_service.iter_batches(file, columnar=True)
+
 
 class XmlFileServiceTests(FileServiceTests):
     def setUp(self):
@@ -200,6 +409,38 @@ class XmlFileServiceTests(FileServiceTests):
             file_instance = self.file_service.process(file)
             self.assert_valid_file_output(file_instance.file_name, file_instance.file_rows)
 
+    def test_iter_batches(self):
+        self.assert_valid_batches()
+
+    def test_iter_batches_columnar(self):
+        self.assert_valid_columnar_batches()
+
+    def test_iter_file_records_parses_incrementally(self):
+        with open(self.file_name, 'a') as f:
+            f.write('<person><name>Broken')
+        with open(self.file_name, 'r') as file:
+            records = self.file_service.iter_file_records(file)
+            self.assertEqual('Aaron', next(records)['name'])
+            with self.assertRaises(ParseError):
+                list(records)
+
+    def test_iter_file_records_ignores_nested_record_elements(self):
+        with open(self.file_name, 'w') as f:
+            f.write('<people><group><person><name>Nested</name></person></group>'
+                    '<person><name>Aaron</name><age>39</age><dob>09/04/1980</dob></person></people>')
+        with open(self.file_name, 'r') as file:
+            records = list(self.file_service.iter_file_records(file))
+            self.assertEqual(1, len(records))
+            self.assertEqual('Aaron', records[0]['name'])
+
+    def test_process_uses_xml_node_name(self):
+        with open(self.file_name, 'w') as f:
+            f.write('<people><person><fullName>Aaron</fullName><age>39</age><dob>09/04/1980</dob></person></people>')
+        self.file_definition.field_definitions[0].xml_node_name = 'fullName'
+        with open(self.file_name, 'r') as file:
+            file_instance = self.file_service.process(file)
+            self.assertEqual('Aaron', file_instance.file_rows[0]['name'])
+
     def test_process_given_invalid_file_missing_attribute(self):
         with open(self.file_name, 'r') as file:
             self.file_definition.field_definitions.append(
@@ -207,6 +448,36 @@ class XmlFileServiceTests(FileServiceTests):
             self.assertRaises(AttributeError, self.file_service.process, file)
 
 
+@unittest.skipUnless(has_lxml, 'lxml is not installed')
+class LxmlXmlFileServiceTests(XmlFileServiceTests):
+    def setUp(self):
+        super(LxmlXmlFileServiceTests, self).setUp()
+        self.file_definition.xml_engine = fc.LXML
+
+    def test_iter_file_records_parses_incrementally(self):
+        from lxml.etree import XMLSyntaxError
+        with open(self.file_name, 'a') as f:
+            f.write('<person><name>Broken')
+        with open(self.file_name, 'r') as file:
+            records = self.file_service.iter_file_records(file)
+            self.assertEqual('Aaron', next(records)['name'])
+            with self.assertRaises(XMLSyntaxError):
+                list(records)
+
+    def test_process_string_io(self):
+        with open(self.file_name, 'r') as file:
+            text = file.read()
+        file = io.StringIO(text)
+        file.name = self.file_name
+        file_instance = self.file_service.process(file)
+        self.assert_valid_file_output(file_instance.file_name, file_instance.file_rows)
+
+    def test_process_binary_file(self):
+        with open(self.file_name, 'rb') as file:
+            file_instance = self.file_service.process(file)
+            self.assertEqual(4, len(file_instance.file_rows))
+
+
 class XmlFileServiceNestedObjectTests(NestedObjectTests):
     def setUp(self):
         super(XmlFileServiceNestedObjectTests, self).create_file_definitions(fc.XML)
@@ -251,6 +522,13 @@ class XmlFileServiceNestedObjectTests(NestedObjectTests):
             self.assert_valid_file_output(file_instance.file_name, file_instance.file_rows)
 
 
+@unittest.skipUnless(has_lxml, 'lxml is not installed')
+class LxmlXmlFileServiceNestedObjectTests(XmlFileServiceNestedObjectTests):
+    def setUp(self):
+        super(LxmlXmlFileServiceNestedObjectTests, self).setUp()
+        self.file_definition.xml_engine = fc.LXML
+
+
 class FlatFileServiceTests(FileServiceTests):
     def setUp(self) -> None:
         self.create_file_definitions(fc.DELIMITED)
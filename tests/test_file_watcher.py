@@ -0,0 +1,125 @@
+import asyncio
+import importlib.util
+import os
+import shutil
+import unittest
+from unittest import TestCase, mock
+
+import file_ripper.fileconstants as fc
+from file_ripper.filedaemon import FileRipperDaemon
+from file_ripper.filedefinition import FileDefinition, FieldDefinition
+from file_ripper.filewatcher import DirectoryWatcher
+
+has_watchdog = importlib.util.find_spec('watchdog') is not None
+
+
+class DirectoryWatcherTests(TestCase):
+    def setUp(self) -> None:
+        self.input_directory = os.path.abspath('watched-files')
+        os.makedirs(self.input_directory)
+        self.file_definition = FileDefinition(fc.FIXED, [FieldDefinition('name', fc.FIXED, 0, 13)],
+                                              input_directory=self.input_directory,
+                                              completed_directory=os.path.join(self.input_directory, 'completed'),
+                                              file_mask='*.txt')
+        self.watcher = DirectoryWatcher(self.file_definition, settle_seconds=1, use_events=False)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.input_directory, ignore_errors=True)
+
+    def write_file(self, name, text='Aaron        39       09/04/1980\n', mode='w'):
+        file_name = os.path.join(self.input_directory, name)
+        with open(file_name, mode) as f:
+            f.write(text)
+        return file_name
+
+    def test_matches(self):
+        self.assertTrue(self.watcher.matches(os.path.join(self.input_directory, 'a.txt')))
+        self.assertFalse(self.watcher.matches(os.path.join(self.input_directory, 'a.csv')))
+        self.assertFalse(self.watcher.matches(os.path.join(self.input_directory, 'sub', 'a.txt')))
+
+    def test_quarantine_files_do_not_match(self):
+        self.file_definition.file_mask = '*'
+        self.assertFalse(self.watcher.matches(os.path.join(self.input_directory, 'a.txt.quarantine')))
+
+    def test_file_waits_until_size_settles(self):
+        file_name = self.write_file('a.txt')
+        self.watcher.scan()
+        self.assertEqual([], list(self.watcher.complete_files(10.0)))
+        self.assertEqual([], list(self.watcher.complete_files(10.5)))
+        self.assertEqual([file_name], list(self.watcher.complete_files(11.0)))
+
+    def test_growing_file_restarts_settle_time(self):
+        self.write_file('a.txt')
+        self.watcher.scan()
+        list(self.watcher.complete_files(10.0))
+        self.write_file('a.txt', 'Gene         61       01/15/1958\n', mode='a')
+        self.assertEqual([], list(self.watcher.complete_files(11.0)))
+        self.assertEqual(1, len(list(self.watcher.complete_files(12.0))))
+
+    def test_closed_file_is_complete(self):
+        file_name = self.write_file('a.txt')
+        self.watcher.close_file(file_name)
+        self.assertEqual([file_name], list(self.watcher.complete_files(10.0)))
+
+    def test_unchanged_file_is_not_yielded_twice(self):
+        file_name = self.write_file('a.txt')
+        self.watcher.close_file(file_name)
+        list(self.watcher.complete_files(10.0))
+        self.watcher.scan()
+        self.assertEqual([], list(self.watcher.complete_files(10.0)))
+        self.assertEqual([], list(self.watcher.complete_files(20.0)))
+
+    def test_ripped_file_is_not_yielded_again(self):
+        file_name = self.write_file('a.txt')
+        self.watcher.close_file(file_name)
+        list(self.watcher.complete_files(10.0))
+        self.watcher.rip_finished(file_name, True)
+        self.watcher.scan()
+        self.assertEqual([], list(self.watcher.complete_files(20.0)))
+
+    def test_failed_rip_is_retried(self):
+        file_name = self.write_file('a.txt')
+        self.watcher.close_file(file_name)
+        list(self.watcher.complete_files(10.0))
+        self.watcher.rip_finished(file_name, False)
+        self.watcher.scan()
+        list(self.watcher.complete_files(20.0))
+        self.assertEqual([file_name], list(self.watcher.complete_files(21.0)))
+
+    def test_deleted_file_is_dropped(self):
+        file_name = self.write_file('a.txt')
+        self.watcher.scan()
+        os.remove(file_name)
+        self.assertEqual([], list(self.watcher.complete_files(20.0)))
+
+    def run_daemon_watch(self, use_events):
+        daemon = FileRipperDaemon([self.file_definition], watch=True, settle_seconds=0.1, poll_seconds=0.05)
+        existing = self.write_file('existing.txt')
+
+        async def add_file_and_stop():
+            await asyncio.sleep(0.3)
+            self.write_file('new.txt')
+            for _ in range(100):
+                await asyncio.sleep(0.05)
+                if len(os.listdir(self.file_definition.completed_directory)) == 2:
+                    break
+            daemon.stop()
+
+        async def run():
+            await asyncio.gather(daemon.run(), add_file_and_stop())
+
+        if use_events:
+            asyncio.run(asyncio.wait_for(run(), timeout=10))
+        else:
+            with mock.patch('file_ripper.filewatcher.Observer', None):
+                asyncio.run(asyncio.wait_for(run(), timeout=10))
+
+        self.assertFalse(os.path.exists(existing))
+        self.assertEqual(['existing.txt', 'new.txt'], sorted(os.listdir(self.file_definition.completed_directory)))
+
+    def test_daemon_watch_polling(self):
+        self.run_daemon_watch(use_events=False)
+
+    @unittest.skipUnless(has_watchdog, 'watchdog is not installed')
+    def test_daemon_watch_events(self):
+        self.run_daemon_watch(use_events=True)